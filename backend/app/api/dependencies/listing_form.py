@@ -0,0 +1,176 @@
+# backend/app/api/dependencies/listing_form.py
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterator, Dict, List, Optional
+import asyncio
+import logging
+
+from fastapi import HTTPException, Request, UploadFile, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import Field, ValidationError
+from starlette.datastructures import Headers
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.parser import ParseFailedException
+from streaming_form_data.targets import BaseTarget, ListTarget
+
+from app.schemas.listings import CreateListingForm
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_LISTING_FIELDS = frozenset({"userId", "title", "description", "category", "size", "condition", "zipCode"})
+OPTIONAL_LISTING_FIELDS = frozenset({"location", "tags"})
+
+# Request body schema for the OpenAPI docs, since the form is parsed outside FastAPI's Form/File params
+LISTING_FORM_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": sorted(REQUIRED_LISTING_FIELDS),
+                    "properties": {
+                        **{name: {"type": "string"} for name in sorted(REQUIRED_LISTING_FIELDS)},
+                        "location": {"type": "string", "description": "JSON-encoded location"},
+                        "tags": {"type": "string", "description": "JSON-encoded list of tags"},
+                        "images": {"type": "array", "items": {"type": "string", "format": "binary"}}
+                    }
+                }
+            }
+        }
+    }
+}
+
+
+class FileTooLargeError(Exception):
+    """Raised while parsing when an uploaded file exceeds the size limit."""
+
+    def __init__(self, filename: Optional[str], max_bytes: int):
+        super().__init__(f"File {filename} exceeds maximum allowed size of {max_bytes} bytes")
+        self.filename = filename
+        self.max_bytes = max_bytes
+
+
+class SpooledFilesTarget(BaseTarget):
+    """Write every file sent under one field name into its own spooled temporary file."""
+
+    def __init__(self, max_file_bytes: int, spool_bytes: int):
+        super().__init__()
+        self.files: List[UploadFile] = []
+        self._max_file_bytes = max_file_bytes
+        self._spool_bytes = spool_bytes
+        self._spool = None
+        self._size = 0
+
+    def on_start(self):
+        self._spool = SpooledTemporaryFile(max_size=self._spool_bytes)
+        self._size = 0
+
+    def on_data_received(self, chunk: bytes):
+        self._size += len(chunk)
+        if self._size > self._max_file_bytes:
+            raise FileTooLargeError(self.multipart_filename, self._max_file_bytes)
+        self._spool.write(chunk)
+
+    def may_write_to_disk(self, nbytes: int) -> bool:
+        """Whether parsing the next `nbytes` of the body could write past the in-memory spool."""
+        spooled = self._size if self._spool is not None else 0
+        return spooled + nbytes > self._spool_bytes
+
+    def on_finish(self):
+        # The part's filename and content type are only reliable once the part is complete
+        self._spool.seek(0)
+        self.files.append(UploadFile(
+            file=self._spool,
+            size=self._size,
+            filename=self.multipart_filename,
+            headers=Headers({"content-type": self.multipart_content_type or "application/octet-stream"})
+        ))
+        self._spool = None
+
+    def close(self):
+        """Release every spooled file, including a partially written one."""
+        if self._spool is not None:
+            self._spool.close()
+        for upload in self.files:
+            upload.file.close()
+
+
+class ListingForm(CreateListingForm):
+    """Validated fields and spooled image files of a create-listing multipart request."""
+    images: List[UploadFile] = Field(default_factory=list)
+
+
+async def parse_listing_form(request: Request) -> AsyncIterator[ListingForm]:
+    """
+    Parse a create-listing multipart body as it streams in.
+
+    Form values are collected in memory and each image is written to a
+    spooled temporary file, with its size enforced while parsing so an
+    oversized upload is rejected without reading the rest of it. Chunks that
+    could write a file past its in-memory spool are parsed in a worker
+    thread, so disk writes never block the event loop. The files are closed
+    once the request is done.
+
+    Args:
+        request: The incoming request
+
+    Yields:
+        The parsed listing form
+
+    Raises:
+        HTTPException: If the body is malformed, a file is too large, or a
+            required field is missing
+        RequestValidationError: If location or tags is not valid JSON of the
+            expected shape
+    """
+    try:
+        parser = StreamingFormDataParser(headers=request.headers)
+    except ParseFailedException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid multipart request: {e}")
+
+    values: Dict[str, ListTarget] = {
+        name: ListTarget(str) for name in REQUIRED_LISTING_FIELDS | OPTIONAL_LISTING_FIELDS
+    }
+    for name, target in values.items():
+        parser.register(name, target)
+
+    images = SpooledFilesTarget(
+        max_file_bytes=settings.max_image_size_bytes,
+        spool_bytes=settings.s3_upload_spool_mb * 1024 * 1024
+    )
+    parser.register("images", images)
+
+    try:
+        async for chunk in request.stream():
+            if images.may_write_to_disk(len(chunk)):
+                await asyncio.to_thread(parser.data_received, chunk)
+            else:
+                parser.data_received(chunk)
+    except FileTooLargeError as e:
+        images.close()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ParseFailedException as e:
+        images.close()
+        logger.warning("Failed to parse listing form: %s", e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Malformed multipart body")
+
+    fields = {name: target.value[0] for name, target in values.items() if target.value}
+    missing = REQUIRED_LISTING_FIELDS.difference(fields)
+    if missing:
+        images.close()
+        raise HTTPException(
+            status_code=422,
+            detail=f"Missing required fields: {', '.join(sorted(missing))}"
+        )
+
+    try:
+        form = ListingForm(**fields, images=images.files)
+    except ValidationError as e:
+        images.close()
+        raise RequestValidationError(e.errors(include_url=False))
+
+    try:
+        yield form
+    finally:
+        images.close()
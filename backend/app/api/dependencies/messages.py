@@ -1,68 +1,152 @@
 # backend/app/api/dependencies/messages.py
-from fastapi import HTTPException, Depends, status
+from fastapi import HTTPException, Depends, Query, status
 from app.db.repos.swap_repo import SwapRepository
+from app.infrastructure.cache import cache
+from dataclasses import dataclass
 from typing import Optional, Dict
+import asyncio
 import logging
+import secrets
 
 logger = logging.getLogger(__name__)
 
-async def verify_user_in_swap(
-    swap_id: str,
-    user_id: str
-) -> Dict:
+# Swap participants never change after creation, so they can be cached for a long time
+SWAP_PARTICIPANTS_TTL = 86400  # 24 hours
+
+# Message list versions of idle swaps are dropped after a while and regenerated on the next read
+MESSAGES_VERSION_TTL = 7 * 86400  # 7 days
+
+def swap_participants_key(swap_id: str) -> str:
+    """Cache key holding the requester/owner pair for a swap."""
+    return f"swap:{swap_id}:participants"
+
+def messages_version_key(swap_id: str) -> str:
+    """Cache key holding the current version token of a swap's message list."""
+    return f"swap:{swap_id}:messages:version"
+
+async def get_messages_version(swap_id: str) -> Optional[str]:
     """
-    Verify that the authenticated user is a participant in the swap (either requester or owner).
+    Get the current version of a swap's message list, for use as an ETag.
+    
+    Versions are random tokens: a swap without one gets a new token, and
+    any change to its messages drops the token, so a version never repeats.
     
     Args:
-        swap_id: The ID of the swap to check
-        user_id: The ID of the authenticated user
+        swap_id: The ID of the swap
         
     Returns:
-        The swap object if the user is a participant
+        The version, or None if Redis is unavailable
+    """
+    client = cache.client
+    if client is None:
+        return None
+    key = messages_version_key(swap_id)
+    try:
+        version = await client.get(key)
+        if version is None:
+            # NX keeps concurrent first readers on the same token
+            await client.set(key, secrets.token_hex(8), ex=MESSAGES_VERSION_TTL, nx=True)
+            version = await client.get(key)
+        return version
+    except Exception as e:
+        logger.warning(f"Failed to read messages version for swap {swap_id}: {e}")
+        return None
+
+async def invalidate_messages_version(*swap_ids: str) -> None:
+    """
+    Mark swaps' messages as changed so clients' ETags stop matching.
+    
+    Must be called after the change is written, so a request that read the
+    old version can only have cached data the new version supersedes.
+    
+    Args:
+        swap_ids: IDs of the swaps whose messages changed
+    """
+    await cache.delete(*(messages_version_key(swap_id) for swap_id in swap_ids))
+
+async def get_swap_participants(swap_id: str) -> Optional[Dict]:
+    """
+    Get the requester and owner of a swap, served from Redis when possible.
+    
+    Args:
+        swap_id: The ID of the swap
         
-    Raises:
-        HTTPException: If user is not a participant in the swap
+    Returns:
+        Dict with requesterId and ownerId, or None if the swap does not exist
     """
-    # Get the swap details
-    swap = SwapRepository.get_swap(swap_id)
+    key = swap_participants_key(swap_id)
+    participants = await cache.get(key)
+    if participants:
+        return participants
     
+    swap = await asyncio.to_thread(SwapRepository.get_swap, swap_id)
     if not swap:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Swap not found"
-        )
+        return None
     
-    # Check if user is either the requester or owner in the swap
-    if swap.get("requesterId") != user_id and swap.get("ownerId") != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="User is not a participant in this swap"
-        )
+    participants = {
+        "requesterId": swap.get("requesterId"),
+        "ownerId": swap.get("ownerId")
+    }
+    await cache.set(key, participants, expire=SWAP_PARTICIPANTS_TTL)
+    return participants
+
+@dataclass(frozen=True)
+class SwapContext:
+    """The authenticated user's place in a swap, resolved once per request."""
+    swap_id: str
+    user_id: str
+    requester_id: str
+    owner_id: str
+    
+    @property
+    def participants(self) -> frozenset:
+        """IDs of both users in the swap."""
+        return frozenset((self.requester_id, self.owner_id))
     
-    return swap
+    @property
+    def recipient_id(self) -> str:
+        """The other participant, who receives messages the user sends."""
+        return self.owner_id if self.user_id == self.requester_id else self.requester_id
 
-async def get_message_recipient(
+async def swap_context(
     swap_id: str,
-    user_id: str
-) -> str:
+    user_id: str = Query(..., description="ID of the authenticated user")
+) -> SwapContext:
     """
-    Determine the recipient ID for a new message based on the swap and current user.
+    Resolve the swap's participants and check the user is one of them.
+    
+    Used as a dependency so a handler gets everything it needs about the swap
+    from a single lookup. swap_id is read from the path where the route has
+    it and from the query string otherwise.
     
     Args:
         swap_id: The ID of the swap
-        user_id: The ID of the authenticated user (sender)
+        user_id: The ID of the authenticated user
         
     Returns:
-        The user ID of the recipient
+        The swap context for the user
         
     Raises:
-        HTTPException: If user is not a participant in the swap
+        HTTPException: If the swap does not exist or the user is not a participant
     """
-    # Get the swap and verify user is a participant
-    swap = await verify_user_in_swap(swap_id, user_id)
+    # Only the participants are needed, so avoid loading the full swap item
+    participants = await get_swap_participants(swap_id)
+    if not participants:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Swap not found"
+        )
+    
+    ctx = SwapContext(
+        swap_id=swap_id,
+        user_id=user_id,
+        requester_id=participants.get("requesterId"),
+        owner_id=participants.get("ownerId")
+    )
+    if user_id not in ctx.participants:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User is not a participant in this swap"
+        )
     
-    # Determine recipient based on sender
-    if user_id == swap.get("requesterId"):
-        return swap.get("ownerId")
-    else:
-        return swap.get("requesterId")
\ No newline at end of file
+    return ctx
@@ -3,7 +3,7 @@ from fastapi import APIRouter, HTTPException, Depends, status
 from pydantic import BaseModel
 from typing import Optional
 from services.auth.cognito_service import cognito_service
-from services.auth.auth_dependencies import get_cognito_user_info
+from services.auth.auth_dependencies import get_cognito_user_info, resolve_user_info
 
 router = APIRouter()
 
@@ -95,8 +95,8 @@ async def validate_token(request: TokenValidationRequest):
         User information from Cognito
     """
     try:
-        # Get user info from Cognito token
-        user_info = cognito_service.get_user_info(request.access_token)
+        # Get user info from Cognito token (served from the token cache when possible)
+        user_info = await resolve_user_info(request.access_token)
         
         if not user_info:
             raise HTTPException(
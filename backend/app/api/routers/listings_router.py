@@ -1,32 +1,180 @@
 # backend/app/api/routers/listings_router.py
-from fastapi import APIRouter, HTTPException, Query, Depends, UploadFile, File, Form
-from typing import List, Optional
-from app.db.repos.listing_repo import ListingRepository
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, UploadFile
+from typing import Any, List, Optional
+from app.db.repos.listing_repo import ListingRepository, GEOHASH_INDEX_PRECISION
 from app.db.repos.user_repo import UserRepository
+from app.db.dynamodb_utils import DynamoDBUtils
+from app.api.dependencies.listing_form import ListingForm, parse_listing_form, LISTING_FORM_OPENAPI
+from app.db.repos.upload_session_repo import UploadSessionRepository
+from app.schemas.listings import UpdateListingRequest, PresignListingImagesRequest, CommitListingRequest
+from app.infrastructure.cache import cache, cached
+from app.infrastructure.entity_cache import listing_cache, public_profile_cache
+from services.geocoding import geohash
 from services.geocoding.geocoding_service import GeocodingService
+from services.s3.image_service import ImageService
+from services.s3.s3_client import s3_client, build_image_key
+from core.config import settings
+import asyncio
 import logging
-import uuid
-import json
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-@router.post("/")
-async def create_listing(
-    userId: str = Form(...),
-    title: str = Form(...),
-    description: str = Form(...),
-    category: str = Form(...),
-    size: str = Form(...),
-    condition: str = Form(...),
-    zipCode: str = Form(...),
-    location: Optional[str] = Form(None),
-    tags: Optional[str] = Form(None),
-    images: List[UploadFile] = File(default=[])
-):
+# All cached listing responses live under this prefix so writes can drop them at once
+LISTINGS_CACHE_PATTERN = "listings:*"
+
+# Cache-Control for GET responses, so browsers and CDNs can reuse them and revalidate with ETags
+LIST_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+DETAIL_CACHE_CONTROL = "private, max-age=60"
+SEARCH_CACHE_CONTROL = "public, max-age=30"
+
+# Above this many geohash cells (a radius of roughly 50+ miles) location search falls back to a scan
+MAX_GEOHASH_CELLS = 64
+
+async def _attach_user_info(listings: List[dict]) -> None:
+    """Attach each listing owner's public profile, fetching cache misses in batched lookups."""
+    if not listings:
+        return
+    try:
+        profiles = await public_profile_cache.get_many(
+            (listing.get("userId") for listing in listings), UserRepository.get_public_profiles_batch
+        )
+    except Exception as e:
+        logger.warning("Could not fetch user info for listings: %s", e)
+        return
+    for listing in listings:
+        listing["user_info"] = profiles.get(listing.get("userId"))
+
+def _resolve_location(location_input: Optional[Any], zip_code: Optional[str]) -> dict:
+    """
+    Build a listing's stored location from the client's location input.
+    
+    Args:
+        location_input: Parsed location, either {"address": ...} or {"lat": ..., "lng": ...}
+        zip_code: Listing zip code, geocoded when no usable location is given
+        
+    Returns:
+        Location dict with coordinates converted for DynamoDB, or {} if nothing could be resolved
+    """
+    location_data = {}
+    
+    # If location contains an address, geocode it
+    if isinstance(location_input, dict) and 'address' in location_input:
+        geocoded = GeocodingService.geocode_address(location_input['address'])
+        if geocoded:
+            location_data = {
+                'address': location_input['address'],
+                'lat': geocoded['lat'],
+                'lng': geocoded['lng'],
+                'formatted_address': geocoded['formatted_address'],
+                'city': geocoded.get('city', ''),
+                'state': geocoded.get('state', ''),
+                'country': geocoded.get('country', '')
+            }
+        else:
+            logger.warning("Failed to geocode address: %s", location_input['address'])
+            location_data = location_input
+    
+    # If location contains lat/lng coordinates
+    elif isinstance(location_input, dict) and 'lat' in location_input and 'lng' in location_input:
+        location_data = location_input
+        # Optionally reverse geocode to get address
+        if 'address' not in location_data:
+            reverse_geocoded = GeocodingService.reverse_geocode(
+                location_input['lat'], location_input['lng']
+            )
+            if reverse_geocoded:
+                location_data.update(reverse_geocoded)
+    
+    # Otherwise fall back to geocoding the zip code
+    elif zip_code:
+        geocoded = GeocodingService.get_zip_code_coordinates(zip_code)
+        if geocoded:
+            location_data = {
+                'lat': geocoded['lat'],
+                'lng': geocoded['lng'],
+                'formatted_address': geocoded['formatted_address'],
+                'city': geocoded.get('city', ''),
+                'state': geocoded.get('state', ''),
+                'country': geocoded.get('country', '')
+            }
+    
+    # Convert coordinates to Decimal for DynamoDB storage
+    if location_data:
+        location_data = GeocodingService.convert_coordinates_for_dynamodb(location_data)
+    
+    return location_data
+
+async def _upload_image(image_file: UploadFile, semaphore: asyncio.Semaphore) -> dict:
+    """
+    Validate one uploaded image and store it in S3.
+    
+    Args:
+        image_file: The uploaded image
+        semaphore: Bounds how many uploads of a request run at once
+        
+    Returns:
+        Dict with the image's S3 key, public URL and original filename
+        
+    Raises:
+        HTTPException: If the file is invalid or the upload fails
+    """
+    # Validate file type
+    if (image_file.content_type or "").lower() not in settings.allowed_image_types:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Invalid file type: {image_file.content_type}. Allowed types: {settings.allowed_image_types_display}"
+        )
+    
+    # The form parser already spooled the file and enforced the size limit while streaming it
+    max_size_bytes = settings.max_image_size_bytes
+    if image_file.size is not None and image_file.size > max_size_bytes:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"File size {image_file.size} bytes exceeds maximum allowed size of {max_size_bytes} bytes"
+        )
+    
+    s3_key = build_image_key(image_file.filename or "")
+    
+    # Upload to S3 off the event loop
+    async with semaphore:
+        success = await asyncio.to_thread(
+            s3_client.upload_file,
+            file_obj=image_file.file,
+            bucket=settings.s3_images_bucket,
+            key=s3_key,
+            content_type=image_file.content_type
+        )
+    
+    if not success:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"Failed to upload image: {image_file.filename}"
+        )
+    
+    logger.info("Successfully uploaded image: %s", s3_key)
+    return {
+        "key": s3_key,
+        "url": ImageService.get_image_url(s3_key, signed=False),
+        "original_filename": image_file.filename
+    }
+
+def _require_multipart_uploads():
+    """Reject the legacy multipart create route once clients have moved to presigned uploads."""
+    if not settings.multipart_listing_uploads_enabled:
+        raise HTTPException(
+            status_code=410,
+            detail="Multipart listing uploads are disabled; use /listings/presign and /listings/commit"
+        )
+
+@router.post("/", openapi_extra=LISTING_FORM_OPENAPI, dependencies=[Depends(_require_multipart_uploads)])
+async def create_listing(form: ListingForm = Depends(parse_listing_form)):
     """
     Create a new listing with direct image upload.
     
+    The multipart body is parsed as it streams in (see parse_listing_form), so
+    images are spooled to temporary files with their size enforced while parsing.
+    
     This endpoint accepts multipart/form-data with:
     - Form fields: userId, title, description, category, size, condition, zipCode
     - Optional fields: location (JSON string), tags (JSON string)
@@ -54,194 +202,264 @@ async def create_listing(
         body: formData
     });
     """
+    userId, zipCode, location, tags, images = form.userId, form.zipCode, form.location, form.tags, form.images
+    
     try:
-        # Verify user exists
-        user = UserRepository.get_user(userId)
-        if not user:
+        # Verify the user and geocode the location concurrently, both off the event loop
+        # (location and tags were decoded and validated while parsing the form)
+        user_exists, location_data = await asyncio.gather(
+            asyncio.to_thread(UserRepository.user_exists, userId),
+            asyncio.to_thread(
+                _resolve_location, location.model_dump(exclude_none=True) if location else None, zipCode
+            )
+        )
+        if not user_exists:
             raise HTTPException(status_code=404, detail="User not found")
         
-        # Parse optional JSON fields and geocode location
-        location_data = {}
-        if location:
-            try:
-                location_input = json.loads(location)
-                
-                # If location contains an address, geocode it
-                if isinstance(location_input, dict) and 'address' in location_input:
-                    geocoded = GeocodingService.geocode_address(location_input['address'])
-                    if geocoded:
-                        location_data = {
-                            'address': location_input['address'],
-                            'lat': geocoded['lat'],
-                            'lng': geocoded['lng'],
-                            'formatted_address': geocoded['formatted_address'],
-                            'city': geocoded.get('city', ''),
-                            'state': geocoded.get('state', ''),
-                            'country': geocoded.get('country', '')
-                        }
-                    else:
-                        logger.warning(f"Failed to geocode address: {location_input['address']}")
-                        location_data = location_input
-                
-                # If location contains lat/lng coordinates
-                elif isinstance(location_input, dict) and 'lat' in location_input and 'lng' in location_input:
-                    location_data = location_input
-                    # Optionally reverse geocode to get address
-                    if 'address' not in location_data:
-                        reverse_geocoded = GeocodingService.reverse_geocode(
-                            location_input['lat'], location_input['lng']
-                        )
-                        if reverse_geocoded:
-                            location_data.update(reverse_geocoded)
-                
-                # If it's just a zip code, try to geocode it
-                elif zipCode:
-                    geocoded = GeocodingService.get_zip_code_coordinates(zipCode)
-                    if geocoded:
-                        location_data = {
-                            'lat': geocoded['lat'],
-                            'lng': geocoded['lng'],
-                            'formatted_address': geocoded['formatted_address'],
-                            'city': geocoded.get('city', ''),
-                            'state': geocoded.get('state', ''),
-                            'country': geocoded.get('country', '')
-                        }
-                
-            except json.JSONDecodeError:
-                raise HTTPException(status_code=400, detail="Invalid location JSON format")
-        
-        # If no location provided but we have a zip code, try to geocode the zip code
-        elif zipCode and not location_data:
-            geocoded = GeocodingService.get_zip_code_coordinates(zipCode)
-            if geocoded:
-                location_data = {
-                    'lat': geocoded['lat'],
-                    'lng': geocoded['lng'],
-                    'formatted_address': geocoded['formatted_address'],
-                    'city': geocoded.get('city', ''),
-                    'state': geocoded.get('state', ''),
-                    'country': geocoded.get('country', '')
-                }
-        
-        # Convert coordinates to Decimal for DynamoDB storage
-        if location_data:
-            location_data = GeocodingService.convert_coordinates_for_dynamodb(location_data)
-        
-        tags_data = []
-        if tags:
-            try:
-                tags_data = json.loads(tags)
-            except json.JSONDecodeError:
-                raise HTTPException(status_code=400, detail="Invalid tags JSON format")
-        
-        # Upload images to S3
+        # Upload images to S3 concurrently
         uploaded_images = []
         if images:
-            from services.s3.image_service import ImageService
-            from services.s3.s3_client import s3_client
-            from core.config import settings
+            semaphore = asyncio.Semaphore(settings.s3_upload_concurrency)
+            results = await asyncio.gather(
+                *(_upload_image(image_file, semaphore) for image_file in images),
+                return_exceptions=True
+            )
+            uploaded_images = [result for result in results if not isinstance(result, BaseException)]
+            failures = [
+                (image_file, result) for image_file, result in zip(images, results)
+                if isinstance(result, BaseException)
+            ]
             
-            for image_file in images:
-                try:
-                    # Validate file type
-                    if image_file.content_type not in settings.allowed_image_types:
-                        raise HTTPException(
-                            status_code=400, 
-                            detail=f"Invalid file type: {image_file.content_type}. Allowed types: {', '.join(settings.allowed_image_types)}"
-                        )
-                    
-                    # Read file content
-                    file_content = await image_file.read()
-                    
-                    # Validate file size
-                    file_size = len(file_content)
-                    max_size_bytes = settings.max_image_size_mb * 1024 * 1024
-                    if file_size > max_size_bytes:
-                        raise HTTPException(
-                            status_code=400, 
-                            detail=f"File size {file_size} bytes exceeds maximum allowed size of {max_size_bytes} bytes"
-                        )
-                    
-                    # Generate unique filename
-                    file_extension = image_file.filename.split('.')[-1].lower()
-                    unique_filename = f"{uuid.uuid4()}.{file_extension}"
-                    s3_key = f"images/{unique_filename}"
-                    
-                    # Upload to S3
-                    from io import BytesIO
-                    file_obj = BytesIO(file_content)
-                    
-                    success = s3_client.upload_file(
-                        file_obj=file_obj,
-                        bucket=settings.s3_images_bucket,
-                        key=s3_key,
-                        content_type=image_file.content_type
-                    )
-                    
-                    if not success:
-                        raise HTTPException(
-                            status_code=500, 
-                            detail=f"Failed to upload image: {image_file.filename}"
-                        )
-                    
-                    # Get public URL
-                    image_url = ImageService.get_image_url(s3_key)
-                    
-                    uploaded_images.append({
-                        "key": s3_key,
-                        "url": image_url,
-                        "original_filename": image_file.filename
-                    })
-                    
-                    logger.info(f"Successfully uploaded image: {s3_key}")
-                    
-                except Exception as e:
-                    logger.error(f"Error uploading image {image_file.filename}: {e}")
-                    # Clean up any successfully uploaded images if one fails
-                    for uploaded_image in uploaded_images:
-                        try:
-                            ImageService.delete_image(uploaded_image["key"])
-                        except:
-                            pass
-                    raise HTTPException(
-                        status_code=500, 
-                        detail=f"Failed to upload image {image_file.filename}: {str(e)}"
-                    )
+            if failures:
+                image_file, error = failures[0]
+                logger.error("Error uploading image %s: %s", image_file.filename, error)
+                # Clean up any successfully uploaded images if one fails
+                await asyncio.to_thread(ImageService.delete_images, [image["key"] for image in uploaded_images])
+                if isinstance(error, HTTPException):
+                    raise error
+                raise HTTPException(
+                    status_code=500, 
+                    detail=f"Failed to upload image {image_file.filename}: {str(error)}"
+                )
         
         # Prepare listing data
         listing_data = {
-            "title": title,
-            "description": description,
-            "category": category,
-            "size": size,
-            "condition": condition,
+            "title": form.title,
+            "description": form.description,
+            "category": form.category,
+            "size": form.size,
+            "condition": form.condition,
             "zipCode": zipCode,
             "location": location_data,
-            "tags": tags_data,
+            "tags": tags,
             "images": uploaded_images
         }
         
         # Create listing
-        new_listing = ListingRepository.create_listing(listing_data, userId)
+        new_listing = await asyncio.to_thread(ListingRepository.create_listing, listing_data, userId)
+        await cache.delete_pattern(LISTINGS_CACHE_PATTERN)
         
         return {
             "message": "Listing created successfully",
-            "listing": new_listing,
+            "listing": ImageService.sign_listing_images(new_listing),
             "images_uploaded": len(uploaded_images)
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error creating listing: {e}")
+        logger.error("Error creating listing: %s", e)
+        raise HTTPException(status_code=500, detail=f"Error creating listing: {str(e)}")
+
+@router.post("/presign")
+async def presign_listing_images(request: PresignListingImagesRequest):
+    """
+    Start a direct-to-S3 upload for a new listing's images.
+    
+    Returns a presigned POST per file plus an upload session ID. The client
+    uploads each image straight to S3, then calls /listings/commit with the
+    session ID, so image bytes never pass through the API server.
+    
+    Expected payload:
+    {
+        "userId": "user123",
+        "files": [{"filename": "jeans.jpg", "content_type": "image/jpeg", "file_size": 524288}]
+    }
+    """
+    try:
+        if not await asyncio.to_thread(UserRepository.user_exists, request.userId):
+            raise HTTPException(status_code=404, detail="User not found")
+        
+        try:
+            uploads = [
+                ImageService.get_upload_url(
+                    filename=file.filename,
+                    content_type=file.content_type,
+                    file_size=file.file_size
+                )
+                for file in request.files
+            ]
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        session = await asyncio.to_thread(
+            UploadSessionRepository.create_session,
+            request.userId,
+            [upload["key"] for upload in uploads],
+            settings.presigned_url_expiration
+        )
+        
+        return {
+            "session_id": session["sessionId"],
+            "uploads": uploads,
+            "expires_in": settings.presigned_url_expiration
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error presigning listing images: %s", e)
+        raise HTTPException(status_code=500, detail=f"Error preparing image upload: {str(e)}")
+
+@router.post("/commit")
+async def commit_listing(request: CommitListingRequest):
+    """
+    Create a listing from images uploaded through an upload session.
+    
+    Every image is checked in S3 before the listing is written, and any image
+    uploaded for the session but not attached to the listing is deleted.
+    
+    Expected payload:
+    {
+        "session_id": "...",  // From /listings/presign
+        "userId": "user123",
+        "title": "Blue Jeans",
+        "description": "Gently used jeans",
+        "category": "pants",
+        "size": "M",
+        "condition": "good",
+        "zipCode": "12345",
+        "location": {"address": "123 Main St, Seattle, WA"},  // Optional
+        "tags": ["casual", "denim"],  // Optional
+        "image_keys": ["images/ab/ab12....jpg"]  // Optional, defaults to all session keys
+    }
+    """
+    try:
+        session = await asyncio.to_thread(UploadSessionRepository.get_session, request.session_id)
+        if not session or session.get("userId") != request.userId:
+            raise HTTPException(status_code=404, detail="Upload session not found")
+        if session.get("status") != "pending":
+            raise HTTPException(status_code=409, detail=f"Upload session is already {session.get('status')}")
+        
+        session_keys = list(session.get("imageKeys", []))
+        image_keys = request.image_keys if request.image_keys is not None else session_keys
+        unknown_keys = set(image_keys).difference(session_keys)
+        if unknown_keys:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Images do not belong to this upload session: {', '.join(sorted(unknown_keys))}"
+            )
+        
+        # Make sure every image actually reached S3 before creating the listing, geocoding meanwhile
+        exists, location_data = await asyncio.gather(
+            asyncio.gather(*(asyncio.to_thread(ImageService.image_exists, key) for key in image_keys)),
+            asyncio.to_thread(
+                _resolve_location,
+                request.location.model_dump(exclude_none=True) if request.location else None,
+                request.zipCode
+            )
+        )
+        missing_keys = [key for key, found in zip(image_keys, exists) if not found]
+        if missing_keys:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Images have not been uploaded yet: {', '.join(missing_keys)}"
+            )
+        
+        # Claim the session so the same uploads cannot be committed twice
+        claimed = await asyncio.to_thread(
+            UploadSessionRepository.transition, request.session_id, request.userId, "pending", "committed"
+        )
+        if not claimed:
+            raise HTTPException(status_code=409, detail="Upload session was already committed or aborted")
+        
+        listing_data = {
+            "title": request.title,
+            "description": request.description,
+            "category": request.category,
+            "size": request.size,
+            "condition": request.condition,
+            "zipCode": request.zipCode,
+            "location": location_data,
+            "tags": request.tags,
+            "images": [{"key": key, "url": ImageService.get_image_url(key, signed=False)} for key in image_keys]
+        }
+        
+        new_listing = await asyncio.to_thread(ListingRepository.create_listing, listing_data, request.userId)
+        await cache.delete_pattern(LISTINGS_CACHE_PATTERN)
+        
+        # Drop images that were uploaded for the session but not attached
+        orphan_keys = set(session_keys).difference(image_keys)
+        if orphan_keys:
+            await asyncio.to_thread(ImageService.delete_images, list(orphan_keys))
+        
+        return {
+            "message": "Listing created successfully",
+            "listing": ImageService.sign_listing_images(new_listing),
+            "images_uploaded": len(image_keys)
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error committing listing for session %s: %s", request.session_id, e)
         raise HTTPException(status_code=500, detail=f"Error creating listing: {str(e)}")
 
+@router.delete("/presign/{session_id}")
+async def abort_listing_upload(session_id: str, user_data: dict):
+    """
+    Abandon an upload session and delete any images already uploaded for it.
+    
+    Expected payload:
+    {
+        "userId": "user123"  // Required for authorization
+    }
+    """
+    try:
+        if "userId" not in user_data:
+            raise HTTPException(status_code=400, detail="userId is required for authorization")
+        
+        session = await asyncio.to_thread(UploadSessionRepository.get_session, session_id)
+        aborted = session is not None and await asyncio.to_thread(
+            UploadSessionRepository.transition, session_id, user_data["userId"], "pending", "aborted"
+        )
+        if not aborted:
+            raise HTTPException(status_code=404, detail="Pending upload session not found")
+        
+        if session.get("imageKeys"):
+            await asyncio.to_thread(ImageService.delete_images, session["imageKeys"])
+        
+        return {
+            "message": "Upload session aborted",
+            "session_id": session_id
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error aborting upload session %s: %s", session_id, e)
+        raise HTTPException(status_code=500, detail=f"Error aborting upload session: {str(e)}")
+
 @router.get("/")
+@cached(prefix="listings:list", expire=settings.listings_cache_ttl, cache_control=LIST_CACHE_CONTROL)
 async def list_listings(
+    request: Request,
     zip_code: Optional[str] = Query(None, description="Filter by zip code"),
     category: Optional[str] = Query(None, description="Filter by category"),
     size: Optional[str] = Query(None, description="Filter by size"),
-    user_id: Optional[str] = Query(None, description="Filter by user ID")
+    user_id: Optional[str] = Query(None, description="Filter by user ID"),
+    limit: int = Query(50, ge=1, le=100, description="Page size when browsing without filters"),
+    cursor: Optional[str] = Query(None, description="Pagination cursor from a previous response")
 ):
     """
     Get listings with optional filters.
@@ -251,42 +469,49 @@ async def list_listings(
     - category: Filter by category (e.g., 'shirts', 'pants', 'dresses')
     - size: Filter by size (e.g., 'S', 'M', 'L', 'XL')
     - user_id: Get listings by specific user
+    - limit/cursor: Page through unfiltered results; pass back `next_cursor` to get the next page
     
     Examples:
-    - GET /listings/ - Get all listings (uses scan, may be slow)
+    - GET /listings/ - Get the most recent active listings (paginated)
+    - GET /listings/?cursor=... - Get the next page of listings
     - GET /listings/?zip_code=12345 - Get listings in zip code 12345
     - GET /listings/?zip_code=12345&category=shirts - Get shirts in zip code 12345
     - GET /listings/?user_id=user123 - Get all listings by user123
     """
     try:
         listings = []
+        next_cursor = None
         
         if user_id:
             # Get listings by specific user
-            listings = ListingRepository.get_listings_by_user(user_id)
+            listings = await asyncio.to_thread(ListingRepository.get_listings_by_user, user_id, active_only=True)
             
         elif zip_code:
             # Get listings by zip code with optional filters
-            listings = ListingRepository.get_listings_by_zip(zip_code, size, category)
+            listings = await asyncio.to_thread(
+                ListingRepository.get_listings_by_zip, zip_code, size, category, active_only=True
+            )
             
         else:
-            # If no filters provided, we need to scan the table
-            # Note: This can be expensive for large tables
-            logger.warning("Performing full table scan for listings - consider adding filters")
+            # No filters: page through active listings by recency instead of scanning the table
+            try:
+                start_key = DynamoDBUtils.decode_cursor(cursor, ListingRepository.ACTIVE_LISTINGS_KEY)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
             
-            # Use DynamoDB scan (implement this method if needed)
-            from app.db.dynamodb_utils import DynamoDBUtils
-            listings = DynamoDBUtils.scan_items(
-                table_name="Listings",
-                filter_expression="attribute_exists(listingId)"
+            listings, last_key = await asyncio.to_thread(
+                ListingRepository.get_active_listings, limit, start_key
             )
+            next_cursor = DynamoDBUtils.encode_cursor(last_key)
         
-        # Filter active listings only
-        active_listings = [listing for listing in listings if listing.get("status") == "active"]
+        # Every branch above already returns active listings only
+        await _attach_user_info(listings)
+        listings = [ImageService.sign_listing_images(listing) for listing in listings]
         
         return {
-            "listings": active_listings,
-            "count": len(active_listings),
+            "listings": listings,
+            "count": len(listings),
+            "next_cursor": next_cursor,
             "filters_applied": {
                 "zip_code": zip_code,
                 "category": category,
@@ -295,19 +520,22 @@ async def list_listings(
             }
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error fetching listings: {e}")
+        logger.error("Error fetching listings: %s", e)
         raise HTTPException(status_code=500, detail=f"Error fetching listings: {str(e)}")
 
 @router.get("/{listing_id}")
-async def get_listing(listing_id: str):
+@cached(prefix="listings:detail", expire=settings.listings_cache_ttl, cache_control=DETAIL_CACHE_CONTROL)
+async def get_listing(listing_id: str, request: Request):
     """
     Get a specific listing by ID.
     
     Returns the listing details including user information.
     """
     try:
-        listing = ListingRepository.get_listing(listing_id)
+        listing = await asyncio.to_thread(ListingRepository.get_listing, listing_id)
         if not listing:
             raise HTTPException(status_code=404, detail="Listing not found")
         
@@ -315,30 +543,29 @@ async def get_listing(listing_id: str):
         user_info = None
         if listing.get("userId"):
             try:
-                user = UserRepository.get_user_public_profile(listing["userId"])
-                user_info = user
+                user_info = await public_profile_cache.get(listing["userId"], UserRepository.get_user_public_profile)
             except Exception as e:
-                logger.warning(f"Could not fetch user info for listing {listing_id}: {e}")
+                logger.warning("Could not fetch user info for listing %s: %s", listing_id, e)
         
         return {
-            "listing": listing,
+            "listing": ImageService.sign_listing_images(listing),
             "user_info": user_info
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching listing {listing_id}: {e}")
+        logger.error("Error fetching listing %s: %s", listing_id, e)
         raise HTTPException(status_code=500, detail=f"Error fetching listing: {str(e)}")
 
 @router.put("/{listing_id}")
-async def update_listing(listing_id: str, listing_data: dict):
+async def update_listing(listing_id: str, listing_update: UpdateListingRequest):
     """
     Update a listing.
     
     Note: In production, add authentication to ensure user can only update their own listings.
     
-    Expected payload (all fields optional):
+    Expected payload (all fields except userId optional):
     {
         "userId": "user123",  // Required for authorization
         "title": "Updated Blue Jeans",
@@ -352,24 +579,25 @@ async def update_listing(listing_id: str, listing_data: dict):
     }
     """
     try:
-        if "userId" not in listing_data:
-            raise HTTPException(status_code=400, detail="userId is required for authorization")
+        # Only fields present in the request are updated
+        listing_data = listing_update.model_dump(exclude_unset=True, exclude={"userId"})
+        user_id = listing_update.userId
         
-        user_id = listing_data.pop("userId")  # Remove from update data
-        
-        updated_listing = ListingRepository.update_listing(listing_id, listing_data, user_id)
+        updated_listing = await asyncio.to_thread(ListingRepository.update_listing, listing_id, listing_data, user_id)
         if not updated_listing:
             raise HTTPException(status_code=404, detail="Listing not found or not authorized to update")
         
+        await asyncio.gather(cache.delete_pattern(LISTINGS_CACHE_PATTERN), listing_cache.invalidate(listing_id))
+        
         return {
             "message": "Listing updated successfully",
-            "listing": updated_listing
+            "listing": ImageService.sign_listing_images(updated_listing)
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating listing {listing_id}: {e}")
+        logger.error("Error updating listing %s: %s", listing_id, e)
         raise HTTPException(status_code=500, detail=f"Error updating listing: {str(e)}")
 
 @router.delete("/{listing_id}")
@@ -390,40 +618,26 @@ async def delete_listing(listing_id: str, user_data: dict):
         
         user_id = user_data["userId"]
         
-        # Get listing first to retrieve image keys for cleanup
-        listing = ListingRepository.get_listing(listing_id)
+        # Delete the listing in a single conditional write; the deleted item carries the image keys for cleanup
+        try:
+            listing = await asyncio.to_thread(ListingRepository.delete_listing, listing_id, user_id)
+        except PermissionError:
+            raise HTTPException(status_code=403, detail="Not authorized to delete this listing")
         if not listing:
             raise HTTPException(status_code=404, detail="Listing not found")
         
-        # Verify user owns the listing
-        if listing.get("userId") != user_id:
-            raise HTTPException(status_code=403, detail="Not authorized to delete this listing")
-        
-        # Delete the listing from DynamoDB
-        success = ListingRepository.delete_listing(listing_id, user_id)
-        if not success:
-            raise HTTPException(status_code=500, detail="Failed to delete listing from database")
-        
-        # Clean up associated images from S3
-        images = listing.get("images", [])
-        deleted_images = []
-        failed_images = []
-        
-        if images:
-            from services.s3.image_service import ImageService
-            
-            for image in images:
-                image_key = image.get("key") if isinstance(image, dict) else image
-                if image_key:
-                    try:
-                        delete_success = ImageService.delete_image(image_key)
-                        if delete_success:
-                            deleted_images.append(image_key)
-                        else:
-                            failed_images.append(image_key)
-                    except Exception as e:
-                        logger.warning(f"Failed to delete image {image_key}: {e}")
-                        failed_images.append(image_key)
+        # Clean up associated images from S3 in batched DeleteObjects calls, while the caches are invalidated
+        image_keys = [
+            key for key in (
+                image.get("key") if isinstance(image, dict) else image
+                for image in listing.get("images", [])
+            ) if key
+        ]
+        _, _, (deleted_images, failed_images) = await asyncio.gather(
+            cache.delete_pattern(LISTINGS_CACHE_PATTERN),
+            listing_cache.invalidate(listing_id),
+            asyncio.to_thread(ImageService.delete_images, image_keys)
+        )
         
         response = {
             "message": "Listing deleted successfully",
@@ -434,18 +648,20 @@ async def delete_listing(listing_id: str, user_data: dict):
         
         if failed_images:
             response["failed_image_cleanup"] = failed_images
-            logger.warning(f"Failed to delete some images for listing {listing_id}: {failed_images}")
+            logger.warning("Failed to delete some images for listing %s: %s", listing_id, failed_images)
         
         return response
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting listing {listing_id}: {e}")
+        logger.error("Error deleting listing %s: %s", listing_id, e)
         raise HTTPException(status_code=500, detail=f"Error deleting listing: {str(e)}")
 
 @router.get("/search/by-location")
+@cached(prefix="listings:search", expire=settings.listings_cache_ttl, cache_control=SEARCH_CACHE_CONTROL)
 async def search_listings_by_location(
+    request: Request,
     zip_code: Optional[str] = Query(None, description="Zip code to search in"),
     address: Optional[str] = Query(None, description="Address to search near"),
     lat: Optional[float] = Query(None, description="Latitude for location search"),
@@ -477,12 +693,12 @@ async def search_listings_by_location(
         if lat is not None and lng is not None:
             center_lat, center_lng = lat, lng
         elif address:
-            geocoded = GeocodingService.geocode_address(address)
+            geocoded = await asyncio.to_thread(GeocodingService.geocode_address, address)
             if not geocoded:
                 raise HTTPException(status_code=400, detail=f"Could not geocode address: {address}")
             center_lat, center_lng = geocoded['lat'], geocoded['lng']
         elif zip_code:
-            geocoded = GeocodingService.get_zip_code_coordinates(zip_code)
+            geocoded = await asyncio.to_thread(GeocodingService.get_zip_code_coordinates, zip_code)
             if not geocoded:
                 raise HTTPException(status_code=400, detail=f"Could not geocode zip code: {zip_code}")
             center_lat, center_lng = geocoded['lat'], geocoded['lng']
@@ -492,31 +708,45 @@ async def search_listings_by_location(
                 detail="At least one location parameter (zip_code, address, or lat/lng) is required"
             )
         
-        # Get all active listings (we'll need to scan for location-based search)
-        from app.db.dynamodb_utils import DynamoDBUtils
-        all_listings = DynamoDBUtils.scan_items(
-            table_name="Listings",
-            filter_expression="attribute_exists(listingId) AND #status = :status",
-            expression_attribute_names={"#status": "status"},
-            expression_attribute_values={":status": "active"}
-        )
-        
-        # Filter by distance
-        nearby_listings = GeocodingService.filter_listings_by_distance(
-            all_listings, center_lat, center_lng, radius
-        )
-        
-        # Apply additional filters
-        filtered_listings = nearby_listings
-        
-        if category:
-            filtered_listings = [listing for listing in filtered_listings if listing.get("category") == category]
-        
-        if size:
-            filtered_listings = [listing for listing in filtered_listings if listing.get("size") == size]
+        cells = geohash.cells_covering(center_lat, center_lng, radius, GEOHASH_INDEX_PRECISION)
+        if len(cells) <= MAX_GEOHASH_CELLS:
+            # Query only the geohash cells covering the search circle, with filters applied by DynamoDB
+            cell_results = await asyncio.gather(*(
+                asyncio.to_thread(
+                    ListingRepository.get_active_listings_in_cell, cell, category, size, condition
+                )
+                for cell in cells
+            ))
+            candidates = [listing for listings in cell_results for listing in listings]
+            filtered_listings = GeocodingService.filter_listings_by_distance(
+                candidates, center_lat, center_lng, radius
+            )
+        else:
+            # Very large radius: a scan reads less than hundreds of cell queries
+            all_listings = await asyncio.to_thread(
+                DynamoDBUtils.scan_items,
+                table_name="Listings",
+                filter_expression="attribute_exists(listingId) AND #status = :status",
+                expression_attribute_names={"#status": "status"},
+                expression_attribute_values={":status": "active"}
+            )
+            nearby_listings = GeocodingService.filter_listings_by_distance(
+                all_listings, center_lat, center_lng, radius
+            )
+            
+            # Apply additional filters in a single pass
+            filters = {
+                field: value
+                for field, value in (("category", category), ("size", size), ("condition", condition))
+                if value
+            }
+            filtered_listings = [
+                listing for listing in nearby_listings
+                if all(listing.get(field) == value for field, value in filters.items())
+            ] if filters else nearby_listings
         
-        if condition:
-            filtered_listings = [listing for listing in filtered_listings if listing.get("condition") == condition]
+        await _attach_user_info(filtered_listings)
+        filtered_listings = [ImageService.sign_listing_images(listing) for listing in filtered_listings]
         
         return {
             "listings": filtered_listings,
@@ -538,7 +768,7 @@ async def search_listings_by_location(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error searching listings by location: {e}")
+        logger.error("Error searching listings by location: %s", e)
         raise HTTPException(status_code=500, detail=f"Error searching listings: {str(e)}")
 
 @router.post("/geocode")
@@ -556,7 +786,7 @@ async def geocode_address(request: dict):
         if not address:
             raise HTTPException(status_code=400, detail="Address is required")
         
-        geocoded = GeocodingService.geocode_address(address)
+        geocoded = await asyncio.to_thread(GeocodingService.geocode_address, address)
         if not geocoded:
             raise HTTPException(status_code=404, detail="Could not geocode the provided address")
         
@@ -568,7 +798,7 @@ async def geocode_address(request: dict):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error geocoding address: {e}")
+        logger.error("Error geocoding address: %s", e)
         raise HTTPException(status_code=500, detail=f"Error geocoding address: {str(e)}")
 
 @router.post("/reverse-geocode")
@@ -595,7 +825,7 @@ async def reverse_geocode_coordinates(request: dict):
         except (ValueError, TypeError):
             raise HTTPException(status_code=400, detail="lat and lng must be valid numbers")
         
-        reverse_geocoded = GeocodingService.reverse_geocode(lat, lng)
+        reverse_geocoded = await asyncio.to_thread(GeocodingService.reverse_geocode, lat, lng)
         if not reverse_geocoded:
             raise HTTPException(status_code=404, detail="Could not reverse geocode the provided coordinates")
         
@@ -607,7 +837,7 @@ async def reverse_geocode_coordinates(request: dict):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error reverse geocoding coordinates: {e}")
+        logger.error("Error reverse geocoding coordinates: %s", e)
         raise HTTPException(status_code=500, detail=f"Error reverse geocoding: {str(e)}")
 
 @router.post("/address-suggestions")
@@ -630,7 +860,7 @@ async def get_address_suggestions(request: dict):
         if not isinstance(limit, int) or limit < 1 or limit > 10:
             limit = 5
         
-        suggestions = GeocodingService.search_address_suggestions(query.strip(), limit)
+        suggestions = await asyncio.to_thread(GeocodingService.search_address_suggestions, query.strip(), limit)
         
         return {
             "success": True,
@@ -641,7 +871,7 @@ async def get_address_suggestions(request: dict):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting address suggestions: {e}")
+        logger.error("Error getting address suggestions: %s", e)
         raise HTTPException(status_code=500, detail=f"Error getting address suggestions: {str(e)}")
 
 @router.get("/user/{user_id}")
@@ -652,19 +882,25 @@ async def get_user_listings(user_id: str):
     Returns both active and inactive listings for the user.
     """
     try:
-        # Verify user exists
-        user = UserRepository.get_user(user_id)
-        if not user:
+        # The owner's profile doubles as the existence check, and is independent of the listings query
+        user_info, listings = await asyncio.gather(
+            public_profile_cache.get(user_id, UserRepository.get_user_public_profile),
+            asyncio.to_thread(ListingRepository.get_listings_by_user, user_id)
+        )
+        if not user_info:
             raise HTTPException(status_code=404, detail="User not found")
         
-        listings = ListingRepository.get_listings_by_user(user_id)
-        
-        # Separate active and inactive listings
-        active_listings = [listing for listing in listings if listing.get("status") == "active"]
-        inactive_listings = [listing for listing in listings if listing.get("status") != "active"]
+        # Separate active and inactive listings in a single pass
+        active_listings, inactive_listings = [], []
+        add_active, add_inactive = active_listings.append, inactive_listings.append
+        listings = [ImageService.sign_listing_images(listing) for listing in listings]
+        for listing in listings:
+            listing["user_info"] = user_info
+            (add_active if listing.get("status") == "active" else add_inactive)(listing)
         
         return {
             "user_id": user_id,
+            "user_info": user_info,
             "listings": listings,
             "active_listings": active_listings,
             "inactive_listings": inactive_listings,
@@ -676,5 +912,5 @@ async def get_user_listings(user_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching user listings for {user_id}: {e}")
+        logger.error("Error fetching user listings for %s: %s", user_id, e)
         raise HTTPException(status_code=500, detail=f"Error fetching user listings: {str(e)}")
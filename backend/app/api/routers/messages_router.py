@@ -1,33 +1,52 @@
 # backend/app/api/routers/messages_router.py
-from fastapi import APIRouter, HTTPException, Depends, Path, Body, Query, status
+from fastapi import APIRouter, HTTPException, Depends, Path, Body, Query, Request, status
 from typing import List, Optional
 from app.db.repos.message_repo import MessageRepository
 from app.schemas.messages import MessageCreate, MessageRead, MessageResponse, UnreadMessageCount
-from app.api.dependencies.messages import verify_user_in_swap, get_message_recipient
+from app.api.dependencies.messages import (
+    SwapContext, get_messages_version, invalidate_messages_version, swap_context
+)
+from app.infrastructure.cache import dumps
+from app.infrastructure.http_cache import etag_response, not_modified
+from app.infrastructure.unread_counters import unread_counters
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Polled endpoints: clients may keep a copy but must revalidate it with If-None-Match every time
+POLLING_CACHE_CONTROL = "private, no-cache"
+
 @router.get("/swap/{swap_id}", response_model=List[MessageResponse])
 async def get_messages_for_swap(
-    swap_id: str = Path(..., description="ID of the swap"),
-    user_id: str = Query(..., description="ID of the authenticated user")
+    request: Request,
+    ctx: SwapContext = Depends(swap_context)
 ):
     """
     Get all messages for a specific swap.
     
     Only participants in the swap (requester or owner) can access these messages.
     Messages are ordered by timestamp (oldest first).
+    
+    The response carries an ETag for the swap's current message version; a
+    request with a matching If-None-Match gets a 304 without the messages
+    being read at all.
     """
+    swap_id = ctx.swap_id
     try:
-        # Verify user is a participant in the swap
-        await verify_user_in_swap(swap_id, user_id)
+        version = await get_messages_version(swap_id)
+        etag = f'W/"{version}"' if version else None
+        if etag:
+            cached_response = not_modified(request, etag, POLLING_CACHE_CONTROL)
+            if cached_response:
+                return cached_response
         
         # Get all messages for the swap
-        messages = MessageRepository.get_messages_for_swap(swap_id)
+        messages = await asyncio.to_thread(MessageRepository.get_messages_for_swap, swap_id)
         
-        return messages
+        # Without a version (no Redis) the ETag is derived from the body instead
+        return etag_response(dumps(messages), request, POLLING_CACHE_CONTROL, etag=etag)
         
     except HTTPException:
         raise
@@ -41,26 +60,27 @@ async def get_messages_for_swap(
 @router.post("/swap/{swap_id}", response_model=MessageResponse)
 async def send_message(
     message_data: MessageCreate,
-    swap_id: str = Path(..., description="ID of the swap"),
-    user_id: str = Query(..., description="ID of the authenticated user (sender)")
+    ctx: SwapContext = Depends(swap_context)
 ):
     """
     Send a new message in a swap conversation.
     
     Only participants in the swap (requester or owner) can send messages.
     """
+    swap_id = ctx.swap_id
     try:
-        # Verify user is a participant and determine recipient
-        await verify_user_in_swap(swap_id, user_id)
-        recipient_id = await get_message_recipient(swap_id, user_id)
-        
         # Create the message
-        new_message = MessageRepository.create_message(
+        new_message = await asyncio.to_thread(
+            MessageRepository.create_message,
             swap_id=swap_id,
-            sender_id=user_id,
-            recipient_id=recipient_id,
+            sender_id=ctx.user_id,
+            recipient_id=ctx.recipient_id,
             content=message_data.content
         )
+        await asyncio.gather(
+            unread_counters.increment(ctx.recipient_id, swap_id),
+            invalidate_messages_version(swap_id)
+        )
         
         return new_message
         
@@ -76,20 +96,18 @@ async def send_message(
 @router.put("/{message_id}/read", response_model=MessageResponse)
 async def mark_message_as_read(
     message_data: MessageRead,
-    swap_id: str = Query(..., description="ID of the swap"),
-    user_id: str = Query(..., description="ID of the authenticated user (recipient)")
+    ctx: SwapContext = Depends(swap_context)
 ):
     """
     Mark a message as read.
     
     Only the recipient of the message can mark it as read.
     """
+    swap_id, user_id = ctx.swap_id, ctx.user_id
     try:
-        # Verify user is a participant in the swap
-        await verify_user_in_swap(swap_id, user_id)
-        
         # Mark the message as read
-        updated_message = MessageRepository.mark_message_as_read(
+        updated_message, newly_read = await asyncio.to_thread(
+            MessageRepository.mark_message_as_read,
             swap_id=swap_id,
             message_id=message_data.message_id,
             recipient_id=user_id
@@ -101,6 +119,12 @@ async def mark_message_as_read(
                 detail="Message not found or user is not the recipient"
             )
         
+        if newly_read:
+            await asyncio.gather(
+                unread_counters.decrement(user_id, swap_id),
+                invalidate_messages_version(swap_id)
+            )
+        
         return updated_message
         
     except HTTPException:
@@ -114,18 +138,33 @@ async def mark_message_as_read(
 
 @router.get("/unread", response_model=UnreadMessageCount)
 async def get_unread_message_count(
-    user_id: str = Query(..., description="ID of the authenticated user")
+    request: Request,
+    user_id: str = Query(..., description="ID of the authenticated user"),
+    total_only: bool = Query(False, description="Only return the total count, without the per-swap breakdown")
 ):
     """
     Get the count of unread messages for a user.
     
-    Returns the total count and a breakdown by swap.
+    Returns the total count and a breakdown by swap, with an ETag so an
+    unchanged count is answered with a bodiless 304. Badge refreshes can
+    pass total_only, which leaves the swaps list empty and, when the
+    counters aren't seeded, counts without reading any messages.
     """
     try:
-        # Get unread message count
-        unread_counts = MessageRepository.count_unread_messages(user_id)
+        # Served from the Redis counters; a full count is only needed to seed them
+        unread_counts = await unread_counters.get(user_id)
+        if unread_counts is None and total_only:
+            total = await asyncio.to_thread(MessageRepository.count_unread_total, user_id)
+            unread_counts = {"count": total, "swaps": []}
+        elif unread_counts is None:
+            unread_counts = await asyncio.to_thread(MessageRepository.count_unread_messages, user_id)
+            await unread_counters.seed(user_id, unread_counts)
         
-        return unread_counts
+        if total_only:
+            unread_counts["swaps"] = []
+        # Swaps are listed in a stable order so equal counts always hash to the same ETag
+        unread_counts["swaps"].sort(key=lambda swap: swap["swap_id"])
+        return etag_response(dumps(unread_counts), request, POLLING_CACHE_CONTROL)
         
     except Exception as e:
         logger.error(f"Error getting unread message count for user {user_id}: {e}")
@@ -137,31 +176,34 @@ async def get_unread_message_count(
 @router.delete("/{message_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_message(
     message_id: str = Path(..., description="ID of the message to delete"),
-    swap_id: str = Query(..., description="ID of the swap"),
-    user_id: str = Query(..., description="ID of the authenticated user (sender)")
+    ctx: SwapContext = Depends(swap_context)
 ):
     """
     Delete a message.
     
     Only the sender of the message can delete it.
     """
+    swap_id = ctx.swap_id
     try:
-        # Verify user is a participant in the swap
-        await verify_user_in_swap(swap_id, user_id)
-        
         # Delete the message
-        success = MessageRepository.delete_message(
+        deleted_message = await asyncio.to_thread(
+            MessageRepository.delete_message,
             swap_id=swap_id,
             message_id=message_id,
-            user_id=user_id
+            user_id=ctx.user_id
         )
         
-        if not success:
+        if not deleted_message:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Message not found or user is not the sender"
             )
         
+        await invalidate_messages_version(swap_id)
+        # The recipient never read it, so it no longer counts as unread for them
+        if not deleted_message.get("isRead", False):
+            await unread_counters.decrement(deleted_message.get("recipientId"), swap_id)
+        
     except HTTPException:
         raise
     except Exception as e:
@@ -1,18 +1,172 @@
 # backend/app/api/routers/swaps_router.py
-from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Depends
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Dict, List, Optional
 from app.db.repos.swap_repo import SwapRepository
 from app.db.repos.listing_repo import ListingRepository
 from app.db.repos.user_repo import UserRepository
 from app.db.repos.message_repo import MessageRepository
 from app.schemas.messages import SystemMessageEvent
+from app.schemas.swaps import (
+    AcceptSwapRequest, CreateSwapRequest, PendingSwapsResponse, SwapActionRequest, SwapDetailResponse,
+    SwapHistoryResponse, SwapListResponse, SwapUserRequest, UpdateSwapRequest
+)
+from app.api.dependencies.messages import (
+    invalidate_messages_version, swap_participants_key
+)
+from app.infrastructure.cache import cache, dumps, json_response
+from app.infrastructure.entity_cache import listing_cache, public_profile_cache
+from app.infrastructure.swap_stats import SWAP_STATUSES, swap_stats
+from app.infrastructure.unread_counters import unread_counters
+from services.s3.image_service import ImageService
+from collections import Counter
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+VALID_SWAP_STATUSES = SWAP_STATUSES
+
+# Swaps enriched (and written to the response) per round when streaming a list
+ENRICH_CHUNK_SIZE = 25
+
+# Message counter attributes of a swap item; responses carry them as the "messages" reference
+STORED_MESSAGE_ATTRIBUTES = ("messageCount", "unreadCount", "latestMessage")
+
+async def _enrich_swaps(swaps: List[dict], include_owner_info: bool = True) -> List[dict]:
+    """
+    Attach both listings, participant profiles and message counts to each swap.
+    
+    Listings and profiles come from the entity caches, with the misses for
+    every swap fetched in one BatchGetItem each. Message counts come from
+    the swap item; only swaps without stored counters look up their
+    messages, concurrently with the batch reads.
+    
+    Args:
+        swaps: The swap items
+        include_owner_info: Whether to attach the owner's public profile
+        
+    Returns:
+        The enriched swaps, updated in place; a swap whose lookups fail is
+        returned unchanged
+    """
+    if not swaps:
+        return []
+    
+    listing_ids = {swap.get("requesterListingId") for swap in swaps} | {swap.get("ownerListingId") for swap in swaps}
+    user_ids = {swap.get("requesterId") for swap in swaps}
+    if include_owner_info:
+        user_ids |= {swap.get("ownerId") for swap in swaps}
+    # Message counts stored on the swap item are used as-is; only swaps without them query their messages
+    for swap in swaps:
+        if "messages" not in swap and "messageCount" in swap:
+            swap["messages"] = MessageRepository.reference_from_swap(swap)
+        for attribute in STORED_MESSAGE_ATTRIBUTES:
+            swap.pop(attribute, None)
+    needs_messages = [swap for swap in swaps if "messages" not in swap]
+    
+    results = await asyncio.gather(
+        listing_cache.get_many(listing_ids, ListingRepository.get_listings_batch),
+        public_profile_cache.get_many(user_ids, UserRepository.get_public_profiles_batch),
+        *(asyncio.to_thread(MessageRepository.get_messages_reference, swap.get("swapId")) for swap in needs_messages),
+        return_exceptions=True
+    )
+    listings, profiles, message_results = results[0], results[1], results[2:]
+    if isinstance(listings, Exception) or isinstance(profiles, Exception):
+        error = listings if isinstance(listings, Exception) else profiles
+        logger.warning(f"Could not enrich {len(swaps)} swaps: {error}")
+        return swaps  # Return without enrichment
+    
+    message_refs = {swap.get("swapId"): refs for swap, refs in zip(needs_messages, message_results)}
+    # Cached listings are shared, so image URLs are signed on copies
+    signed_listings = {listing_id: ImageService.sign_listing_images(listing) for listing_id, listing in listings.items()}
+    enriched_swaps = []
+    for swap in swaps:
+        refs = swap["messages"] if "messages" in swap else message_refs.get(swap.get("swapId"))
+        if isinstance(refs, Exception):
+            logger.warning(f"Could not enrich swap {swap.get('swapId')}: {refs}")
+            enriched_swaps.append(swap)
+            continue
+        
+        # The swap items were loaded for this request, so they are filled in place rather than copied
+        swap["requester_listing"] = signed_listings.get(swap.get("requesterListingId"))
+        swap["owner_listing"] = signed_listings.get(swap.get("ownerListingId"))
+        swap["requester_info"] = profiles.get(swap.get("requesterId"))
+        swap["messages"] = refs
+        if include_owner_info:
+            swap["owner_info"] = profiles.get(swap.get("ownerId"))
+        enriched_swaps.append(swap)
+    
+    return enriched_swaps
+
+async def _stream_swap_list(swaps: List[dict], fields: Dict) -> AsyncIterator[bytes]:
+    """
+    Serialize a swap list response while its swaps are still being enriched.
+    
+    Swaps are enriched ENRICH_CHUNK_SIZE at a time, in their original order,
+    and each chunk is written out as soon as it is ready, so the client gets
+    the first swaps before the last ones are enriched and only one chunk of
+    enrichment results is held at a time.
+    
+    Args:
+        swaps: The swap items, already loaded
+        fields: The other top-level response fields
+        
+    Yields:
+        Pieces of the JSON response body
+    """
+    # The other fields go first so the swaps array can be left open while it streams
+    yield dumps(fields)[:-1] + b',"swaps":['
+    for start in range(0, len(swaps), ENRICH_CHUNK_SIZE):
+        enriched_swaps = await _enrich_swaps(swaps[start:start + ENRICH_CHUNK_SIZE])
+        yield (b"," if start else b"") + b",".join(dumps(swap) for swap in enriched_swaps)
+    yield b"]}"
+
+async def _record_status_change(swap: dict, previous_status: Optional[str], actor_id: str) -> None:
+    """
+    Write the system messages for a swap status change, then drop the caches they affect.
+    
+    Runs as a background task after the response is sent. The caches are only
+    dropped once the messages are written, so a read in between can't
+    re-cache counts or message versions that miss them.
+    """
+    swap_id = swap.get("swapId")
+    try:
+        await asyncio.to_thread(SwapRepository.create_status_change_messages, swap, previous_status, actor_id)
+    except Exception as e:
+        logger.error(f"Error creating system messages for swap {swap_id}: {e}")
+    await asyncio.gather(
+        unread_counters.invalidate([swap.get("requesterId"), swap.get("ownerId")]),
+        invalidate_messages_version(swap_id)
+    )
+
+async def _update_swap(
+    swap_id: str, update_data: dict, user_id: str, background_tasks: BackgroundTasks
+) -> Optional[dict]:
+    """
+    Apply a swap update and schedule its follow-up writes.
+    
+    The participant check is part of the write. The swap index is updated
+    before responding; system messages for a status change are written
+    after the response is sent.
+    
+    Returns:
+        The updated swap, or None if it doesn't exist or the user is not a participant
+    """
+    updated_swap, previous_status = await asyncio.to_thread(
+        SwapRepository.update_swap_status, swap_id, update_data, user_id
+    )
+    if not updated_swap:
+        return None
+    
+    await swap_stats.record(updated_swap)
+    if "status" in update_data and previous_status != updated_swap.get("status"):
+        background_tasks.add_task(_record_status_change, updated_swap, previous_status, user_id)
+    return updated_swap
+
 @router.post("/")
-async def create_swap(swap_data: dict):
+async def create_swap(request: CreateSwapRequest):
     """
     Create a new swap request.
     
@@ -31,43 +185,38 @@ async def create_swap(swap_data: dict):
     }
     """
     try:
-        # Validate required fields
-        required_fields = ["requesterId", "ownerId", "requesterListingId", "ownerListingId"]
-        for field in required_fields:
-            if field not in swap_data:
-                raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
-        
-        # Validate that requester and owner are different users
-        if swap_data["requesterId"] == swap_data["ownerId"]:
-            raise HTTPException(status_code=400, detail="Cannot create swap with yourself")
+        # The four lookups are independent, so run them concurrently
+        requester_exists, owner_exists, requester_listing, owner_listing = await asyncio.gather(
+            asyncio.to_thread(UserRepository.user_exists, request.requesterId),
+            asyncio.to_thread(UserRepository.user_exists, request.ownerId),
+            asyncio.to_thread(ListingRepository.get_listing, request.requesterListingId),
+            asyncio.to_thread(ListingRepository.get_listing, request.ownerListingId)
+        )
         
         # Verify users exist
-        requester = UserRepository.get_user(swap_data["requesterId"])
-        if not requester:
+        if not requester_exists:
             raise HTTPException(status_code=404, detail="Requester user not found")
         
-        owner = UserRepository.get_user(swap_data["ownerId"])
-        if not owner:
+        if not owner_exists:
             raise HTTPException(status_code=404, detail="Owner user not found")
         
         # Verify listings exist and are active
-        requester_listing = ListingRepository.get_listing(swap_data["requesterListingId"])
         if not requester_listing or requester_listing.get("status") != "active":
             raise HTTPException(status_code=404, detail="Requester listing not found or not active")
         
-        owner_listing = ListingRepository.get_listing(swap_data["ownerListingId"])
         if not owner_listing or owner_listing.get("status") != "active":
             raise HTTPException(status_code=404, detail="Owner listing not found or not active")
         
         # Verify listing ownership
-        if requester_listing.get("userId") != swap_data["requesterId"]:
+        if requester_listing.get("userId") != request.requesterId:
             raise HTTPException(status_code=403, detail="Requester doesn't own the offered listing")
         
-        if owner_listing.get("userId") != swap_data["ownerId"]:
+        if owner_listing.get("userId") != request.ownerId:
             raise HTTPException(status_code=403, detail="Owner doesn't own the requested listing")
         
         # Create swap
-        new_swap = SwapRepository.create_swap(swap_data, swap_data["requesterId"])
+        new_swap = await asyncio.to_thread(SwapRepository.create_swap, request.model_dump(), request.requesterId)
+        await swap_stats.record(new_swap)
         
         return {
             "message": "Swap request created successfully",
@@ -80,7 +229,7 @@ async def create_swap(swap_data: dict):
         logger.error(f"Error creating swap: {e}")
         raise HTTPException(status_code=500, detail=f"Error creating swap: {str(e)}")
 
-@router.get("/")
+@router.get("/", response_model=SwapListResponse)
 async def list_swaps(
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
     role: Optional[str] = Query(None, description="Filter by role: 'requester' or 'owner'"),
@@ -107,11 +256,11 @@ async def list_swaps(
         
         if listing_id:
             # Get swaps for specific listing
-            swaps = SwapRepository.get_swaps_for_listing(listing_id)
+            swaps = await asyncio.to_thread(SwapRepository.get_swaps_for_listing, listing_id, status)
             
         elif user_id:
             # Get swaps for specific user
-            swaps = SwapRepository.get_swaps_by_user(user_id, role)
+            swaps = await asyncio.to_thread(SwapRepository.get_swaps_by_user, user_id, role, status)
             
         else:
             # If no filters provided, return error (to prevent expensive scans)
@@ -120,49 +269,20 @@ async def list_swaps(
                 detail="Please provide user_id or listing_id filter to avoid expensive database scans"
             )
         
-        # Filter by status if specified
-        if status:
-            swaps = [swap for swap in swaps if swap.get("status") == status]
-        
-        # Enrich swaps with listing and user information
-        enriched_swaps = []
-        for swap in swaps:
-            try:
-                # Get listing information
-                requester_listing = ListingRepository.get_listing(swap.get("requesterListingId"))
-                owner_listing = ListingRepository.get_listing(swap.get("ownerListingId"))
-                
-                # Get user information (public profiles)
-                requester_info = UserRepository.get_user_public_profile(swap.get("requesterId"))
-                owner_info = UserRepository.get_user_public_profile(swap.get("ownerId"))
-                
-                # Get message counts
-                message_refs = swap.get("messages", MessageRepository.get_messages_reference(swap.get("swapId")))
-                
-                enriched_swap = {
-                    **swap,
-                    "requester_listing": requester_listing,
-                    "owner_listing": owner_listing,
-                    "requester_info": requester_info,
-                    "owner_info": owner_info,
-                    "messages": message_refs
+        # Swaps are enriched with listing and user information while the response streams;
+        # enrichment fails soft per swap, so nothing past this point can turn into an error status
+        return StreamingResponse(
+            _stream_swap_list(swaps, {
+                "count": len(swaps),
+                "filters_applied": {
+                    "user_id": user_id,
+                    "role": role,
+                    "status": status,
+                    "listing_id": listing_id
                 }
-                enriched_swaps.append(enriched_swap)
-                
-            except Exception as e:
-                logger.warning(f"Could not enrich swap {swap.get('swapId')}: {e}")
-                enriched_swaps.append(swap)  # Add without enrichment
-        
-        return {
-            "swaps": enriched_swaps,
-            "count": len(enriched_swaps),
-            "filters_applied": {
-                "user_id": user_id,
-                "role": role,
-                "status": status,
-                "listing_id": listing_id
-            }
-        }
+            }),
+            media_type="application/json"
+        )
         
     except HTTPException:
         raise
@@ -170,7 +290,7 @@ async def list_swaps(
         logger.error(f"Error fetching swaps: {e}")
         raise HTTPException(status_code=500, detail=f"Error fetching swaps: {str(e)}")
 
-@router.get("/{swap_id}")
+@router.get("/{swap_id}", response_model=SwapDetailResponse)
 async def get_swap(swap_id: str):
     """
     Get a specific swap by ID with full details.
@@ -178,34 +298,13 @@ async def get_swap(swap_id: str):
     Returns the swap with enriched listing and user information.
     """
     try:
-        swap = SwapRepository.get_swap(swap_id)
+        swap = await asyncio.to_thread(SwapRepository.get_swap, swap_id)
         if not swap:
             raise HTTPException(status_code=404, detail="Swap not found")
         
         # Enrich with listing and user information
-        try:
-            requester_listing = ListingRepository.get_listing(swap.get("requesterListingId"))
-            owner_listing = ListingRepository.get_listing(swap.get("ownerListingId"))
-            requester_info = UserRepository.get_user_public_profile(swap.get("requesterId"))
-            owner_info = UserRepository.get_user_public_profile(swap.get("ownerId"))
-            
-            # Get message counts
-            message_refs = swap.get("messages", MessageRepository.get_messages_reference(swap.get("swapId")))
-            
-            enriched_swap = {
-                **swap,
-                "requester_listing": requester_listing,
-                "owner_listing": owner_listing,
-                "requester_info": requester_info,
-                "owner_info": owner_info,
-                "messages": message_refs
-            }
-            
-            return {"swap": enriched_swap}
-            
-        except Exception as e:
-            logger.warning(f"Could not enrich swap {swap_id}: {e}")
-            return {"swap": swap}
+        enriched_swaps = await _enrich_swaps([swap])
+        return json_response({"swap": enriched_swaps[0]})
         
     except HTTPException:
         raise
@@ -214,7 +313,7 @@ async def get_swap(swap_id: str):
         raise HTTPException(status_code=500, detail=f"Error fetching swap: {str(e)}")
 
 @router.put("/{swap_id}")
-async def update_swap(swap_id: str, update_data: dict):
+async def update_swap(swap_id: str, request: UpdateSwapRequest, background_tasks: BackgroundTasks):
     """
     Update a swap status or details.
     
@@ -233,26 +332,12 @@ async def update_swap(swap_id: str, update_data: dict):
     }
     """
     try:
-        if "userId" not in update_data:
-            raise HTTPException(status_code=400, detail="userId is required for authorization")
+        # Only the fields that were sent are updated; the status is validated by UpdateSwapRequest
+        user_id = request.userId
+        update_data = request.model_dump(exclude={"userId"}, exclude_none=True)
         
-        user_id = update_data.pop("userId")  # Remove from update data
-        
-        # Validate status if provided
-        valid_statuses = ["pending", "accepted", "rejected", "completed", "cancelled"]
-        if "status" in update_data and update_data["status"] not in valid_statuses:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
-            )
-        
-        # Get the existing swap before updating for notification purposes
-        existing_swap = SwapRepository.get_swap(swap_id)
-        if not existing_swap:
-            raise HTTPException(status_code=404, detail="Swap not found")
-        
-        # Update the swap - system messages are generated automatically in the repository
-        updated_swap = SwapRepository.update_swap_status(swap_id, update_data, user_id)
+        # Update the swap; system messages for a status change are written after responding
+        updated_swap = await _update_swap(swap_id, update_data, user_id, background_tasks)
         if not updated_swap:
             raise HTTPException(
                 status_code=404, 
@@ -271,7 +356,7 @@ async def update_swap(swap_id: str, update_data: dict):
         raise HTTPException(status_code=500, detail=f"Error updating swap: {str(e)}")
 
 @router.delete("/{swap_id}")
-async def delete_swap(swap_id: str, user_data: dict):
+async def delete_swap(swap_id: str, request: SwapUserRequest):
     """
     Delete a swap request.
     
@@ -283,18 +368,24 @@ async def delete_swap(swap_id: str, user_data: dict):
     }
     """
     try:
-        if "userId" not in user_data:
-            raise HTTPException(status_code=400, detail="userId is required for authorization")
+        user_id = request.userId
         
-        user_id = user_data["userId"]
-        
-        success = SwapRepository.delete_swap(swap_id, user_id)
-        if not success:
+        deleted = await asyncio.to_thread(SwapRepository.delete_swap, swap_id, user_id)
+        if not deleted:
             raise HTTPException(
                 status_code=404, 
                 detail="Swap not found, not authorized to delete, or swap is no longer pending"
             )
         
+        await cache.delete(swap_participants_key(swap_id))
+        # Deleting adds a cancellation system message for both participants
+        participant_ids = [deleted.get("requesterId"), deleted.get("ownerId")]
+        await asyncio.gather(
+            unread_counters.invalidate(participant_ids),
+            swap_stats.remove(swap_id, participant_ids),
+            invalidate_messages_version(swap_id)
+        )
+        
         return {
             "message": "Swap deleted successfully",
             "swap_id": swap_id
@@ -306,7 +397,7 @@ async def delete_swap(swap_id: str, user_data: dict):
         logger.error(f"Error deleting swap {swap_id}: {e}")
         raise HTTPException(status_code=500, detail=f"Error deleting swap: {str(e)}")
 
-@router.get("/user/{user_id}/pending")
+@router.get("/user/{user_id}/pending", response_model=PendingSwapsResponse)
 async def get_pending_swaps(user_id: str):
     """
     Get pending swaps where the user needs to take action.
@@ -314,42 +405,22 @@ async def get_pending_swaps(user_id: str):
     Returns swaps where the user is the owner and needs to respond.
     """
     try:
-        # Verify user exists
-        user = UserRepository.get_user(user_id)
-        if not user:
+        # The existence check and the pending swaps query are independent, so run them concurrently
+        user_exists, pending_swaps = await asyncio.gather(
+            asyncio.to_thread(UserRepository.user_exists, user_id),
+            asyncio.to_thread(SwapRepository.get_pending_swaps_for_user, user_id)
+        )
+        if not user_exists:
             raise HTTPException(status_code=404, detail="User not found")
         
-        pending_swaps = SwapRepository.get_pending_swaps_for_user(user_id)
-        
         # Enrich with listing and requester information
-        enriched_swaps = []
-        for swap in pending_swaps:
-            try:
-                requester_listing = ListingRepository.get_listing(swap.get("requesterListingId"))
-                owner_listing = ListingRepository.get_listing(swap.get("ownerListingId"))
-                requester_info = UserRepository.get_user_public_profile(swap.get("requesterId"))
-                
-                # Get message counts
-                message_refs = swap.get("messages", MessageRepository.get_messages_reference(swap.get("swapId")))
-                
-                enriched_swap = {
-                    **swap,
-                    "requester_listing": requester_listing,
-                    "owner_listing": owner_listing,
-                    "requester_info": requester_info,
-                    "messages": message_refs
-                }
-                enriched_swaps.append(enriched_swap)
-                
-            except Exception as e:
-                logger.warning(f"Could not enrich pending swap {swap.get('swapId')}: {e}")
-                enriched_swaps.append(swap)
+        enriched_swaps = await _enrich_swaps(pending_swaps, include_owner_info=False)
         
-        return {
+        return json_response({
             "user_id": user_id,
             "pending_swaps": enriched_swaps,
             "count": len(enriched_swaps)
-        }
+        })
         
     except HTTPException:
         raise
@@ -357,50 +428,77 @@ async def get_pending_swaps(user_id: str):
         logger.error(f"Error fetching pending swaps for {user_id}: {e}")
         raise HTTPException(status_code=500, detail=f"Error fetching pending swaps: {str(e)}")
 
-@router.get("/user/{user_id}/history")
-async def get_user_swap_history(user_id: str):
+@router.get("/user/{user_id}/history", response_model=SwapHistoryResponse)
+async def get_user_swap_history(
+    user_id: str,
+    include: Optional[str] = Query(None, description="Comma-separated statuses to return swaps for; all statuses when omitted"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of swaps returned per status, newest first")
+):
     """
     Get complete swap history for a user.
     
-    Returns all swaps (as requester and owner) categorized by status.
+    Returns swaps (as requester and owner) categorized by status, along with
+    statistics over all of the user's swaps. Counts and swap IDs per status are
+    served from the Redis swap index, so only the requested swaps are loaded.
     """
     try:
+        if include is None:
+            statuses = list(VALID_SWAP_STATUSES)
+        else:
+            statuses = [status for status in include.split(",") if status]
+            unknown = set(statuses).difference(VALID_SWAP_STATUSES)
+            if unknown:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid status. Must be one of: {', '.join(VALID_SWAP_STATUSES)}"
+                )
+        
         # Verify user exists
-        user = UserRepository.get_user(user_id)
-        if not user:
+        user_exists, counts = await asyncio.gather(
+            asyncio.to_thread(UserRepository.user_exists, user_id),
+            swap_stats.get_counts(user_id)
+        )
+        if not user_exists:
             raise HTTPException(status_code=404, detail="User not found")
         
-        all_swaps = SwapRepository.get_swaps_by_user(user_id)
-        
-        # Categorize swaps by status
-        categorized_swaps = {
-            "pending": [],
-            "accepted": [],
-            "rejected": [],
-            "completed": [],
-            "cancelled": []
-        }
+        swap_ids = await swap_stats.get_swap_ids(user_id, statuses, limit) if counts is not None else None
         
-        for swap in all_swaps:
-            status = swap.get("status", "pending")
-            if status in categorized_swaps:
-                categorized_swaps[status].append(swap)
+        if swap_ids is not None:
+            swaps_by_id = await asyncio.to_thread(
+                SwapRepository.get_swaps_batch,
+                [swap_id for ids in swap_ids.values() for swap_id in ids]
+            )
+            categorized_swaps = {
+                status: [swaps_by_id[swap_id] for swap_id in ids if swap_id in swaps_by_id]
+                for status, ids in swap_ids.items()
+            }
+        else:
+            # Index not seeded: load every swap once and seed it for the next request
+            all_swaps = await asyncio.to_thread(SwapRepository.get_swaps_by_user, user_id)
+            await swap_stats.seed(user_id, all_swaps)
+            
+            counts = Counter(swap.get("status", "pending") for swap in all_swaps)
+            categorized_swaps = {status: [] for status in statuses}
+            for swap in all_swaps:
+                bucket = categorized_swaps.get(swap.get("status", "pending"))
+                if bucket is not None and (limit is None or len(bucket) < limit):
+                    bucket.append(swap)
         
         # Calculate statistics
-        total_swaps = len(all_swaps)
-        completed_swaps = len(categorized_swaps["completed"])
+        total_swaps = sum(counts.get(status, 0) for status in VALID_SWAP_STATUSES)
+        completed_swaps = counts.get("completed", 0)
         success_rate = (completed_swaps / total_swaps * 100) if total_swaps > 0 else 0
         
-        return {
+        return json_response({
             "user_id": user_id,
             "swap_history": categorized_swaps,
             "statistics": {
                 "total_swaps": total_swaps,
                 "completed_swaps": completed_swaps,
-                "pending_swaps": len(categorized_swaps["pending"]),
+                "pending_swaps": counts.get("pending", 0),
                 "success_rate": round(success_rate, 1)
             }
-        }
+        })
         
     except HTTPException:
         raise
@@ -409,7 +507,7 @@ async def get_user_swap_history(user_id: str):
         raise HTTPException(status_code=500, detail=f"Error fetching swap history: {str(e)}")
 
 @router.post("/{swap_id}/accept")
-async def accept_swap(swap_id: str, user_data: dict):
+async def accept_swap(swap_id: str, request: AcceptSwapRequest, background_tasks: BackgroundTasks):
     """
     Accept a swap request.
     
@@ -426,18 +524,15 @@ async def accept_swap(swap_id: str, user_data: dict):
     }
     """
     try:
-        if "userId" not in user_data:
-            raise HTTPException(status_code=400, detail="userId is required for authorization")
-        
         # Update swap status to accepted
         update_data = {
             "status": "accepted",
-            "message": user_data.get("message", ""),
-            "meetupDetails": user_data.get("meetupDetails", {})
+            "message": request.message,
+            "meetupDetails": request.meetupDetails
         }
         
-        # The SwapRepository will automatically create system messages
-        updated_swap = SwapRepository.update_swap_status(swap_id, update_data, user_data["userId"])
+        # System messages for the status change are written after responding
+        updated_swap = await _update_swap(swap_id, update_data, request.userId, background_tasks)
         if not updated_swap:
             raise HTTPException(
                 status_code=404, 
@@ -456,7 +551,7 @@ async def accept_swap(swap_id: str, user_data: dict):
         raise HTTPException(status_code=500, detail=f"Error accepting swap: {str(e)}")
 
 @router.post("/{swap_id}/reject")
-async def reject_swap(swap_id: str, user_data: dict):
+async def reject_swap(swap_id: str, request: SwapActionRequest, background_tasks: BackgroundTasks):
     """
     Reject a swap request.
     
@@ -469,17 +564,14 @@ async def reject_swap(swap_id: str, user_data: dict):
     }
     """
     try:
-        if "userId" not in user_data:
-            raise HTTPException(status_code=400, detail="userId is required for authorization")
-        
         # Update swap status to rejected
         update_data = {
             "status": "rejected",
-            "message": user_data.get("message", "")
+            "message": request.message
         }
         
-        # The SwapRepository will automatically create system messages
-        updated_swap = SwapRepository.update_swap_status(swap_id, update_data, user_data["userId"])
+        # System messages for the status change are written after responding
+        updated_swap = await _update_swap(swap_id, update_data, request.userId, background_tasks)
         if not updated_swap:
             raise HTTPException(
                 status_code=404, 
@@ -498,7 +590,7 @@ async def reject_swap(swap_id: str, user_data: dict):
         raise HTTPException(status_code=500, detail=f"Error rejecting swap: {str(e)}")
 
 @router.post("/{swap_id}/complete")
-async def complete_swap(swap_id: str, user_data: dict):
+async def complete_swap(swap_id: str, request: SwapActionRequest, background_tasks: BackgroundTasks):
     """
     Mark a swap as completed.
     
@@ -511,17 +603,14 @@ async def complete_swap(swap_id: str, user_data: dict):
     }
     """
     try:
-        if "userId" not in user_data:
-            raise HTTPException(status_code=400, detail="userId is required for authorization")
-        
         # Update swap status to completed
         update_data = {
             "status": "completed",
-            "message": user_data.get("message", "")
+            "message": request.message
         }
         
-        # The SwapRepository will automatically create system messages
-        updated_swap = SwapRepository.update_swap_status(swap_id, update_data, user_data["userId"])
+        # System messages for the status change are written after responding
+        updated_swap = await _update_swap(swap_id, update_data, request.userId, background_tasks)
         if not updated_swap:
             raise HTTPException(
                 status_code=404, 
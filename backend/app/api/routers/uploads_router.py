@@ -1,11 +1,21 @@
 # backend/app/api/routers/uploads_router.py
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from typing import Optional
+from app.infrastructure.cache import build_cache_key, cache, cached, dumps
+from app.infrastructure.http_cache import etag_response
+from app.schemas.uploads import BulkUploadUrlRequest
 from services.s3.image_service import ImageService
 from services.s3.presign_service import PresignService
+import asyncio
 
 router = APIRouter()
 
+# Image keys are never reused, so metadata only changes when the image is deleted
+IMAGE_METADATA_CACHE_PREFIX = "images:metadata"
+IMAGE_METADATA_CACHE_TTL = 60  # seconds
+# Metadata and URLs only change when an image is deleted, so clients and CDNs may keep them briefly
+IMAGE_CACHE_CONTROL = "public, max-age=60"
+
 @router.get("/images")
 async def get_upload_url(
     filename: str = Query(..., description="Original filename"),
@@ -24,7 +34,8 @@ async def get_upload_url(
         Dictionary containing upload URL, fields, and metadata
     """
     try:
-        upload_data = ImageService.get_upload_url(
+        upload_data = await asyncio.to_thread(
+            ImageService.get_upload_url,
             filename=filename,
             content_type=content_type,
             file_size=file_size
@@ -40,11 +51,54 @@ async def get_upload_url(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate upload URL: {str(e)}")
 
+@router.post("/images/bulk")
+async def get_upload_urls(request: BulkUploadUrlRequest):
+    """
+    Generate presigned URLs for uploading several images to S3 in one call.
+    
+    Files are validated like GET /images, and one invalid file fails the
+    whole request. Each file gets its own unique key.
+    
+    Expected payload:
+    {
+        "files": [{"filename": "jeans.jpg", "content_type": "image/jpeg", "file_size": 524288}]
+    }
+    
+    Returns:
+        Upload URL, fields and metadata per file, in request order
+    """
+    try:
+        # Presigning is local signing work, so the whole batch runs in one worker thread
+        uploads = await asyncio.to_thread(lambda: [
+            ImageService.get_upload_url(
+                filename=file.filename,
+                content_type=file.content_type,
+                file_size=file.file_size
+            )
+            for file in request.files
+        ])
+        
+        return {
+            "success": True,
+            "data": [
+                {"filename": file.filename, **upload}
+                for file, upload in zip(request.files, uploads)
+            ]
+        }
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to generate upload URLs: {str(e)}")
+
 @router.delete("/images/{key:path}")
 async def delete_image(key: str):
     """
     Delete an image from S3.
     
+    Deleting is idempotent: S3 reports success whether or not the key
+    exists, so the object isn't looked up first.
+    
     Args:
         key: S3 object key (e.g., 'images/uuid.jpg')
         
@@ -56,16 +110,14 @@ async def delete_image(key: str):
         if not ImageService.validate_image_key(key):
             raise HTTPException(status_code=400, detail="Invalid image key format")
         
-        # Check if image exists
-        if not ImageService.image_exists(key):
-            raise HTTPException(status_code=404, detail="Image not found")
-        
         # Delete the image
-        success = ImageService.delete_image(key)
+        success = await asyncio.to_thread(ImageService.delete_image, key)
         
         if not success:
             raise HTTPException(status_code=500, detail="Failed to delete image")
         
+        await cache.delete(build_cache_key(IMAGE_METADATA_CACHE_PREFIX, {"key": key}))
+        
         return {
             "success": True,
             "message": f"Image {key} deleted successfully"
@@ -77,10 +129,14 @@ async def delete_image(key: str):
         raise HTTPException(status_code=500, detail=f"Failed to delete image: {str(e)}")
 
 @router.get("/images/{key:path}/metadata")
-async def get_image_metadata(key: str):
+@cached(prefix=IMAGE_METADATA_CACHE_PREFIX, expire=IMAGE_METADATA_CACHE_TTL, cache_control=IMAGE_CACHE_CONTROL)
+async def get_image_metadata(key: str, request: Request):
     """
     Get metadata for an image.
     
+    Responses are cached in Redis for a minute and dropped when the image
+    is deleted. They carry an ETag, so a revalidating client gets a 304.
+    
     Args:
         key: S3 object key
         
@@ -92,8 +148,8 @@ async def get_image_metadata(key: str):
         if not ImageService.validate_image_key(key):
             raise HTTPException(status_code=400, detail="Invalid image key format")
         
-        # Get metadata
-        metadata = ImageService.get_image_metadata(key)
+        # Get metadata - a single HeadObject, which also tells whether the image exists
+        metadata = await asyncio.to_thread(ImageService.get_image_metadata, key)
         
         if not metadata:
             raise HTTPException(status_code=404, detail="Image not found")
@@ -109,10 +165,19 @@ async def get_image_metadata(key: str):
         raise HTTPException(status_code=500, detail=f"Failed to get image metadata: {str(e)}")
 
 @router.get("/images/{key:path}/url")
-async def get_image_url(key: str, use_cloudfront: bool = Query(True, description="Use CloudFront URL if available")):
+async def get_image_url(
+    key: str,
+    request: Request,
+    use_cloudfront: bool = Query(True, description="Use CloudFront URL if available")
+):
     """
     Get the public URL for an image.
     
+    The URL is built locally without checking that the image exists; a
+    missing image shows up as a 404 (or 403) when the URL is fetched. The
+    response carries an ETag, so a revalidating client gets a 304 until the
+    URL changes.
+    
     Args:
         key: S3 object key
         use_cloudfront: Whether to use CloudFront URL
@@ -125,21 +190,17 @@ async def get_image_url(key: str, use_cloudfront: bool = Query(True, description
         if not ImageService.validate_image_key(key):
             raise HTTPException(status_code=400, detail="Invalid image key format")
         
-        # Check if image exists
-        if not ImageService.image_exists(key):
-            raise HTTPException(status_code=404, detail="Image not found")
-        
         # Get public URL
         url = ImageService.get_image_url(key, use_cloudfront=use_cloudfront)
         
-        return {
+        return etag_response(dumps({
             "success": True,
             "data": {
                 "key": key,
                 "url": url,
                 "cloudfront_enabled": use_cloudfront
             }
-        }
+        }), request, IMAGE_CACHE_CONTROL)
         
     except HTTPException:
         raise
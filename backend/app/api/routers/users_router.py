@@ -1,13 +1,49 @@
 # backend/app/api/routers/users_router.py
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 from app.db.repos.user_repo import UserRepository
 from app.db.repos.listing_repo import ListingRepository
 from app.db.repos.swap_repo import SwapRepository
-from typing import Optional
+from app.infrastructure.cache import build_cache_key, cache, cached, dumps, json_response
+from app.infrastructure.entity_cache import public_profile_cache
+from app.infrastructure.http_cache import etag_response
+from app.infrastructure.swap_stats import swap_stats
+from typing import Dict, List, Optional
+import asyncio
 
 router = APIRouter()
 
+REQUIRED_USER_FIELDS = frozenset({"userId", "email", "firstName", "lastName"})
+
+# Every profile field is present in the response, with these values when the item lacks it
+USER_PROFILE_DEFAULTS = {**dict.fromkeys(UserRepository.PROFILE_ATTRIBUTES), "address": {}, "isActive": True}
+
+# Profile updates drop the cached responses; listing and swap stats may lag by up to the TTL
+USER_CACHE_PREFIX = "users:detail"
+USER_CACHE_TTL = 30  # seconds
+# Public profiles are shown to other users; clients may reuse one briefly, then revalidate by ETag
+PUBLIC_PROFILE_CACHE_CONTROL = "public, max-age=60"
+
+def _user_cache_keys(user_id: str) -> List[str]:
+    """Cache keys of both get_user variants for a user"""
+    return [
+        build_cache_key(USER_CACHE_PREFIX, {"user_id": user_id, "include_stats": include_stats})
+        for include_stats in (False, True)
+    ]
+
+async def _swap_counts(user_id: str) -> Dict[str, int]:
+    """
+    Get a user's total, pending and completed swap counts.
+    
+    Read from the Redis swap index when it is seeded; otherwise counted by
+    DynamoDB without loading any swaps.
+    """
+    counts = await swap_stats.get_counts(user_id)
+    if counts is None:
+        return await asyncio.to_thread(SwapRepository.count_swaps_by_user, user_id, ("pending", "completed"))
+    return {"total": sum(counts.values()), "pending": counts["pending"], "completed": counts["completed"]}
+
 @router.get("/{user_id}")
+@cached(prefix=USER_CACHE_PREFIX, expire=USER_CACHE_TTL)
 async def get_user(user_id: str, include_stats: bool = False):
     """
     Get user profile data for frontend display
@@ -20,49 +56,46 @@ async def get_user(user_id: str, include_stats: bool = False):
         User profile data with optional statistics
     """
     try:
-        # Get user profile
-        user = UserRepository.get_user(user_id)
+        # The profile and the stats lookups only depend on user_id, so issue them together
+        if include_stats:
+            user, listing_counts, swap_counts = await asyncio.gather(
+                asyncio.to_thread(UserRepository.get_user, user_id, UserRepository.PROFILE_ATTRIBUTES),
+                asyncio.to_thread(ListingRepository.count_listings_by_user, user_id),
+                _swap_counts(user_id),
+                return_exceptions=True
+            )
+            if isinstance(user, Exception):
+                raise user
+        else:
+            user = await asyncio.to_thread(UserRepository.get_user, user_id, UserRepository.PROFILE_ATTRIBUTES)
+        
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        # Prepare response data
-        response_data = {
-            "userId": user.get("userId"),
-            "email": user.get("email"),
-            "firstName": user.get("firstName"),
-            "lastName": user.get("lastName"),
-            "phone": user.get("phone"),
-            "address": user.get("address", {}),
-            "profileImageUrl": user.get("profileImageUrl"),
-            "createdAt": user.get("createdAt"),
-            "updatedAt": user.get("updatedAt"),
-            "isActive": user.get("isActive", True)
-        }
+        # Only the profile attributes were read, so the item is the response as-is
+        response_data = {**USER_PROFILE_DEFAULTS, **user}
         
         # Include statistics if requested
         if include_stats:
             try:
-                # Get user's listings count
-                user_listings = ListingRepository.get_listings_by_user(user_id)
-                active_listings = [l for l in user_listings if l.get("status") == "active"]
-                
-                # Get user's swaps count
-                user_swaps = SwapRepository.get_swaps_by_user(user_id)
-                pending_swaps = [s for s in user_swaps if s.get("status") == "pending"]
-                completed_swaps = [s for s in user_swaps if s.get("status") == "completed"]
+                for result in (listing_counts, swap_counts):
+                    if isinstance(result, Exception):
+                        raise result
                 
+                # Only counts are needed, so no listing or swap items are loaded for them
                 response_data["stats"] = {
-                    "totalListings": len(user_listings),
-                    "activeListings": len(active_listings),
-                    "totalSwaps": len(user_swaps),
-                    "pendingSwaps": len(pending_swaps),
-                    "completedSwaps": len(completed_swaps)
+                    "totalListings": listing_counts["total"],
+                    "activeListings": listing_counts["active"],
+                    "totalSwaps": swap_counts["total"],
+                    "pendingSwaps": swap_counts["pending"],
+                    "completedSwaps": swap_counts["completed"]
                 }
             except Exception as e:
-                # If stats fail, still return user data without stats
+                # If stats fail, still return user data without stats, but don't cache it
                 response_data["stats"] = {
                     "error": "Could not load user statistics"
                 }
+                return json_response(response_data)
         
         return response_data
         
@@ -72,17 +105,18 @@ async def get_user(user_id: str, include_stats: bool = False):
         raise HTTPException(status_code=500, detail=f"Error fetching user profile: {str(e)}")
 
 @router.get("/{user_id}/public")
-async def get_user_public_profile(user_id: str):
+async def get_user_public_profile(user_id: str, request: Request):
     """
     Get public user profile (limited data for privacy)
     Used when displaying user info to other users
+    Carries an ETag, so an unchanged profile is answered with a 304
     """
     try:
-        public_profile = UserRepository.get_user_public_profile(user_id)
+        public_profile = await public_profile_cache.get(user_id, UserRepository.get_user_public_profile)
         if not public_profile:
             raise HTTPException(status_code=404, detail="User not found")
         
-        return public_profile
+        return etag_response(dumps(public_profile), request, PUBLIC_PROFILE_CACHE_CONTROL)
         
     except HTTPException:
         raise
@@ -96,10 +130,15 @@ async def update_user(user_id: str, user_data: dict):
     Note: In production, add authentication to ensure user can only update their own profile
     """
     try:
-        updated_user = UserRepository.update_user(user_id, user_data)
+        updated_user = await asyncio.to_thread(UserRepository.update_user, user_id, user_data)
         if not updated_user:
             raise HTTPException(status_code=404, detail="User not found")
         
+        await asyncio.gather(
+            public_profile_cache.invalidate(user_id),
+            cache.delete(*_user_cache_keys(user_id))
+        )
+        
         return {
             "message": "User profile updated successfully",
             "user": updated_user
@@ -118,17 +157,14 @@ async def create_user(user_data: dict):
     """
     try:
         # Validate required fields
-        required_fields = ["userId", "email", "firstName", "lastName"]
-        for field in required_fields:
-            if field not in user_data:
-                raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
+        missing = REQUIRED_USER_FIELDS.difference(user_data)
+        if missing:
+            raise HTTPException(status_code=400, detail=f"Missing required fields: {', '.join(sorted(missing))}")
         
-        # Check if user already exists
-        existing_user = UserRepository.get_user(user_data["userId"])
-        if existing_user:
+        # Fails on an existing user instead of overwriting it
+        new_user = await asyncio.to_thread(UserRepository.create_user, user_data)
+        if new_user is None:
             raise HTTPException(status_code=409, detail="User already exists")
-        
-        new_user = UserRepository.create_user(user_data)
         return {
             "message": "User profile created successfully",
             "user": new_user
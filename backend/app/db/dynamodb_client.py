@@ -21,12 +21,14 @@ class DynamoDBClient:
     def _initialize_client(self):
         """Initialize the DynamoDB client with proper credentials."""
         try:
-            # Configure boto3 with retry settings and timeouts
+            # Configure boto3 with retry settings and timeouts. Keep-alive lets pooled
+            # connections reuse their TLS session instead of re-handshaking per request.
             config = Config(
                 retries={'max_attempts': 10, 'mode': 'adaptive'},
-                connect_timeout=60,
-                read_timeout=60,
-                max_pool_connections=50
+                connect_timeout=settings.dynamodb_connect_timeout,
+                read_timeout=settings.dynamodb_read_timeout,
+                max_pool_connections=settings.dynamodb_max_pool_connections,
+                tcp_keepalive=True
             )
             
             # Create session with credentials from settings
@@ -48,8 +50,10 @@ class DynamoDBClient:
             self._session = boto3.Session(**session_kwargs)
             self._dynamodb = self._session.resource('dynamodb', config=config)
             
-            # Test the connection by listing tables (this will raise an exception if credentials are invalid)
-            list(self._dynamodb.tables.limit(1))
+            # Credentials are checked by the first real request unless startup validation is enabled,
+            # so importing the app (workers, reloads, tests) makes no network call
+            if settings.dynamodb_validate_on_startup:
+                list(self._dynamodb.tables.limit(1))
             logger.info(f"Successfully initialized DynamoDB client for region: {settings.aws_default_region}")
             
         except NoCredentialsError:
@@ -136,3 +140,4 @@ dynamodb = _client.resource
 
 # Export the client instance for advanced usage
 dynamodb_client = _client
+
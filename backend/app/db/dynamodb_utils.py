@@ -3,8 +3,14 @@
 DynamoDB utility functions for better error handling and operations.
 """
 
+import base64
+import json
 import logging
-from typing import Dict, List, Optional, Any
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple, TypeVar
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.exceptions import ClientError
 from app.db.dynamodb_client import dynamodb
 
@@ -22,40 +28,77 @@ class ItemNotFoundError(DynamoDBError):
     """Exception raised when an item is not found in DynamoDB."""
     pass
 
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_LIMIT = 100
+BATCH_GET_MAX_RETRIES = 5
+
+# Table resources by name; building one is local, so no DescribeTable call is ever made
+_tables: Dict[str, Any] = {}
+
+# Threads for independent requests issued together from one repository call; they share
+# the client's connection pool, so the round trips overlap instead of queueing
+CONCURRENT_REQUEST_THREADS = 32
+_request_executor = ThreadPoolExecutor(max_workers=CONCURRENT_REQUEST_THREADS, thread_name_prefix="dynamodb")
+
+T = TypeVar("T")
+
+# The resource's own low-level client (same connection pool), for hot reads that skip
+# the resource layer's request and response transformation
+_client = dynamodb.meta.client
+_deserializer = TypeDeserializer()
+
+# (epoch second, formatted date and time) of the last timestamp built
+_timestamp_second: Tuple[int, str] = (-1, "")
+
+def utc_timestamp() -> str:
+    """
+    Current UTC time as stored on items, e.g. 2024-05-01T12:30:00.123456Z.
+    
+    The date and time part is formatted once per second and reused; unlike
+    datetime.isoformat, the microseconds are always present, so timestamps
+    sort correctly as strings.
+    """
+    global _timestamp_second
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_seconds, prefix = _timestamp_second
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _timestamp_second = (seconds, prefix)
+    return f"{prefix}.{micros:06d}Z"
+
 class DynamoDBUtils:
     """Utility class for DynamoDB operations with proper error handling."""
     
     @staticmethod
     def get_table(table_name: str):
         """
-        Get a DynamoDB table with error handling.
+        Get a DynamoDB table, built once per process and reused.
+        
+        The table isn't described up front; a missing table surfaces from the
+        first operation on it as TableNotFoundError.
         
         Args:
             table_name: Name of the DynamoDB table
             
         Returns:
             DynamoDB table resource
-            
+        """
+        table = _tables.get(table_name)
+        if table is None:
+            table = _tables[table_name] = dynamodb.Table(table_name)
+        return table
+    
+    @staticmethod
+    def _raise_if_table_missing(error: ClientError, table_name: str) -> None:
+        """
+        Turn a ResourceNotFoundException from an operation into TableNotFoundError.
+        
         Raises:
-            TableNotFoundError: If the table doesn't exist
-            DynamoDBError: For other DynamoDB errors
+            TableNotFoundError: If the error says the table doesn't exist
         """
-        try:
-            table = dynamodb.Table(table_name)
-            # Test table access by loading table metadata
-            table.load()
-            return table
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code == 'ResourceNotFoundException':
-                logger.error(f"DynamoDB table '{table_name}' not found")
-                raise TableNotFoundError(f"Table '{table_name}' does not exist. Please create it first.")
-            else:
-                logger.error(f"Error accessing table '{table_name}': {e}")
-                raise DynamoDBError(f"Error accessing table '{table_name}': {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error accessing table '{table_name}': {e}")
-            raise DynamoDBError(f"Unexpected error accessing table '{table_name}': {e}")
+        if error.response['Error']['Code'] == 'ResourceNotFoundException':
+            logger.error(f"DynamoDB table '{table_name}' not found")
+            raise TableNotFoundError(f"Table '{table_name}' does not exist. Please create it first.")
     
     @staticmethod
     def put_item(table_name: str, item: Dict[str, Any], condition_expression: str = None) -> Dict[str, Any]:
@@ -81,10 +124,11 @@ class DynamoDBUtils:
                 put_params['ConditionExpression'] = condition_expression
             
             table.put_item(**put_params)
-            logger.info(f"Successfully put item in table '{table_name}'")
+            logger.debug("Successfully put item in table '%s'", table_name)
             return item
             
         except ClientError as e:
+            DynamoDBUtils._raise_if_table_missing(e, table_name)
             error_code = e.response['Error']['Code']
             if error_code == 'ConditionalCheckFailedException':
                 logger.error(f"Condition check failed for item in table '{table_name}'")
@@ -97,13 +141,15 @@ class DynamoDBUtils:
             raise DynamoDBError(f"Failed to put item: {e}")
     
     @staticmethod
-    def get_item(table_name: str, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def get_item(table_name: str, key: Dict[str, Any],
+                 attributes: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
         """
         Get an item from DynamoDB with error handling.
         
         Args:
             table_name: Name of the DynamoDB table
             key: Primary key of the item to get
+            attributes: Optional attributes to project; all attributes when omitted
             
         Returns:
             The item if found, None otherwise
@@ -113,16 +159,89 @@ class DynamoDBUtils:
         """
         try:
             table = DynamoDBUtils.get_table(table_name)
-            response = table.get_item(Key=key)
+            get_params = {'Key': key}
+            if attributes:
+                # Alias every attribute so reserved words can't break the projection
+                attribute_names = {f"#a{i}": name for i, name in enumerate(attributes)}
+                get_params['ProjectionExpression'] = ", ".join(attribute_names)
+                get_params['ExpressionAttributeNames'] = attribute_names
+            response = table.get_item(**get_params)
             return response.get('Item')
             
         except ClientError as e:
+            DynamoDBUtils._raise_if_table_missing(e, table_name)
             logger.error(f"Error getting item from table '{table_name}': {e}")
             raise DynamoDBError(f"Failed to get item: {e}")
         except Exception as e:
             logger.error(f"Unexpected error getting item from table '{table_name}': {e}")
             raise DynamoDBError(f"Failed to get item: {e}")
     
+    @staticmethod
+    def _deserialize(item: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a low-level item to plain Python values, as the resource API returns them"""
+        return {name: _deserializer.deserialize(value) for name, value in item.items()}
+    
+    @staticmethod
+    def get_item_by_id(table_name: str, key_name: str, key_value: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an item by a string partition key through the low-level client.
+        
+        For hot point reads; the item is the same as get_item returns.
+        
+        Args:
+            table_name: Name of the DynamoDB table
+            key_name: Name of the partition key
+            key_value: Partition key value
+            
+        Returns:
+            The item if found, None otherwise
+            
+        Raises:
+            DynamoDBError: For DynamoDB errors
+        """
+        try:
+            response = _client.get_item(TableName=table_name, Key={key_name: {'S': key_value}})
+            item = response.get('Item')
+            return DynamoDBUtils._deserialize(item) if item else None
+            
+        except ClientError as e:
+            DynamoDBUtils._raise_if_table_missing(e, table_name)
+            logger.error(f"Error getting item from table '{table_name}': {e}")
+            raise DynamoDBError(f"Failed to get item: {e}")
+    
+    @staticmethod
+    def query_by_id(table_name: str, key_name: str, key_value: str,
+                    scan_index_forward: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get every item in a partition through the low-level client, following all pages.
+        
+        Args:
+            table_name: Name of the DynamoDB table
+            key_name: Name of the partition key
+            key_value: Partition key value
+            scan_index_forward: Sort key order; ascending by default
+            
+        Returns:
+            The partition's items, in sort key order
+            
+        Raises:
+            DynamoDBError: For DynamoDB errors
+        """
+        try:
+            query_params = {
+                'TableName': table_name,
+                'KeyConditionExpression': '#k = :k',
+                'ExpressionAttributeNames': {'#k': key_name},
+                'ExpressionAttributeValues': {':k': {'S': key_value}},
+                'ScanIndexForward': scan_index_forward
+            }
+            return [DynamoDBUtils._deserialize(item) for item in DynamoDBUtils.paginate(_client.query, query_params)]
+            
+        except ClientError as e:
+            DynamoDBUtils._raise_if_table_missing(e, table_name)
+            logger.error(f"Error querying table '{table_name}': {e}")
+            raise DynamoDBError(f"Failed to query items: {e}")
+    
     @staticmethod
     def update_item(table_name: str, key: Dict[str, Any], update_expression: str, 
                    expression_attribute_values: Dict[str, Any], 
@@ -159,10 +278,11 @@ class DynamoDBUtils:
                 update_params['ExpressionAttributeNames'] = expression_attribute_names
             
             response = table.update_item(**update_params)
-            logger.info(f"Successfully updated item in table '{table_name}'")
+            logger.debug("Successfully updated item in table '%s'", table_name)
             return response.get('Attributes')
             
         except ClientError as e:
+            DynamoDBUtils._raise_if_table_missing(e, table_name)
             logger.error(f"Error updating item in table '{table_name}': {e}")
             raise DynamoDBError(f"Failed to update item: {e}")
         except Exception as e:
@@ -187,25 +307,125 @@ class DynamoDBUtils:
         try:
             table = DynamoDBUtils.get_table(table_name)
             table.delete_item(Key=key)
-            logger.info(f"Successfully deleted item from table '{table_name}'")
+            logger.debug("Successfully deleted item from table '%s'", table_name)
             return True
             
         except ClientError as e:
+            DynamoDBUtils._raise_if_table_missing(e, table_name)
             logger.error(f"Error deleting item from table '{table_name}': {e}")
             raise DynamoDBError(f"Failed to delete item: {e}")
         except Exception as e:
             logger.error(f"Unexpected error deleting item from table '{table_name}': {e}")
             raise DynamoDBError(f"Failed to delete item: {e}")
     
+    @staticmethod
+    def run_concurrently(calls: Iterable[Callable[[], T]]) -> List[T]:
+        """
+        Run independent DynamoDB calls at the same time.
+        
+        The calls must not use run_concurrently themselves, since they would
+        wait on threads from the same pool.
+        
+        Args:
+            calls: Zero-argument callables, each making its own requests
+            
+        Returns:
+            The results, in the order of the calls; the first error is raised
+        """
+        calls = list(calls)
+        # Nothing to overlap with a single call, so skip the thread hand-off
+        if len(calls) == 1:
+            return [calls[0]()]
+        futures = [_request_executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
+    
+    @staticmethod
+    def set_assignments(data: Dict[str, Any], fields: Iterable[str]) -> Tuple[List[str], Dict[str, str], Dict[str, Any]]:
+        """
+        Build the SET assignments for the given fields present in data.
+        
+        Every field gets #fN/:fN placeholders, so reserved words such as
+        status, size or condition need no special casing.
+        
+        Args:
+            data: Update values by attribute name
+            fields: Attribute names that may be updated, in expression order
+            
+        Returns:
+            Tuple of assignments ("#f0 = :f0", ...), attribute names and attribute values
+        """
+        present = [field for field in fields if field in data]
+        assignments = [f"#f{index} = :f{index}" for index in range(len(present))]
+        names = {f"#f{index}": field for index, field in enumerate(present)}
+        values = {f":f{index}": data[field] for index, field in enumerate(present)}
+        return assignments, names, values
+    
+    @staticmethod
+    def paginate(operation: Callable, params: Dict[str, Any], limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield items from a query or scan, following LastEvaluatedKey page by page.
+        
+        Pages are only requested as items are consumed, so a caller that stops
+        early (or a limit) saves the remaining reads.
+        
+        Args:
+            operation: table.query or table.scan, or the low-level client's query or scan
+            params: Request parameters, without ExclusiveStartKey
+            limit: Maximum number of items to yield; all when omitted
+        """
+        params = dict(params)
+        remaining = limit
+        while remaining is None or remaining > 0:
+            if remaining is not None:
+                # Don't read (and pay for) more items than are still wanted
+                params['Limit'] = remaining
+            response = operation(**params)
+            items = response.get('Items', [])
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+            yield from items
+            
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                return
+            params['ExclusiveStartKey'] = last_key
+    
+    @staticmethod
+    def count_pages(operation: Callable, params: Dict[str, Any]) -> Tuple[int, int]:
+        """
+        Run a Select=COUNT query or scan over every page, reading no items.
+        
+        Args:
+            operation: table.query or table.scan, or the low-level client's query or scan
+            params: Request parameters, without Select or ExclusiveStartKey
+            
+        Returns:
+            Tuple of (Count, ScannedCount) summed over all pages: the items that
+            passed the filter and the items evaluated before it
+        """
+        params = {**params, 'Select': 'COUNT'}
+        count = scanned = 0
+        while True:
+            response = operation(**params)
+            count += response.get('Count', 0)
+            scanned += response.get('ScannedCount', 0)
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                return count, scanned
+            params['ExclusiveStartKey'] = last_key
+    
     @staticmethod
     def query_items(table_name: str, key_condition_expression: str, 
                    expression_attribute_values: Dict[str, Any],
                    index_name: str = None, filter_expression: str = None,
                    expression_attribute_names: Dict[str, str] = None,
-                   scan_index_forward: bool = True) -> List[Dict[str, Any]]:
+                   scan_index_forward: bool = True, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Query items from DynamoDB with error handling.
         
+        Every page of results is read, up to the limit.
+        
         Args:
             table_name: Name of the DynamoDB table
             key_condition_expression: Key condition for the query
@@ -214,6 +434,7 @@ class DynamoDBUtils:
             filter_expression: Optional filter expression
             expression_attribute_names: Names for the query
             scan_index_forward: Sort order
+            limit: Maximum number of items to return; all when omitted
             
         Returns:
             List of items matching the query
@@ -237,11 +458,12 @@ class DynamoDBUtils:
             if expression_attribute_names:
                 query_params['ExpressionAttributeNames'] = expression_attribute_names
             
-            response = table.query(**query_params)
-            logger.info(f"Successfully queried table '{table_name}', found {len(response.get('Items', []))} items")
-            return response.get('Items', [])
+            items = list(DynamoDBUtils.paginate(table.query, query_params, limit))
+            logger.debug("Successfully queried table '%s', found %d items", table_name, len(items))
+            return items
             
         except ClientError as e:
+            DynamoDBUtils._raise_if_table_missing(e, table_name)
             logger.error(f"Error querying table '{table_name}': {e}")
             raise DynamoDBError(f"Failed to query items: {e}")
         except Exception as e:
@@ -251,15 +473,19 @@ class DynamoDBUtils:
     @staticmethod
     def scan_items(table_name: str, filter_expression: str = None,
                   expression_attribute_values: Dict[str, Any] = None,
-                  expression_attribute_names: Dict[str, str] = None) -> List[Dict[str, Any]]:
+                  expression_attribute_names: Dict[str, str] = None,
+                  limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Scan items from DynamoDB with error handling.
         
+        Every page of results is read, up to the limit.
+        
         Args:
             table_name: Name of the DynamoDB table
             filter_expression: Optional filter expression
             expression_attribute_values: Values for the scan
             expression_attribute_names: Names for the scan
+            limit: Maximum number of items to return; all when omitted
             
         Returns:
             List of items from the scan
@@ -278,17 +504,225 @@ class DynamoDBUtils:
             if expression_attribute_names:
                 scan_params['ExpressionAttributeNames'] = expression_attribute_names
             
-            response = table.scan(**scan_params)
-            logger.info(f"Successfully scanned table '{table_name}', found {len(response.get('Items', []))} items")
-            return response.get('Items', [])
+            items = list(DynamoDBUtils.paginate(table.scan, scan_params, limit))
+            logger.debug("Successfully scanned table '%s', found %d items", table_name, len(items))
+            return items
             
         except ClientError as e:
+            DynamoDBUtils._raise_if_table_missing(e, table_name)
             logger.error(f"Error scanning table '{table_name}': {e}")
             raise DynamoDBError(f"Failed to scan items: {e}")
         except Exception as e:
             logger.error(f"Unexpected error scanning table '{table_name}': {e}")
             raise DynamoDBError(f"Failed to scan items: {e}")
     
+    @staticmethod
+    def parallel_scan_items(table_name: str, total_segments: int = 8, filter_expression: str = None,
+                            expression_attribute_values: Dict[str, Any] = None,
+                            expression_attribute_names: Dict[str, str] = None,
+                            projection_expression: str = None) -> List[Dict[str, Any]]:
+        """
+        Scan a whole table with a parallel (segmented) scan.
+        
+        The table is split into total_segments segments, each scanned page by
+        page in its own thread, so reads are spread over the table's partitions
+        and the client's connection pool. This reads the entire table and is
+        meant for scripts and reporting, not request handlers.
+        
+        Args:
+            table_name: Name of the DynamoDB table
+            total_segments: Number of segments scanned concurrently
+            filter_expression: Optional filter expression
+            expression_attribute_values: Values for the scan
+            expression_attribute_names: Names for the scan
+            projection_expression: Optional attributes to return
+            
+        Returns:
+            List of items from all segments, in no particular order
+            
+        Raises:
+            DynamoDBError: For DynamoDB errors
+        """
+        try:
+            table = DynamoDBUtils.get_table(table_name)
+            
+            scan_params = {'TotalSegments': total_segments}
+            if filter_expression:
+                scan_params['FilterExpression'] = filter_expression
+            if expression_attribute_values:
+                scan_params['ExpressionAttributeValues'] = expression_attribute_values
+            if expression_attribute_names:
+                scan_params['ExpressionAttributeNames'] = expression_attribute_names
+            if projection_expression:
+                scan_params['ProjectionExpression'] = projection_expression
+            
+            def scan_segment(segment: int) -> List[Dict[str, Any]]:
+                return list(DynamoDBUtils.paginate(table.scan, {**scan_params, 'Segment': segment}))
+            
+            with ThreadPoolExecutor(max_workers=total_segments) as executor:
+                segments = list(executor.map(scan_segment, range(total_segments)))
+            
+            items = [item for segment_items in segments for item in segment_items]
+            logger.info("Successfully scanned table '%s' in %d segments, found %d items", table_name, total_segments, len(items))
+            return items
+            
+        except ClientError as e:
+            DynamoDBUtils._raise_if_table_missing(e, table_name)
+            logger.error(f"Error scanning table '{table_name}': {e}")
+            raise DynamoDBError(f"Failed to scan items: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error scanning table '{table_name}': {e}")
+            raise DynamoDBError(f"Failed to scan items: {e}")
+    
+    @staticmethod
+    def batch_get_items(table_name: str, key_name: str, key_values: Iterable[str],
+                        attributes: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get many items by a single-attribute primary key in as few round-trips as possible.
+        
+        Keys are sent in BatchGetItem chunks of 100; throttled (unprocessed) keys
+        are retried with jittered exponential backoff.
+        
+        Args:
+            table_name: Name of the DynamoDB table
+            key_name: Name of the table's partition key
+            key_values: Key values to fetch (duplicates and empty values are ignored)
+            attributes: Optional attributes to project; all attributes when omitted
+            
+        Returns:
+            Dict mapping key value to item; missing items are omitted
+            
+        Raises:
+            DynamoDBError: For DynamoDB errors
+        """
+        unique_values = list(dict.fromkeys(value for value in key_values if value))
+        if not unique_values:
+            return {}
+        
+        projection = {}
+        if attributes:
+            # Alias every attribute so reserved words can't break the projection
+            attribute_names = {f"#a{i}": name for i, name in enumerate(attributes)}
+            projection = {
+                'ProjectionExpression': ", ".join(attribute_names),
+                'ExpressionAttributeNames': attribute_names
+            }
+        
+        items = {}
+        try:
+            for start in range(0, len(unique_values), BATCH_GET_LIMIT):
+                chunk = unique_values[start:start + BATCH_GET_LIMIT]
+                request_items = {
+                    table_name: {'Keys': [{key_name: value} for value in chunk], **projection}
+                }
+                
+                for attempt in range(BATCH_GET_MAX_RETRIES):
+                    response = dynamodb.batch_get_item(RequestItems=request_items)
+                    for item in response.get('Responses', {}).get(table_name, []):
+                        items[item[key_name]] = item
+                    
+                    request_items = response.get('UnprocessedKeys') or {}
+                    if not request_items:
+                        break
+                    # Back off before retrying throttled keys; full jitter keeps
+                    # concurrent batches from retrying in lockstep
+                    time.sleep(random.uniform(0, 0.05 * (2 ** attempt)))
+                else:
+                    unprocessed = len(request_items.get(table_name, {}).get('Keys', []))
+                    logger.warning(f"Gave up on {unprocessed} unprocessed keys in table '{table_name}'")
+            
+            return items
+            
+        except ClientError as e:
+            DynamoDBUtils._raise_if_table_missing(e, table_name)
+            logger.error(f"Error batch getting items from table '{table_name}': {e}")
+            raise DynamoDBError(f"Failed to batch get items: {e}")
+    
+    @staticmethod
+    def batch_write_items(table_name: str, put_items: Iterable[Dict[str, Any]] = (),
+                          delete_keys: Iterable[Dict[str, Any]] = ()) -> int:
+        """
+        Put and delete many items with BatchWriteItem.
+        
+        Writes are buffered into requests of 25 by boto3's batch writer, which
+        also resends unprocessed items. The writes are not atomic: an error can
+        leave earlier requests applied.
+        
+        Args:
+            table_name: Name of the DynamoDB table
+            put_items: Items to put (overwriting items with the same key)
+            delete_keys: Primary keys of items to delete
+            
+        Returns:
+            Number of write requests sent
+            
+        Raises:
+            DynamoDBError: For DynamoDB errors
+        """
+        puts = deletes = 0
+        try:
+            table = DynamoDBUtils.get_table(table_name)
+            with table.batch_writer() as batch:
+                for item in put_items:
+                    batch.put_item(Item=item)
+                    puts += 1
+                for key in delete_keys:
+                    batch.delete_item(Key=key)
+                    deletes += 1
+            # One record for the whole batch rather than one per item
+            logger.debug("Batch wrote to table '%s': %d puts, %d deletes", table_name, puts, deletes)
+            return puts + deletes
+            
+        except ClientError as e:
+            DynamoDBUtils._raise_if_table_missing(e, table_name)
+            logger.error(f"Error batch writing items to table '{table_name}': {e}")
+            raise DynamoDBError(f"Failed to batch write items: {e}")
+    
+    @staticmethod
+    def encode_cursor(last_evaluated_key: Optional[Dict[str, Any]]) -> Optional[str]:
+        """
+        Encode a DynamoDB LastEvaluatedKey as an opaque pagination cursor.
+        
+        Args:
+            last_evaluated_key: LastEvaluatedKey from a query/scan response
+            
+        Returns:
+            URL-safe cursor string, or None if there are no more pages
+        """
+        if not last_evaluated_key:
+            return None
+        raw = json.dumps(last_evaluated_key, default=str, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode()
+    
+    @staticmethod
+    def decode_cursor(cursor: Optional[str], key_names: Iterable[str] = ()) -> Optional[Dict[str, Any]]:
+        """
+        Decode a pagination cursor back into an ExclusiveStartKey.
+        
+        Args:
+            cursor: Cursor previously returned by encode_cursor
+            key_names: Attributes the key must consist of, each a string; unchecked when empty
+            
+        Returns:
+            ExclusiveStartKey dict, or None if no cursor was given
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        if not cursor:
+            return None
+        try:
+            key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+        if not isinstance(key, dict):
+            raise ValueError("Invalid pagination cursor")
+        key_names = set(key_names)
+        # A key DynamoDB would reject must fail here as a client error, not a query error
+        if key_names and (set(key) != key_names or not all(isinstance(value, str) for value in key.values())):
+            raise ValueError("Invalid pagination cursor")
+        return key
+    
     @staticmethod
     def health_check() -> Dict[str, Any]:
         """
@@ -1,19 +1,47 @@
 # backend/app/db/repositories/listing_repo.py
 from app.db.dynamodb_client import dynamodb
-from datetime import datetime
+from app.db.dynamodb_utils import DynamoDBUtils, utc_timestamp
 import uuid
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+from services.geocoding import geohash
+
+# Geohash precision of the GeohashIndex partition key (~39 x 20 km cells) and of the stored full hash (~1.2 x 0.6 km)
+GEOHASH_INDEX_PRECISION = 4
+GEOHASH_PRECISION = 6
+
+# Listing fields an update may change
+UPDATABLE_LISTING_FIELDS = ("title", "description", "category", "size", "condition", "images", "status", "tags")
 
 class ListingRepository:
     TABLE_NAME = "Listings"
+    # Attributes of a StatusCreatedAtIndex LastEvaluatedKey: the table key plus the index key
+    ACTIVE_LISTINGS_KEY = ("listingId", "status", "createdAt")
+    _table = None
+
+    @classmethod
+    def table(cls):
+        """Get the table handle, built once per process and reused across requests"""
+        if cls._table is None:
+            cls._table = dynamodb.Table(cls.TABLE_NAME)
+        return cls._table
+
+    @staticmethod
+    def geohash_attributes(location: Optional[dict]) -> dict:
+        """Get the geohash and GeohashIndex partition key for a listing's location, or {} without coordinates"""
+        if not location or location.get("lat") is None or location.get("lng") is None:
+            return {}
+        full_hash = geohash.encode(float(location["lat"]), float(location["lng"]), GEOHASH_PRECISION)
+        return {"geohash": full_hash, "geohashPrefix": full_hash[:GEOHASH_INDEX_PRECISION]}
 
     @classmethod
     def create_listing(cls, data: dict, user_id: str) -> dict:
         """Create a new listing associated with a user"""
-        table = dynamodb.Table(cls.TABLE_NAME)
+        table = cls.table()
         
         listing_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        timestamp = utc_timestamp()
         
         listing_item = {
             "listingId": listing_id,
@@ -31,6 +59,7 @@ class ListingRepository:
             "updatedAt": timestamp,
             "tags": data.get("tags", [])
         }
+        listing_item.update(cls.geohash_attributes(listing_item["location"]))
         
         table.put_item(Item=listing_item)
         return listing_item
@@ -38,28 +67,93 @@ class ListingRepository:
     @classmethod
     def get_listing(cls, listing_id: str) -> Optional[dict]:
         """Get a single listing by ID"""
-        table = dynamodb.Table(cls.TABLE_NAME)
-        
-        response = table.get_item(Key={"listingId": listing_id})
-        return response.get("Item")
+        return DynamoDBUtils.get_item_by_id(cls.TABLE_NAME, "listingId", listing_id)
 
     @classmethod
-    def get_listings_by_user(cls, user_id: str) -> List[dict]:
-        """Get all listings created by a specific user"""
-        table = dynamodb.Table(cls.TABLE_NAME)
-        
-        response = table.query(
-            IndexName="UserListingsIndex",
-            KeyConditionExpression="userId = :user_id",
-            ExpressionAttributeValues={":user_id": user_id},
-            ScanIndexForward=False  # Most recent first
-        )
+    def get_listings_batch(cls, listing_ids: Iterable[str]) -> Dict[str, dict]:
+        """Get many listings with BatchGetItem, keyed by listingId; missing listings are omitted"""
+        return DynamoDBUtils.batch_get_items(cls.TABLE_NAME, "listingId", listing_ids)
+
+    @classmethod
+    def get_listings_by_user(cls, user_id: str, active_only: bool = False) -> List[dict]:
+        """Get all listings created by a specific user, optionally only active ones"""
+        table = cls.table()
+        
+        query_params = {
+            "IndexName": "UserListingsIndex",
+            "KeyConditionExpression": "userId = :user_id",
+            "ExpressionAttributeValues": {":user_id": user_id},
+            "ScanIndexForward": False  # Most recent first
+        }
+        
+        if active_only:
+            query_params["FilterExpression"] = "#status = :status"
+            query_params["ExpressionAttributeNames"] = {"#status": "status"}  # status is a reserved keyword
+            query_params["ExpressionAttributeValues"][":status"] = "active"
+        
+        response = table.query(**query_params)
         return response.get("Items", [])
 
     @classmethod
-    def get_listings_by_zip(cls, zip_code: str, size: str = None, category: str = None) -> List[dict]:
+    def count_listings_by_user(cls, user_id: str) -> Dict[str, int]:
+        """
+        Count a user's listings without reading them.
+        
+        A single Select=COUNT query on UserListingsIndex: ScannedCount is every
+        listing of the user and Count the ones left after the active filter.
+        
+        Returns:
+            Dict with the "total" and "active" listing counts
+        """
+        active, total = DynamoDBUtils.count_pages(cls.table().query, {
+            "IndexName": "UserListingsIndex",
+            "KeyConditionExpression": "userId = :user_id",
+            "FilterExpression": "#status = :status",
+            "ExpressionAttributeNames": {"#status": "status"},  # status is a reserved keyword
+            "ExpressionAttributeValues": {":user_id": user_id, ":status": "active"}
+        })
+        return {"total": total, "active": active}
+
+    @classmethod
+    def get_active_listings(cls, limit: int = 50, start_key: Optional[dict] = None) -> Tuple[List[dict], Optional[dict]]:
+        """
+        Get one page of active listings, most recent first.
+        
+        Queries the StatusCreatedAtIndex GSI (partition key: status, sort key: createdAt)
+        instead of scanning the whole table.
+        
+        Returns:
+            Tuple of (listings, last_evaluated_key); the key is None on the last page
+        """
+        table = cls.table()
+        
+        query_params = {
+            "IndexName": "StatusCreatedAtIndex",
+            "KeyConditionExpression": Key("status").eq("active"),
+            "ScanIndexForward": False  # Most recent first
+        }
+        
+        items = []
+        last_key = start_key
+        while True:
+            query_params["Limit"] = limit - len(items)
+            if last_key:
+                query_params["ExclusiveStartKey"] = last_key
+            
+            response = table.query(**query_params)
+            items.extend(response.get("Items", []))
+            last_key = response.get("LastEvaluatedKey")
+            
+            if not last_key or len(items) >= limit:
+                break
+        
+        return items, last_key
+
+    @classmethod
+    def get_listings_by_zip(cls, zip_code: str, size: str = None, category: str = None,
+                            active_only: bool = False) -> List[dict]:
         """Get listings by zip code with optional filters"""
-        table = dynamodb.Table(cls.TABLE_NAME)
+        table = cls.table()
         
         # Base query by zip code
         key_condition = "zipCode = :zip_code"
@@ -73,6 +167,9 @@ class ListingRepository:
         if category:
             filter_expressions.append("category = :category")
             expression_values[":category"] = category
+        if active_only:
+            filter_expressions.append("#status = :status")
+            expression_values[":status"] = "active"
         
         query_params = {
             "IndexName": "ZipCodeIndex",
@@ -83,76 +180,109 @@ class ListingRepository:
         
         if filter_expressions:
             query_params["FilterExpression"] = " AND ".join(filter_expressions)
-            if size:  # size is a reserved keyword
-                query_params["ExpressionAttributeNames"] = {"#size": "size"}
+            # size and status are reserved keywords
+            attribute_names = {}
+            if size:
+                attribute_names["#size"] = "size"
+            if active_only:
+                attribute_names["#status"] = "status"
+            if attribute_names:
+                query_params["ExpressionAttributeNames"] = attribute_names
         
         response = table.query(**query_params)
         return response.get("Items", [])
 
     @classmethod
-    def update_listing(cls, listing_id: str, data: dict, user_id: str) -> Optional[dict]:
-        """Update a listing (only if user owns it)"""
-        table = dynamodb.Table(cls.TABLE_NAME)
+    def get_active_listings_in_cell(cls, cell: str, category: str = None, size: str = None,
+                                    condition: str = None) -> List[dict]:
+        """
+        Get active listings in one geohash cell, filtered server-side.
         
-        # First verify the user owns this listing
-        existing = cls.get_listing(listing_id)
-        if not existing or existing.get("userId") != user_id:
-            return None
+        Queries the GeohashIndex GSI (partition key: geohashPrefix, sort key: geohash).
+        Listings without coordinates have no geohashPrefix and are not in the index.
+        
+        Args:
+            cell: Geohash of GEOHASH_INDEX_PRECISION characters
+            category: Optional category filter
+            size: Optional size filter
+            condition: Optional condition filter
+            
+        Returns:
+            Listings in the cell; distance to the search center is not checked
+        """
+        table = cls.table()
         
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        filter_condition = Attr("status").eq("active")
+        for field, value in (("category", category), ("size", size), ("condition", condition)):
+            if value:
+                filter_condition &= Attr(field).eq(value)
+        
+        query_params = {
+            "IndexName": "GeohashIndex",
+            "KeyConditionExpression": Key("geohashPrefix").eq(cell),
+            "FilterExpression": filter_condition
+        }
+        
+        return list(DynamoDBUtils.paginate(table.query, query_params))
+
+    @classmethod
+    def update_listing(cls, listing_id: str, data: dict, user_id: str) -> Optional[dict]:
+        """Update a listing (only if user owns it); returns None if missing or not owned"""
+        table = cls.table()
+        
+        timestamp = utc_timestamp()
         
         # Build update expression
-        update_expression = "SET updatedAt = :timestamp"
-        expression_values = {":timestamp": timestamp}
-        
-        # Add fields to update
-        if "title" in data:
-            update_expression += ", title = :title"
-            expression_values[":title"] = data["title"]
-        if "description" in data:
-            update_expression += ", description = :description"
-            expression_values[":description"] = data["description"]
-        if "category" in data:
-            update_expression += ", category = :category"
-            expression_values[":category"] = data["category"]
-        if "size" in data:
-            update_expression += ", #size = :size"
-            expression_values[":size"] = data["size"]
-        if "condition" in data:
-            update_expression += ", condition = :condition"
-            expression_values[":condition"] = data["condition"]
-        if "images" in data:
-            update_expression += ", images = :images"
-            expression_values[":images"] = data["images"]
-        if "status" in data:
-            update_expression += ", status = :status"
-            expression_values[":status"] = data["status"]
-        if "tags" in data:
-            update_expression += ", tags = :tags"
-            expression_values[":tags"] = data["tags"]
+        assignments, expression_names, expression_values = DynamoDBUtils.set_assignments(data, UPDATABLE_LISTING_FIELDS)
+        assignments.append("updatedAt = :timestamp")
+        expression_values.update({":timestamp": timestamp, ":owner_id": user_id})
         
         update_params = {
             "Key": {"listingId": listing_id},
-            "UpdateExpression": update_expression,
+            "UpdateExpression": "SET " + ", ".join(assignments),
             "ExpressionAttributeValues": expression_values,
+            # Ownership is checked in the same request, so there is no separate read
+            "ConditionExpression": "attribute_exists(listingId) AND userId = :owner_id",
             "ReturnValues": "ALL_NEW"
         }
+        if expression_names:
+            update_params["ExpressionAttributeNames"] = expression_names
         
-        if "size" in data:
-            update_params["ExpressionAttributeNames"] = {"#size": "size"}
-        
-        response = table.update_item(**update_params)
+        try:
+            response = table.update_item(**update_params)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return None
+            raise
         return response.get("Attributes")
 
     @classmethod
-    def delete_listing(cls, listing_id: str, user_id: str) -> bool:
-        """Delete a listing (only if user owns it)"""
-        table = dynamodb.Table(cls.TABLE_NAME)
+    def delete_listing(cls, listing_id: str, user_id: str) -> Optional[dict]:
+        """
+        Delete a listing (only if user owns it)
         
-        # First verify the user owns this listing
-        existing = cls.get_listing(listing_id)
-        if not existing or existing.get("userId") != user_id:
-            return False
+        Returns:
+            The deleted listing, or None if it does not exist
+            
+        Raises:
+            PermissionError: If the listing belongs to another user
+        """
+        table = cls.table()
         
-        table.delete_item(Key={"listingId": listing_id})
-        return True
+        try:
+            response = table.delete_item(
+                Key={"listingId": listing_id},
+                ConditionExpression="attribute_exists(listingId) AND userId = :owner_id",
+                ExpressionAttributeValues={":owner_id": user_id},
+                ReturnValues="ALL_OLD",
+                ReturnValuesOnConditionCheckFailure="ALL_OLD"
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            # The failed condition returns the current item when the listing exists
+            if e.response.get("Item"):
+                raise PermissionError(f"User {user_id} does not own listing {listing_id}")
+            return None
+        
+        return response.get("Attributes")
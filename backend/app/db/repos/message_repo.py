@@ -1,22 +1,104 @@
 # backend/app/db/repos/message_repo.py
 from app.db.dynamodb_client import dynamodb
-from datetime import datetime
+from app.db.dynamodb_utils import DynamoDBUtils, utc_timestamp
+import logging
 import uuid
-from typing import Dict, List, Optional, Any
-from boto3.dynamodb.conditions import Key, Attr
+from typing import Dict, List, Optional, Any, Tuple
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import ClientError
 from app.schemas.messages import SystemMessageEvent
 
+logger = logging.getLogger(__name__)
+
+_deserializer = TypeDeserializer()
+
 class MessageRepository:
     TABLE_NAME = "Messages"
+    _table = None
     SYSTEM_SENDER_ID = "SYSTEM"
+    # Sparse GSI (partition key: recipientId, sort key: unreadAt); unreadAt is only set
+    # while a message is unread, so the index holds exactly the unread messages
+    UNREAD_INDEX = "UnreadByRecipientIndex"
+    # Swap items carry their message counts and latest message (messageCount, unreadCount,
+    # latestMessage), so summarizing a swap's messages doesn't read them
+    SWAPS_TABLE_NAME = "Swaps"
+    _swaps_table = None
+    
+    @classmethod
+    def table(cls):
+        """Get the table handle, built once per process and reused across requests"""
+        if cls._table is None:
+            cls._table = dynamodb.Table(cls.TABLE_NAME)
+        return cls._table
+    
+    @classmethod
+    def swaps_table(cls):
+        """Get the Swaps table handle, for the message counters kept on swap items"""
+        if cls._swaps_table is None:
+            cls._swaps_table = dynamodb.Table(cls.SWAPS_TABLE_NAME)
+        return cls._swaps_table
     
+    @staticmethod
+    def _latest_message_summary(message: dict) -> dict:
+        """The parts of a message stored as a swap's latestMessage"""
+        return {
+            "messageId": message["messageId"],
+            "content": message["content"],
+            "timestamp": message["timestamp"],
+            "messageType": message.get("messageType", "user"),
+            "eventType": message.get("eventType")
+        }
+    
+    @classmethod
+    def _update_swap_counters(
+        cls,
+        swap_id: str,
+        added: int,
+        unread_added: int,
+        latest: Optional[dict] = None,
+        return_values: str = "NONE"
+    ) -> Optional[dict]:
+        """
+        Atomically adjust the message counters on a swap item.
+        
+        Swaps without counters (created before they existed and not yet
+        backfilled, or deleted) are left alone; their summary is computed from
+        the messages instead. A failure is logged rather than raised, since the
+        message write itself has already succeeded.
+        
+        Returns:
+            The swap attributes requested by return_values, or None
+        """
+        update_expression = "ADD messageCount :added, unreadCount :unread_added"
+        expression_values = {":added": added, ":unread_added": unread_added}
+        if latest:
+            update_expression += " SET latestMessage = :latest"
+            expression_values[":latest"] = cls._latest_message_summary(latest)
+        
+        try:
+            response = cls.swaps_table().update_item(
+                Key={"swapId": swap_id},
+                UpdateExpression=update_expression,
+                ConditionExpression="attribute_exists(messageCount)",
+                ExpressionAttributeValues=expression_values,
+                ReturnValues=return_values
+            )
+            return response.get("Attributes")
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                logger.error(f"Error updating message counters for swap {swap_id}: {e}")
+        except Exception as e:
+            logger.error(f"Error updating message counters for swap {swap_id}: {e}")
+        return None
+
     @classmethod
     def create_message(cls, swap_id: str, sender_id: str, recipient_id: str, content: str) -> dict:
         """Create a new user message for a swap"""
-        table = dynamodb.Table(cls.TABLE_NAME)
+        table = cls.table()
         
         message_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        timestamp = utc_timestamp()
         
         message_item = {
             "swapId": swap_id,
@@ -26,10 +108,12 @@ class MessageRepository:
             "content": content,
             "timestamp": timestamp,
             "isRead": False,
+            "unreadAt": timestamp,
             "messageType": "user"
         }
         
         table.put_item(Item=message_item)
+        cls._update_swap_counters(swap_id, added=1, unread_added=1, latest=message_item)
         return message_item
     
     @classmethod
@@ -57,87 +141,106 @@ class MessageRepository:
         Returns:
             List of created message objects
         """
-        table = dynamodb.Table(cls.TABLE_NAME)
-        timestamp = datetime.utcnow().isoformat() + "Z"
-        messages = []
-        
-        for recipient_id in recipient_ids:
-            message_id = str(uuid.uuid4())
-            
-            message_item = {
+        table = cls.table()
+        timestamp = utc_timestamp()
+        messages = [
+            {
                 "swapId": swap_id,
-                "messageId": message_id,
+                "messageId": str(uuid.uuid4()),
                 "senderId": cls.SYSTEM_SENDER_ID,
                 "recipientId": recipient_id,
                 "content": content,
                 "timestamp": timestamp,
                 "isRead": False,
+                "unreadAt": timestamp,
                 "messageType": "system",
                 "eventType": event_type,
                 "metadata": metadata or {}
             }
-            
-            table.put_item(Item=message_item)
-            messages.append(message_item)
-            
+            for recipient_id in recipient_ids
+        ]
+        
+        # One BatchWriteItem for all recipients instead of a PutItem each;
+        # the writer resends any unprocessed items
+        with table.batch_writer() as batch:
+            for message_item in messages:
+                batch.put_item(Item=message_item)
+        
+        if messages:
+            cls._update_swap_counters(swap_id, added=len(messages), unread_added=len(messages), latest=messages[-1])
         return messages
     
+    @staticmethod
+    def _deserialize(item: Optional[Dict[str, Any]]) -> Optional[dict]:
+        """Convert a low-level item (as returned with a failed condition) to plain Python values"""
+        if not item:
+            return None
+        return {name: _deserializer.deserialize(value) for name, value in item.items()}
+    
+    @classmethod
+    def _query_all(cls, **query_params) -> List[dict]:
+        """Run a query and follow LastEvaluatedKey until every page is read"""
+        return list(DynamoDBUtils.paginate(cls.table().query, query_params))
+    
     @classmethod
     def get_messages_for_swap(cls, swap_id: str) -> List[dict]:
-        """Get all messages for a specific swap, ordered by timestamp"""
-        table = dynamodb.Table(cls.TABLE_NAME)
-        
-        response = table.query(
-            KeyConditionExpression=Key("swapId").eq(swap_id),
-            ScanIndexForward=True  # Sort by timestamp in ascending order (oldest first)
-        )
-        
-        return response.get("Items", [])
+        """Get all messages for a specific swap, ordered by timestamp (oldest first)"""
+        messages = DynamoDBUtils.query_by_id(cls.TABLE_NAME, "swapId", swap_id)
+        # The sort key is messageId, so query order isn't time order
+        messages.sort(key=lambda message: message["timestamp"])
+        return messages
     
     @classmethod
-    def mark_message_as_read(cls, swap_id: str, message_id: str, recipient_id: str) -> Optional[dict]:
-        """Mark a message as read (only if user is the recipient)"""
-        table = dynamodb.Table(cls.TABLE_NAME)
+    def mark_message_as_read(cls, swap_id: str, message_id: str, recipient_id: str) -> Tuple[Optional[dict], bool]:
+        """
+        Mark a message as read (only if user is the recipient)
         
-        # First get the message to check if user is recipient
-        response = table.get_item(Key={"swapId": swap_id, "messageId": message_id})
-        message = response.get("Item")
+        The recipient and unread checks are conditions on the update, so the
+        common case is a single write; the message is only inspected when the
+        condition fails.
         
-        if not message:
-            return None
-            
-        # Check if user is the recipient
-        if message.get("recipientId") != recipient_id:
-            return None
-            
-        # Message already read
-        if message.get("isRead", False):
-            return message
-            
-        # Update the message to mark as read
-        update_params = {
-            "Key": {"swapId": swap_id, "messageId": message_id},
-            "UpdateExpression": "SET isRead = :is_read",
-            "ExpressionAttributeValues": {":is_read": True},
-            "ReturnValues": "ALL_NEW"
-        }
+        Returns:
+            Tuple of the message (None if not found or user is not the recipient)
+            and whether this call changed it from unread to read
+        """
+        table = cls.table()
+        
+        try:
+            response = table.update_item(
+                Key={"swapId": swap_id, "messageId": message_id},
+                UpdateExpression="SET isRead = :is_read REMOVE unreadAt",
+                ConditionExpression="recipientId = :recipient_id AND (attribute_not_exists(isRead) OR isRead = :unread)",
+                ExpressionAttributeValues={":is_read": True, ":unread": False, ":recipient_id": recipient_id},
+                ReturnValues="ALL_NEW",
+                ReturnValuesOnConditionCheckFailure="ALL_OLD"
+            )
+            cls._update_swap_counters(swap_id, added=0, unread_added=-1)
+            return response.get("Attributes"), True
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            message = cls._deserialize(e.response.get("Item"))
+        
+        # Missing, or the user is not the recipient
+        if not message or message.get("recipientId") != recipient_id:
+            return None, False
         
-        response = table.update_item(**update_params)
-        return response.get("Attributes")
+        # Message already read
+        return message, False
     
     @classmethod
     def count_unread_messages(cls, user_id: str) -> dict:
-        """Count unread messages for a user across all swaps"""
-        table = dynamodb.Table(cls.TABLE_NAME)
-        
-        # Scan for all unread messages where user is the recipient
-        # Note: In a production system with many messages, this would be inefficient
-        # Consider using a GSI on recipientId and isRead for better performance
-        response = table.scan(
-            FilterExpression=Attr("recipientId").eq(user_id) & Attr("isRead").eq(False)
-        )
+        """
+        Count unread messages for a user across all swaps
         
-        unread_messages = response.get("Items", [])
+        Queries the user's partition of the sparse UnreadByRecipientIndex, so
+        only their unread messages are read, and only their swap IDs.
+        """
+        unread_messages = cls._query_all(
+            IndexName=cls.UNREAD_INDEX,
+            KeyConditionExpression=Key("recipientId").eq(user_id),
+            ProjectionExpression="swapId"
+        )
         
         # Group by swapId for more detailed information
         swaps_with_unread = {}
@@ -156,28 +259,99 @@ class MessageRepository:
         }
     
     @classmethod
-    def delete_message(cls, swap_id: str, message_id: str, user_id: str) -> bool:
-        """Delete a message (only if user is the sender)"""
-        table = dynamodb.Table(cls.TABLE_NAME)
+    def count_unread_total(cls, user_id: str) -> int:
+        """Count a user's unread messages with a Select=COUNT query, without reading any of them"""
+        total, _ = DynamoDBUtils.count_pages(cls.table().query, {
+            "IndexName": cls.UNREAD_INDEX,
+            "KeyConditionExpression": Key("recipientId").eq(user_id)
+        })
+        return total
+    
+    @classmethod
+    def delete_message(cls, swap_id: str, message_id: str, user_id: str) -> Optional[dict]:
+        """
+        Delete a message (only if user is the sender); returns the deleted message, or None
         
-        # First get the message to check if user is sender
-        response = table.get_item(Key={"swapId": swap_id, "messageId": message_id})
-        message = response.get("Item")
+        System messages can't be deleted. Both checks are conditions on the
+        delete, so it takes a single request.
+        """
+        table = cls.table()
         
-        if not message:
-            return False
-            
-        # Check if user is the sender
-        if message.get("senderId") != user_id:
-            return False
-            
-        # Prevent deletion of system messages
-        if message.get("messageType") == "system":
-            return False
-            
-        # Delete the message
-        table.delete_item(Key={"swapId": swap_id, "messageId": message_id})
-        return True
+        try:
+            response = table.delete_item(
+                Key={"swapId": swap_id, "messageId": message_id},
+                ConditionExpression="senderId = :user_id AND (attribute_not_exists(messageType) OR messageType <> :system)",
+                ExpressionAttributeValues={":user_id": user_id, ":system": "system"},
+                ReturnValues="ALL_OLD"
+            )
+        except ClientError as e:
+            # Missing, not the sender, or a system message
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return None
+            raise
+        
+        deleted_message = response.get("Attributes")
+        swap = cls._update_swap_counters(
+            swap_id,
+            added=-1,
+            unread_added=0 if deleted_message.get("isRead", False) else -1,
+            return_values="ALL_NEW"
+        )
+        # Deleting the latest message means finding the one before it
+        if swap and swap.get("latestMessage", {}).get("messageId") == message_id:
+            cls._replace_latest_message(swap_id)
+        
+        return deleted_message
+    
+    @classmethod
+    def _replace_latest_message(cls, swap_id: str) -> None:
+        """Recompute a swap's stored latest message from its remaining messages"""
+        messages = cls._query_all(
+            KeyConditionExpression=Key("swapId").eq(swap_id),
+            ProjectionExpression="messageId, content, #ts, messageType, eventType",
+            ExpressionAttributeNames={"#ts": "timestamp"}  # timestamp is reserved
+        )
+        try:
+            if messages:
+                latest = max(messages, key=lambda m: m["timestamp"])
+                cls.swaps_table().update_item(
+                    Key={"swapId": swap_id},
+                    UpdateExpression="SET latestMessage = :latest",
+                    ConditionExpression="attribute_exists(messageCount)",
+                    ExpressionAttributeValues={":latest": cls._latest_message_summary(latest)}
+                )
+            else:
+                cls.swaps_table().update_item(
+                    Key={"swapId": swap_id},
+                    UpdateExpression="REMOVE latestMessage",
+                    ConditionExpression="attribute_exists(messageCount)"
+                )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                logger.error(f"Error updating latest message for swap {swap_id}: {e}")
+    
+    @staticmethod
+    def reference_from_swap(swap: dict) -> Optional[Dict[str, Any]]:
+        """
+        Build a swap's message reference from the counters stored on it.
+        
+        Returns:
+            Dict with message counts and last message info, or None if the
+            swap has no counters yet (see get_messages_reference)
+        """
+        if "messageCount" not in swap:
+            return None
+        latest = swap.get("latestMessage")
+        return {
+            "total_count": int(swap["messageCount"]),
+            "unread_count": int(swap.get("unreadCount", 0)),
+            "latest_message": {
+                "content": latest["content"],
+                "timestamp": latest["timestamp"],
+                "message_type": latest.get("messageType", "user"),
+                "event_type": latest.get("eventType")
+            } if latest else None
+        }
         
     @classmethod
     def get_messages_reference(cls, swap_id: str) -> Dict[str, Any]:
@@ -185,12 +359,18 @@ class MessageRepository:
         Get a reference to messages for a swap that includes counts and latest message
         
         This is used to enrich swap objects with message-related information
-        without loading all messages.
+        when the swap item has no stored counters (see reference_from_swap);
+        it reads every message's summary attributes.
         
         Returns:
             Dict with message counts and last message info
         """
-        messages = cls.get_messages_for_swap(swap_id)
+        # Only the attributes needed for the summary are read, not every message body's metadata
+        messages = cls._query_all(
+            KeyConditionExpression=Key("swapId").eq(swap_id),
+            ProjectionExpression="content, #ts, isRead, messageType, eventType",
+            ExpressionAttributeNames={"#ts": "timestamp"}  # timestamp is reserved
+        )
         
         if not messages:
             return {
@@ -199,9 +379,15 @@ class MessageRepository:
                 "latest_message": None
             }
         
-        # Get the latest message
-        latest_message = max(messages, key=lambda m: m["timestamp"])
-        unread_count = len([m for m in messages if not m.get("isRead", False)])
+        # One pass for the unread count and the latest message. The sort key is
+        # messageId, not the timestamp, so the last item isn't necessarily the latest
+        latest_message = messages[0]
+        unread_count = 0
+        for message in messages:
+            if not message.get("isRead", False):
+                unread_count += 1
+            if message["timestamp"] > latest_message["timestamp"]:
+                latest_message = message
         
         return {
             "total_count": len(messages),
@@ -1,21 +1,34 @@
 # backend/app/db/repos/swap_repo.py
 from app.db.dynamodb_client import dynamodb
+from app.db.dynamodb_utils import DynamoDBUtils, utc_timestamp
 from app.db.repos.message_repo import MessageRepository
 from app.schemas.messages import SystemMessageEvent
-from datetime import datetime
+from botocore.exceptions import ClientError
+import functools
 import uuid
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+
+# Swap fields a status update may change
+UPDATABLE_SWAP_FIELDS = ("status", "message", "meetupDetails")
 
 class SwapRepository:
     TABLE_NAME = "Swaps"
+    _table = None
+
+    @classmethod
+    def table(cls):
+        """Get the table handle, built once per process and reused across requests"""
+        if cls._table is None:
+            cls._table = dynamodb.Table(cls.TABLE_NAME)
+        return cls._table
 
     @classmethod
     def create_swap(cls, data: dict, requester_id: str) -> dict:
         """Create a new swap request associated with the requester"""
-        table = dynamodb.Table(cls.TABLE_NAME)
+        table = cls.table()
         
         swap_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        timestamp = utc_timestamp()
         
         swap_item = {
             "swapId": swap_id,
@@ -28,7 +41,10 @@ class SwapRepository:
             "createdAt": timestamp,
             "updatedAt": timestamp,
             "completedAt": None,
-            "meetupDetails": data.get("meetupDetails", {})
+            "meetupDetails": data.get("meetupDetails", {}),
+            # Message counters, kept up to date by MessageRepository
+            "messageCount": 0,
+            "unreadCount": 0
         }
         
         table.put_item(Item=swap_item)
@@ -37,37 +53,88 @@ class SwapRepository:
     @classmethod
     def get_swap(cls, swap_id: str) -> Optional[dict]:
         """Get a single swap by ID"""
-        table = dynamodb.Table(cls.TABLE_NAME)
-        
-        response = table.get_item(Key={"swapId": swap_id})
-        return response.get("Item")
+        return DynamoDBUtils.get_item_by_id(cls.TABLE_NAME, "swapId", swap_id)
+
+    @classmethod
+    def get_swaps_batch(cls, swap_ids: Iterable[str]) -> Dict[str, dict]:
+        """Get many swaps with BatchGetItem, keyed by swapId; missing swaps are omitted"""
+        return DynamoDBUtils.batch_get_items(cls.TABLE_NAME, "swapId", swap_ids)
 
     @classmethod
-    def get_swaps_by_user(cls, user_id: str, role: str = None) -> List[dict]:
-        """Get swaps for a user (as requester, owner, or both)"""
-        table = dynamodb.Table(cls.TABLE_NAME)
+    def _query_all(cls, **query_params) -> List[dict]:
+        """Run a query and follow LastEvaluatedKey until every page is read"""
+        return list(DynamoDBUtils.paginate(cls.table().query, query_params))
+
+    @classmethod
+    def count_swaps_by_user(cls, user_id: str, statuses: Iterable[str]) -> Dict[str, int]:
+        """
+        Count a user's swaps by status.
         
-        swaps = []
+        One query per participant index, projecting only the status, so every
+        status is tallied from the same two (concurrent) queries.
         
-        if role is None or role == "requester":
-            # Get swaps where user is the requester
-            response = table.query(
-                IndexName="RequesterIndex",
-                KeyConditionExpression="requesterId = :user_id",
-                ExpressionAttributeValues={":user_id": user_id},
-                ScanIndexForward=False  # Most recent first
+        Args:
+            user_id: The ID of the user
+            statuses: Statuses to include in the result, as 0 when the user has none
+            
+        Returns:
+            Dict with the "total" count and the count of each status
+        """
+        queries = [
+            dict(
+                IndexName=index_name,
+                KeyConditionExpression=f"{key_name} = :user_id",
+                ProjectionExpression="#status",
+                ExpressionAttributeNames={"#status": "status"},  # status is reserved
+                ExpressionAttributeValues={":user_id": user_id}
             )
-            swaps.extend(response.get("Items", []))
+            for index_name, key_name in (("RequesterIndex", "requesterId"), ("OwnerIndex", "ownerId"))
+        ]
+        # The queries are independent, so they run together instead of back to back
+        results = DynamoDBUtils.run_concurrently(
+            functools.partial(cls._query_all, **params) for params in queries
+        )
         
+        counts = {"total": 0, **{status: 0 for status in statuses}}
+        for swaps in results:
+            counts["total"] += len(swaps)
+            for swap in swaps:
+                status = swap.get("status")
+                counts[status] = counts.get(status, 0) + 1
+        return counts
+
+    @classmethod
+    def get_swaps_by_user(cls, user_id: str, role: str = None, status: str = None) -> List[dict]:
+        """Get swaps for a user (as requester, owner, or both), optionally only those in one status"""
+        # The status filter is applied by DynamoDB, so non-matching swaps never leave the table
+        filter_params = {"ExpressionAttributeValues": {":user_id": user_id}}
+        if status:
+            filter_params = {
+                "FilterExpression": "#status = :status",
+                "ExpressionAttributeNames": {"#status": "status"},  # status is reserved
+                "ExpressionAttributeValues": {":user_id": user_id, ":status": status}
+            }
+        
+        indexes = []
+        if role is None or role == "requester":
+            # Swaps where user is the requester
+            indexes.append(("RequesterIndex", "requesterId"))
         if role is None or role == "owner":
-            # Get swaps where user owns the requested item
-            response = table.query(
-                IndexName="OwnerIndex",
-                KeyConditionExpression="ownerId = :user_id",
-                ExpressionAttributeValues={":user_id": user_id},
-                ScanIndexForward=False  # Most recent first
+            # Swaps where user owns the requested item
+            indexes.append(("OwnerIndex", "ownerId"))
+        
+        # With both roles the two queries are independent, so they run at the same time
+        results = DynamoDBUtils.run_concurrently(
+            functools.partial(
+                cls._query_all,
+                IndexName=index_name,
+                KeyConditionExpression=f"{key_name} = :user_id",
+                ScanIndexForward=False,  # Most recent first
+                **filter_params
             )
-            swaps.extend(response.get("Items", []))
+            for index_name, key_name in indexes
+        )
+        swaps = [swap for index_swaps in results for swap in index_swaps]
         
         # Remove duplicates and sort by creation date
         unique_swaps = {swap["swapId"]: swap for swap in swaps}
@@ -80,90 +147,71 @@ class SwapRepository:
         return sorted_swaps
 
     @classmethod
-    def update_swap_status(cls, swap_id: str, data: dict, user_id: str) -> Optional[dict]:
-        """Update swap status (only if user is involved in the swap)"""
-        table = dynamodb.Table(cls.TABLE_NAME)
-        
-        # First verify the user is involved in this swap
-        existing = cls.get_swap(swap_id)
-        if not existing:
-            return None
-        
-        # Check if user is either the requester or owner
-        if existing.get("requesterId") != user_id and existing.get("ownerId") != user_id:
-            return None
-        
-        timestamp = datetime.utcnow().isoformat() + "Z"
+    def update_swap_status(cls, swap_id: str, data: dict, user_id: str) -> Tuple[Optional[dict], Optional[str]]:
+        """
+        Update swap status (only if user is involved in the swap)
+        
+        The participant check is a condition on the update itself, so the swap
+        is written in one round-trip without reading it first. System messages
+        for a status change are left to the caller (see
+        create_status_change_messages), so they can be written after responding.
+        
+        Returns:
+            Tuple of the updated swap (None if it doesn't exist or the user is
+            not a participant) and its status before the update
+        """
+        table = cls.table()
+        timestamp = utc_timestamp()
         
         # Build update expression
-        update_expression = "SET updatedAt = :timestamp"
-        expression_values = {":timestamp": timestamp}
-        
-        # Track status change for system messages
-        previous_status = existing.get("status")
-        new_status = data.get("status", previous_status)
-        status_changed = "status" in data and previous_status != new_status
-        
-        # Add fields to update
-        if "status" in data:
-            update_expression += ", #status = :status"
-            expression_values[":status"] = data["status"]
-            
-            # If status is completed, set completion timestamp
-            if data["status"] == "completed":
-                update_expression += ", completedAt = :completed_at"
-                expression_values[":completed_at"] = timestamp
-        
-        if "message" in data:
-            update_expression += ", message = :message"
-            expression_values[":message"] = data["message"]
-        
-        if "meetupDetails" in data:
-            update_expression += ", meetupDetails = :meetup_details"
-            expression_values[":meetup_details"] = data["meetupDetails"]
+        changes = {field: data[field] for field in UPDATABLE_SWAP_FIELDS if field in data}
+        changes["updatedAt"] = timestamp
+        # If status is completed, set completion timestamp
+        if changes.get("status") == "completed":
+            changes["completedAt"] = timestamp
+        assignments, expression_names, expression_values = DynamoDBUtils.set_assignments(
+            changes, UPDATABLE_SWAP_FIELDS + ("updatedAt", "completedAt")
+        )
+        expression_values[":user_id"] = user_id
         
         update_params = {
             "Key": {"swapId": swap_id},
-            "UpdateExpression": update_expression,
+            "UpdateExpression": "SET " + ", ".join(assignments),
+            # Fails for a missing swap too, since neither attribute exists then
+            "ConditionExpression": "requesterId = :user_id OR ownerId = :user_id",
             "ExpressionAttributeValues": expression_values,
-            "ExpressionAttributeNames": {"#status": "status"},  # status is reserved
-            "ReturnValues": "ALL_NEW"
+            # The previous item tells whether the status changed; the new one is known from the update
+            "ReturnValues": "ALL_OLD"
         }
-        
-        response = table.update_item(**update_params)
-        updated_swap = response.get("Attributes")
-        
-        # Generate system messages for status changes
-        if status_changed and updated_swap:
-            cls._create_status_change_messages(
-                swap_id=swap_id,
-                previous_status=previous_status,
-                new_status=new_status,
-                requester_id=updated_swap.get("requesterId"),
-                owner_id=updated_swap.get("ownerId"),
-                actor_id=user_id,
-                timestamp=timestamp
-            )
-            
-            # Also include message references in response
-            message_refs = MessageRepository.get_messages_reference(swap_id)
-            if message_refs:
-                updated_swap["messages"] = message_refs
-        
-        return updated_swap
+        if expression_names:
+            update_params["ExpressionAttributeNames"] = expression_names
+        
+        try:
+            response = table.update_item(**update_params)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return None, None
+            raise
+        
+        existing = response.get("Attributes", {})
+        return {**existing, **changes}, existing.get("status")
     
     @classmethod
-    def _create_status_change_messages(
-        cls,
-        swap_id: str,
-        previous_status: str,
-        new_status: str,
-        requester_id: str,
-        owner_id: str,
-        actor_id: str,
-        timestamp: str
-    ) -> None:
-        """Create system messages for swap status changes"""
+    def create_status_change_messages(cls, swap: dict, previous_status: Optional[str], actor_id: str) -> None:
+        """
+        Create system messages for a swap status change
+        
+        Args:
+            swap: The swap after the update
+            previous_status: The swap's status before the update
+            actor_id: ID of the user who changed the status
+        """
+        swap_id = swap.get("swapId")
+        new_status = swap.get("status")
+        requester_id = swap.get("requesterId")
+        owner_id = swap.get("ownerId")
+        timestamp = swap.get("updatedAt")
+        
         # Both participants should receive the system message
         recipient_ids = [requester_id, owner_id]
         
@@ -206,65 +254,73 @@ class SwapRepository:
             )
 
     @classmethod
-    def get_swaps_for_listing(cls, listing_id: str) -> List[dict]:
-        """Get all swaps involving a specific listing"""
-        table = dynamodb.Table(cls.TABLE_NAME)
+    def get_swaps_for_listing(cls, listing_id: str, status: str = None) -> List[dict]:
+        """
+        Get all swaps involving a specific listing, optionally only those in one status
+        
+        Queries RequesterListingIndex (partition key: requesterListingId) and
+        OwnerListingIndex (partition key: ownerListingId) at the same time, so
+        only the listing's own swaps are read.
+        """
+        filter_params = {"ExpressionAttributeValues": {":listing_id": listing_id}}
+        if status:
+            filter_params = {
+                "FilterExpression": "#status = :status",
+                "ExpressionAttributeNames": {"#status": "status"},  # status is reserved
+                "ExpressionAttributeValues": {":listing_id": listing_id, ":status": status}
+            }
         
-        # Scan for swaps where this listing is either offered or requested
-        response = table.scan(
-            FilterExpression="requesterListingId = :listing_id OR ownerListingId = :listing_id",
-            ExpressionAttributeValues={":listing_id": listing_id}
+        results = DynamoDBUtils.run_concurrently(
+            functools.partial(
+                cls._query_all,
+                IndexName=index_name,
+                KeyConditionExpression=f"{key_name} = :listing_id",
+                **filter_params
+            )
+            for index_name, key_name in (
+                ("RequesterListingIndex", "requesterListingId"),
+                ("OwnerListingIndex", "ownerListingId")
+            )
         )
         
-        swaps = response.get("Items", [])
-        
-        # Enrich swaps with message information
-        enriched_swaps = []
-        for swap in swaps:
-            swap_id = swap.get("swapId")
-            if swap_id:
-                message_refs = MessageRepository.get_messages_reference(swap_id)
-                if message_refs:
-                    swap["messages"] = message_refs
-            enriched_swaps.append(swap)
-        
-        return enriched_swaps
+        # A listing is on one side of a swap, but dedupe anyway; most recent first
+        unique_swaps = {swap["swapId"]: swap for swaps in results for swap in swaps}
+        return sorted(unique_swaps.values(), key=lambda x: x["createdAt"], reverse=True)
 
     @classmethod
     def get_pending_swaps_for_user(cls, user_id: str) -> List[dict]:
         """Get pending swaps where user needs to take action"""
-        all_swaps = cls.get_swaps_by_user(user_id)
-        
-        # Filter for pending swaps where user is the owner (needs to respond)
-        pending_swaps = [
-            swap for swap in all_swaps
-            if swap.get("status") == "pending" and swap.get("ownerId") == user_id
-        ]
-        
-        # Enrich swaps with message information
-        enriched_swaps = []
-        for swap in pending_swaps:
-            swap_id = swap.get("swapId")
-            if swap_id:
-                message_refs = MessageRepository.get_messages_reference(swap_id)
-                if message_refs:
-                    swap["messages"] = message_refs
-            enriched_swaps.append(swap)
-        
-        return enriched_swaps
+        # Pending swaps where user is the owner (needs to respond)
+        return cls.get_swaps_by_user(user_id, role="owner", status="pending")
 
     @classmethod
-    def delete_swap(cls, swap_id: str, user_id: str) -> bool:
-        """Delete a swap (only if user is the requester and swap is pending)"""
-        table = dynamodb.Table(cls.TABLE_NAME)
-        
-        # First verify the user is the requester and swap is pending
-        existing = cls.get_swap(swap_id)
-        if not existing:
-            return False
+    def delete_swap(cls, swap_id: str, user_id: str) -> Optional[dict]:
+        """
+        Delete a swap (only if user is the requester and swap is pending)
+        
+        Both checks are conditions on the delete, so it takes a single request;
+        the cancellation message is written from the deleted item.
+        
+        Returns:
+            The deleted swap, or None if it was missing, not the user's or no longer pending
+        """
+        table = cls.table()
+        
+        try:
+            response = table.delete_item(
+                Key={"swapId": swap_id},
+                ConditionExpression="requesterId = :user_id AND #status = :pending",
+                ExpressionAttributeNames={"#status": "status"},  # status is reserved
+                ExpressionAttributeValues={":user_id": user_id, ":pending": "pending"},
+                ReturnValues="ALL_OLD"
+            )
+        except ClientError as e:
+            # Missing, not the requester, or no longer pending
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return None
+            raise
         
-        if existing.get("requesterId") != user_id or existing.get("status") != "pending":
-            return False
+        existing = response.get("Attributes", {})
         
         # Create system message about the cancellation
         recipient_ids = [existing.get("requesterId"), existing.get("ownerId")]
@@ -276,9 +332,8 @@ class SwapRepository:
             metadata={
                 "previous_status": existing.get("status"),
                 "actor_id": user_id,
-                "timestamp": datetime.utcnow().isoformat() + "Z"
+                "timestamp": utc_timestamp()
             }
         )
         
-        table.delete_item(Key={"swapId": swap_id})
-        return True
+        return existing
@@ -0,0 +1,80 @@
+# backend/app/db/repos/upload_session_repo.py
+from app.db.dynamodb_client import dynamodb
+from app.db.dynamodb_utils import utc_timestamp
+import time
+import uuid
+from typing import List, Optional
+from botocore.exceptions import ClientError
+
+class UploadSessionRepository:
+    """
+    Tracks direct-to-S3 image uploads for a listing that has not been created yet.
+    
+    A session starts out "pending" when presigned upload URLs are handed out and
+    moves to "committed" (listing created) or "aborted" exactly once.
+    """
+    TABLE_NAME = "UploadSessions"
+    _table = None
+    # Sessions are removed by DynamoDB TTL (expiresAt) this long after their URLs expire
+    SESSION_GRACE_SECONDS = 3600
+
+    @classmethod
+    def table(cls):
+        """Get the table handle, built once per process and reused across requests"""
+        if cls._table is None:
+            cls._table = dynamodb.Table(cls.TABLE_NAME)
+        return cls._table
+
+    @classmethod
+    def create_session(cls, user_id: str, image_keys: List[str], expires_in: int) -> dict:
+        """Create a pending upload session for the given S3 keys"""
+        table = cls.table()
+        
+        session_item = {
+            "sessionId": str(uuid.uuid4()),
+            "userId": user_id,
+            "imageKeys": image_keys,
+            "status": "pending",
+            "createdAt": utc_timestamp(),
+            "expiresAt": int(time.time()) + expires_in + cls.SESSION_GRACE_SECONDS
+        }
+        
+        table.put_item(Item=session_item)
+        return session_item
+
+    @classmethod
+    def get_session(cls, session_id: str) -> Optional[dict]:
+        """Get an upload session by ID"""
+        table = cls.table()
+        
+        response = table.get_item(Key={"sessionId": session_id})
+        return response.get("Item")
+
+    @classmethod
+    def transition(cls, session_id: str, user_id: str, from_status: str, to_status: str) -> bool:
+        """
+        Move a session between states if it belongs to the user and is in the expected state.
+        
+        Returns:
+            True if the transition happened, False if the condition did not hold
+        """
+        table = cls.table()
+        
+        try:
+            table.update_item(
+                Key={"sessionId": session_id},
+                UpdateExpression="SET #status = :to_status, updatedAt = :timestamp",
+                ConditionExpression="userId = :user_id AND #status = :from_status",
+                ExpressionAttributeNames={"#status": "status"},  # status is reserved
+                ExpressionAttributeValues={
+                    ":to_status": to_status,
+                    ":from_status": from_status,
+                    ":user_id": user_id,
+                    ":timestamp": utc_timestamp()
+                }
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            raise
+        return True
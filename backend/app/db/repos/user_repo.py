@@ -1,22 +1,49 @@
 # backend/app/db/repositories/user_repo.py
 from app.db.dynamodb_client import dynamodb
-from datetime import datetime
-from typing import Dict, Optional
+from app.db.dynamodb_utils import BATCH_GET_LIMIT, DynamoDBUtils, utc_timestamp
+from typing import Dict, Iterable, Optional, Tuple
 from botocore.exceptions import ClientError
+from cachetools import TTLCache
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Profile fields a user update may change
+UPDATABLE_USER_FIELDS = ("firstName", "lastName", "phone", "address", "profileImageUrl", "isActive")
+
+# Users known to exist, so repeat existence checks skip DynamoDB entirely.
+# Only positive results are cached; a user that is created right after a miss is found on the next call.
+_existing_users: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_existing_users_lock = threading.Lock()
+
 class UserRepository:
     TABLE_NAME = "Users"
+    _table = None
+    # Attributes of the profile returned to the user themselves
+    PROFILE_ATTRIBUTES: Tuple[str, ...] = (
+        "userId", "email", "firstName", "lastName", "phone", "address",
+        "profileImageUrl", "createdAt", "updatedAt", "isActive"
+    )
+    # Attributes needed to build a public profile
+    PUBLIC_PROFILE_ATTRIBUTES: Tuple[str, ...] = ("userId", "firstName", "lastName", "profileImageUrl", "address")
+    # BatchGetItem accepts at most 100 keys per request
+    BATCH_GET_LIMIT = BATCH_GET_LIMIT
 
     @classmethod
-    def create_user(cls, user_data: dict) -> dict:
-        """Create a new user profile"""
+    def table(cls):
+        """Get the table handle, built once per process and reused across requests"""
+        if cls._table is None:
+            cls._table = dynamodb.Table(cls.TABLE_NAME)
+        return cls._table
+
+    @classmethod
+    def create_user(cls, user_data: dict) -> Optional[dict]:
+        """Create a new user profile; returns None if the user already exists"""
         try:
-            table = dynamodb.Table(cls.TABLE_NAME)
+            table = cls.table()
             
-            timestamp = datetime.utcnow().isoformat() + "Z"
+            timestamp = utc_timestamp()
             
             user_item = {
                 "userId": user_data.get("userId"),  # From Cognito sub
@@ -31,15 +58,16 @@ class UserRepository:
                 "isActive": True
             }
             
-            table.put_item(Item=user_item)
+            # The existence check is a condition on the put, so no read is needed first
+            table.put_item(Item=user_item, ConditionExpression="attribute_not_exists(userId)")
             logger.info(f"Created user: {user_item['userId']}")
             return user_item
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'ConditionalCheckFailedException':
-                logger.error(f"User {user_data.get('userId')} already exists")
-                raise ValueError(f"User {user_data.get('userId')} already exists")
+                logger.info(f"User {user_data.get('userId')} already exists")
+                return None
             elif error_code == 'ResourceNotFoundException':
                 logger.error(f"Table {cls.TABLE_NAME} not found")
                 raise ValueError(f"Table {cls.TABLE_NAME} does not exist")
@@ -51,11 +79,23 @@ class UserRepository:
             raise Exception(f"Failed to create user: {e}")
 
     @classmethod
-    def get_user(cls, user_id: str) -> Optional[dict]:
-        """Get a user profile by ID"""
+    def get_user(cls, user_id: str, attributes: Optional[Iterable[str]] = None) -> Optional[dict]:
+        """
+        Get a user profile by ID
+        
+        Args:
+            user_id: The user ID to fetch
+            attributes: Optional attributes to project; the whole item when omitted
+        """
         try:
-            table = dynamodb.Table(cls.TABLE_NAME)
-            response = table.get_item(Key={"userId": user_id})
+            table = cls.table()
+            get_params = {"Key": {"userId": user_id}}
+            if attributes:
+                # Alias every attribute so reserved words can't break the projection
+                attribute_names = {f"#a{i}": name for i, name in enumerate(attributes)}
+                get_params["ProjectionExpression"] = ", ".join(attribute_names)
+                get_params["ExpressionAttributeNames"] = attribute_names
+            response = table.get_item(**get_params)
             return response.get("Item")
             
         except ClientError as e:
@@ -70,56 +110,75 @@ class UserRepository:
             logger.error(f"Unexpected error getting user {user_id}: {e}")
             raise Exception(f"Failed to get user: {e}")
 
+    @classmethod
+    def user_exists(cls, user_id: str) -> bool:
+        """
+        Check whether a user profile exists without loading the full item.
+        
+        Args:
+            user_id: The user ID to look up
+            
+        Returns:
+            True if the user exists
+        """
+        with _existing_users_lock:
+            if user_id in _existing_users:
+                return True
+        
+        try:
+            table = cls.table()
+            response = table.get_item(Key={"userId": user_id}, ProjectionExpression="userId")
+        except ClientError as e:
+            logger.error(f"Error checking user {user_id}: {e}")
+            raise Exception(f"Failed to check user: {e}")
+        
+        exists = "Item" in response
+        if exists:
+            with _existing_users_lock:
+                _existing_users[user_id] = True
+        return exists
+
     @classmethod
     def update_user(cls, user_id: str, data: dict) -> Optional[dict]:
-        """Update a user profile"""
+        """
+        Update a user profile
+        
+        Only the updatable fields present in data are written, in a single
+        UpdateItem conditioned on the user existing, so nothing is read first.
+        
+        Returns:
+            The updated user, or None if the user doesn't exist
+        """
         try:
-            table = dynamodb.Table(cls.TABLE_NAME)
-            
-            # Check if user exists
-            existing = cls.get_user(user_id)
-            if not existing:
-                return None
+            table = cls.table()
+            timestamp = utc_timestamp()
             
-            timestamp = datetime.utcnow().isoformat() + "Z"
+            # Build update expression from the fields that were sent
+            assignments, expression_names, expression_values = DynamoDBUtils.set_assignments(data, UPDATABLE_USER_FIELDS)
+            assignments.append("updatedAt = :timestamp")
+            expression_values[":timestamp"] = timestamp
             
-            # Build update expression
-            update_expression = "SET updatedAt = :timestamp"
-            expression_values = {":timestamp": timestamp}
+            update_params = {
+                "Key": {"userId": user_id},
+                "UpdateExpression": "SET " + ", ".join(assignments),
+                "ConditionExpression": "attribute_exists(userId)",
+                "ExpressionAttributeValues": expression_values,
+                "ReturnValues": "ALL_NEW"
+            }
+            if expression_names:
+                update_params["ExpressionAttributeNames"] = expression_names
             
-            # Add fields to update
-            if "firstName" in data:
-                update_expression += ", firstName = :first_name"
-                expression_values[":first_name"] = data["firstName"]
-            if "lastName" in data:
-                update_expression += ", lastName = :last_name"
-                expression_values[":last_name"] = data["lastName"]
-            if "phone" in data:
-                update_expression += ", phone = :phone"
-                expression_values[":phone"] = data["phone"]
-            if "address" in data:
-                update_expression += ", address = :address"
-                expression_values[":address"] = data["address"]
-            if "profileImageUrl" in data:
-                update_expression += ", profileImageUrl = :profile_image_url"
-                expression_values[":profile_image_url"] = data["profileImageUrl"]
-            if "isActive" in data:
-                update_expression += ", isActive = :is_active"
-                expression_values[":is_active"] = data["isActive"]
-            
-            response = table.update_item(
-                Key={"userId": user_id},
-                UpdateExpression=update_expression,
-                ExpressionAttributeValues=expression_values,
-                ReturnValues="ALL_NEW"
-            )
+            response = table.update_item(**update_params)
             
             logger.info(f"Updated user: {user_id}")
             return response.get("Attributes")
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            if error_code == 'ResourceNotFoundException':
+            if error_code == 'ConditionalCheckFailedException':
+                # The user doesn't exist
+                return None
+            elif error_code == 'ResourceNotFoundException':
                 logger.error(f"Table {cls.TABLE_NAME} not found")
                 raise ValueError(f"Table {cls.TABLE_NAME} does not exist")
             else:
@@ -131,12 +190,47 @@ class UserRepository:
 
     @classmethod
     def get_user_public_profile(cls, user_id: str) -> Optional[dict]:
-        """Get public user profile (limited fields for privacy)"""
-        user = cls.get_user(user_id)
+        """Get public user profile (limited fields for privacy), reading only the public attributes"""
+        attribute_names = {f"#a{i}": name for i, name in enumerate(cls.PUBLIC_PROFILE_ATTRIBUTES)}
+        try:
+            response = cls.table().get_item(
+                Key={"userId": user_id},
+                ProjectionExpression=", ".join(attribute_names),
+                ExpressionAttributeNames=attribute_names
+            )
+        except ClientError as e:
+            logger.error(f"Error getting public profile for user {user_id}: {e}")
+            raise Exception(f"Failed to get user: {e}")
+        
+        user = response.get("Item")
         if not user:
             return None
         
-        # Return only public fields
+        return cls._to_public_profile(user)
+
+    @classmethod
+    def get_users_batch(cls, user_ids: Iterable[str], attributes: Iterable[str] = PUBLIC_PROFILE_ATTRIBUTES) -> Dict[str, dict]:
+        """
+        Get many users in as few round-trips as possible using BatchGetItem.
+        
+        Args:
+            user_ids: User IDs to fetch (duplicates and empty values are ignored)
+            attributes: Attributes to project; only these are returned
+            
+        Returns:
+            Dict mapping userId to the (projected) user item; missing users are omitted
+        """
+        return DynamoDBUtils.batch_get_items(cls.TABLE_NAME, "userId", user_ids, attributes)
+
+    @classmethod
+    def get_public_profiles_batch(cls, user_ids: Iterable[str]) -> Dict[str, dict]:
+        """Get public profiles for many users, keyed by userId"""
+        users = cls.get_users_batch(user_ids)
+        return {user_id: cls._to_public_profile(user) for user_id, user in users.items()}
+
+    @staticmethod
+    def _to_public_profile(user: dict) -> dict:
+        """Reduce a user item to the fields that are safe to show other users"""
         return {
             "userId": user.get("userId"),
             "firstName": user.get("firstName"),
@@ -0,0 +1,212 @@
+# backend/app/infrastructure/cache.py
+"""
+Redis-backed response cache.
+
+The cache is optional: when REDIS_URL is not configured (or Redis is
+unreachable) every lookup is treated as a miss and writes are dropped,
+so handlers behave exactly as they would without caching.
+"""
+
+import functools
+import hashlib
+import logging
+from decimal import Decimal
+from typing import Any, Callable, Optional, Union
+
+import orjson
+import redis.asyncio as redis
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+
+from app.infrastructure.http_cache import etag_response
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCache:
+    """Thin async wrapper around a pooled Redis connection."""
+
+    def __init__(self, url: Optional[str] = None, max_connections: int = 20):
+        self._url = url
+        self._max_connections = max_connections
+        self._client: Optional[redis.Redis] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a Redis connection is available."""
+        return self._client is not None
+
+    @property
+    def client(self) -> Optional[redis.Redis]:
+        """The underlying Redis client, or None if caching is disabled."""
+        return self._client
+
+    async def connect(self) -> None:
+        """Open the connection pool. Called once from the app lifespan."""
+        if not self._url or self._client is not None:
+            return
+        try:
+            pool = redis.ConnectionPool.from_url(
+                self._url,
+                max_connections=self._max_connections,
+                decode_responses=True
+            )
+            client = redis.Redis(connection_pool=pool)
+            await client.ping()
+            self._client = client
+            logger.info("Connected to Redis cache")
+        except Exception as e:
+            logger.warning("Redis cache unavailable, continuing without it: %s", e)
+            self._client = None
+
+    async def close(self) -> None:
+        """Close the connection pool. Called once from the app lifespan."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a JSON value from the cache, or None on miss/error."""
+        if self._client is None:
+            return None
+        try:
+            value = await self._client.get(key)
+            return orjson.loads(value) if value is not None else None
+        except Exception as e:
+            logger.warning("Cache get failed for %s: %s", key, e)
+            return None
+
+    async def get_raw(self, key: str) -> Optional[str]:
+        """Get a cached JSON document without decoding it, or None on miss/error."""
+        if self._client is None:
+            return None
+        try:
+            return await self._client.get(key)
+        except Exception as e:
+            logger.warning("Cache get failed for %s: %s", key, e)
+            return None
+
+    async def set_raw(self, key: str, value: Union[str, bytes], expire: int) -> None:
+        """Store an already-serialized JSON document with a TTL in seconds."""
+        if self._client is None:
+            return
+        try:
+            await self._client.setex(key, expire, value)
+        except Exception as e:
+            logger.warning("Cache set failed for %s: %s", key, e)
+
+    async def set(self, key: str, value: Any, expire: int) -> None:
+        """Store a JSON-serializable value with a TTL in seconds."""
+        if self._client is None:
+            return
+        try:
+            await self._client.setex(key, expire, orjson.dumps(value).decode())
+        except Exception as e:
+            logger.warning("Cache set failed for %s: %s", key, e)
+
+    async def delete(self, *keys: str) -> None:
+        """Delete one or more keys."""
+        if self._client is None or not keys:
+            return
+        try:
+            await self._client.delete(*keys)
+        except Exception as e:
+            logger.warning("Cache delete failed for %s: %s", keys, e)
+
+    async def delete_pattern(self, pattern: str) -> None:
+        """Delete every key matching a glob pattern (uses SCAN, not KEYS)."""
+        if self._client is None:
+            return
+        try:
+            batch = []
+            async for key in self._client.scan_iter(match=pattern, count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    await self._client.delete(*batch)
+                    batch = []
+            if batch:
+                await self._client.delete(*batch)
+        except Exception as e:
+            logger.warning("Cache delete_pattern failed for %s: %s", pattern, e)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode what orjson can't natively, matching FastAPI's jsonable_encoder."""
+    if isinstance(obj, Decimal):
+        # DynamoDB numbers: whole values become ints, the rest floats
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    return jsonable_encoder(obj)
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize a handler result to JSON bytes in a single orjson pass."""
+    return orjson.dumps(value, default=_json_default)
+
+
+def json_response(value: Any, status_code: int = 200) -> Response:
+    """
+    Return a handler result as JSON without FastAPI's encoder pass.
+
+    Returning a Response skips jsonable_encoder, which otherwise walks every
+    nested dict in Python before ORJSONResponse serializes it again.
+    """
+    return Response(content=dumps(value), status_code=status_code, media_type="application/json")
+
+
+def build_cache_key(prefix: str, params: dict) -> str:
+    """Build a deterministic cache key from a prefix and request parameters."""
+    digest = hashlib.sha1(
+        orjson.dumps(params, option=orjson.OPT_SORT_KEYS, default=str)
+    ).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def cached(prefix: str, expire: int = 60, cache_control: Optional[str] = None) -> Callable:
+    """
+    Cache the JSON-encoded result of an async route handler.
+
+    The result is serialized once and stored as bytes; both hits and misses
+    return it as a raw JSON Response, so FastAPI's encoder never walks the
+    listing dicts. The key is derived from the handler's keyword arguments,
+    so it must be applied below the router decorator:
+
+        @router.get("/")
+        @cached(prefix="listings:list", expire=60)
+        async def list_listings(...): ...
+
+    With cache_control set, a handler that takes a ``request: Request``
+    parameter also gets ETag/Cache-Control headers and answers matching
+    If-None-Match requests with a 304. The request is left out of the key.
+
+    A handler that returns a Response (e.g. json_response for a degraded
+    result) is passed through without being cached.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request = next((v for v in kwargs.values() if isinstance(v, Request)), None)
+            key = build_cache_key(prefix, {k: v for k, v in kwargs.items() if not isinstance(v, Request)})
+
+            body = await cache.get_raw(key)
+            if body is None:
+                result = await func(*args, **kwargs)
+                if isinstance(result, Response):
+                    return result
+                body = dumps(result)
+                await cache.set_raw(key, body, expire)
+            elif isinstance(body, str):
+                body = body.encode()
+
+            if cache_control and request is not None:
+                return etag_response(body, request, cache_control)
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+
+    return decorator
+
+
+# Global cache instance
+cache = RedisCache(settings.redis_url)
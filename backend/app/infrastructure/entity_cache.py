@@ -0,0 +1,127 @@
+# backend/app/infrastructure/entity_cache.py
+"""
+Two-tier cache for items looked up by ID (user profiles, listings).
+
+A short-lived in-process TTLCache (L1) sits in front of Redis (L2). L1 skips
+even the Redis round-trip for the hottest keys; its short TTL bounds how
+long another worker process can serve an item after it was invalidated.
+Without Redis only L1 is used.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import orjson
+from cachetools import TTLCache
+
+from app.infrastructure.cache import cache, dumps
+
+logger = logging.getLogger(__name__)
+
+
+class EntityCache:
+    """Cache for one kind of item, keyed by ID, filled from a batch fetch function."""
+
+    def __init__(self, namespace: str, ttl: int = 60, local_ttl: int = 5, maxsize: int = 10_000):
+        """
+        Args:
+            namespace: Redis key prefix, e.g. "listing"
+            ttl: Redis TTL in seconds
+            local_ttl: In-process TTL in seconds
+            maxsize: Maximum number of items kept in-process
+        """
+        self._namespace = namespace
+        self._ttl = ttl
+        self._local: TTLCache = TTLCache(maxsize=maxsize, ttl=local_ttl)
+        self._lock = threading.Lock()
+
+    def key(self, item_id: str) -> str:
+        """Redis key for an item."""
+        return f"{self._namespace}:{item_id}"
+
+    async def get_many(self, ids: Iterable[str], fetch_many: Callable[[set], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Get items by ID, fetching only the ones neither cache tier has.
+
+        Cached items are JSON round-tripped, so DynamoDB Decimals come back as
+        int/float: use the results for responses, not for writes.
+
+        Args:
+            ids: IDs to look up (empty values are ignored)
+            fetch_many: Blocking function taking a set of IDs and returning {id: item};
+                it runs in a worker thread
+
+        Returns:
+            Dict mapping ID to item; IDs that don't exist are omitted
+        """
+        wanted = {item_id for item_id in ids if item_id}
+        found: Dict[str, Any] = {}
+
+        with self._lock:
+            for item_id in wanted:
+                item = self._local.get(item_id)
+                if item is not None:
+                    found[item_id] = item
+        missing = wanted.difference(found)
+
+        client = cache.client
+        if missing and client is not None:
+            ordered = list(missing)
+            try:
+                raw_items = await client.mget([self.key(item_id) for item_id in ordered])
+            except Exception as e:
+                logger.warning("Entity cache get failed for %s: %s", self._namespace, e)
+                raw_items = [None] * len(ordered)
+            for item_id, raw in zip(ordered, raw_items):
+                if raw is not None:
+                    found[item_id] = orjson.loads(raw)
+            missing = wanted.difference(found)
+
+        if missing:
+            fetched = await asyncio.to_thread(fetch_many, missing)
+            found.update(fetched)
+            await self._store_remote(fetched)
+
+        with self._lock:
+            self._local.update(found)
+        # Hand out copies so callers can't mutate the cached items
+        return {item_id: dict(item) for item_id, item in found.items()}
+
+    async def get(self, item_id: str, fetch_one: Callable[[str], Optional[Any]]) -> Optional[Any]:
+        """Get a single item by ID; see get_many."""
+        def fetch_many(ids: set) -> Dict[str, Any]:
+            item = fetch_one(item_id)
+            return {item_id: item} if item is not None else {}
+
+        return (await self.get_many([item_id], fetch_many)).get(item_id)
+
+    async def invalidate(self, *ids: str) -> None:
+        """Drop items after a write. Other processes may serve their L1 copy for up to local_ttl."""
+        with self._lock:
+            for item_id in ids:
+                self._local.pop(item_id, None)
+        await cache.delete(*(self.key(item_id) for item_id in ids))
+
+    async def _store_remote(self, items: Dict[str, Any]) -> None:
+        client = cache.client
+        if client is None or not items:
+            return
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for item_id, item in items.items():
+                    pipe.setex(self.key(item_id), self._ttl, dumps(item))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Entity cache set failed for %s: %s", self._namespace, e)
+
+    def clear_local(self) -> None:
+        """Empty the in-process tier."""
+        with self._lock:
+            self._local.clear()
+
+
+# Global cache instances
+public_profile_cache = EntityCache("user:profile")
+listing_cache = EntityCache("listing")
@@ -0,0 +1,64 @@
+# backend/app/infrastructure/http_cache.py
+"""
+HTTP caching helpers: ETags, conditional requests and Cache-Control.
+
+These let browsers, CDNs and reverse proxies reuse GET responses, and turn
+a repeat request for unchanged data into a bodiless 304.
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+def compute_etag(payload: bytes) -> str:
+    """Build a strong ETag from a response body (8-byte BLAKE2b digest)."""
+    return f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag, using weak comparison as RFC 9110 requires."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def not_modified(request: Request, etag: str, cache_control: str) -> Optional[Response]:
+    """
+    Answer a conditional request before doing any work for it.
+
+    Args:
+        request: The incoming request, for its If-None-Match header
+        etag: ETag of the current representation
+        cache_control: Cache-Control header value
+
+    Returns:
+        A 304 Not Modified response when the ETag matches, otherwise None
+    """
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+    return None
+
+
+def etag_response(payload: bytes, request: Request, cache_control: str, etag: Optional[str] = None) -> Response:
+    """
+    Return a JSON body with ETag and Cache-Control headers, or a 304 if the client already has it.
+
+    Args:
+        payload: Serialized JSON response body
+        request: The incoming request, for its If-None-Match header
+        cache_control: Cache-Control header value
+        etag: ETag to send; computed from the payload when omitted
+
+    Returns:
+        A 304 Not Modified response when the ETag matches, otherwise the full response
+    """
+    etag = etag or compute_etag(payload)
+    return not_modified(request, etag, cache_control) or Response(
+        content=payload,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": cache_control}
+    )
@@ -0,0 +1,203 @@
+# backend/app/infrastructure/swap_stats.py
+"""
+Per-user swap history index kept in Redis.
+
+For each user, ``swap_counts:{user_id}`` is a hash of status -> number of
+swaps, and ``swaps_by_status:{user_id}:{status}`` is a sorted set of swap
+IDs scored by creation time. The history endpoint reads the counts and
+pages swap IDs from the sorted sets instead of loading and bucketing every
+swap the user was ever part of.
+
+The index is seeded from DynamoDB on a miss and then kept current as swaps
+are created, change status and are deleted. As with the unread counters,
+updates only apply once a user's index is seeded, the index expires so any
+drift is bounded, and everything fails open without Redis.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from app.infrastructure.cache import cache
+
+logger = logging.getLogger(__name__)
+
+SWAP_STATUSES = ("pending", "accepted", "rejected", "completed", "cancelled")
+
+SWAP_STATS_TTL = 3600  # 1 hour
+
+# KEYS[1]: per-user counts hash, KEYS[2..]: per-status sorted sets in SWAP_STATUSES order
+# ARGV: swap id, score, new status ("" to remove the swap), then SWAP_STATUSES
+# A swap is moved out of whichever status set holds it, so replays are no-ops
+MOVE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+local swap_id = ARGV[1]
+local target = nil
+for i = 2, #KEYS do
+    local status = ARGV[i + 2]
+    if status == ARGV[3] then
+        target = i
+    end
+    if redis.call('ZSCORE', KEYS[i], swap_id) then
+        if status == ARGV[3] then
+            return 1
+        end
+        redis.call('ZREM', KEYS[i], swap_id)
+        if tonumber(redis.call('HGET', KEYS[1], status) or '0') > 0 then
+            redis.call('HINCRBY', KEYS[1], status, -1)
+        end
+    end
+end
+if target then
+    redis.call('ZADD', KEYS[target], ARGV[2], swap_id)
+    redis.call('HINCRBY', KEYS[1], ARGV[3], 1)
+    local ttl = redis.call('TTL', KEYS[1])
+    if ttl > 0 then
+        redis.call('EXPIRE', KEYS[target], ttl)
+    end
+end
+return 1
+"""
+
+
+def counts_key(user_id: str) -> str:
+    """Redis hash holding a user's swap counts by status."""
+    return f"swap_counts:{user_id}"
+
+
+def status_key(user_id: str, status: str) -> str:
+    """Redis sorted set holding a user's swap IDs in one status."""
+    return f"swaps_by_status:{user_id}:{status}"
+
+
+def _score(swap: Dict) -> float:
+    """Sort score for a swap: its creation time as a Unix timestamp."""
+    created_at = swap.get("createdAt")
+    if not created_at:
+        return 0.0
+    try:
+        return datetime.fromisoformat(created_at.rstrip("Z")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+class SwapStats:
+    """Swap counts and per-status swap IDs for each user."""
+
+    def __init__(self, ttl: int = SWAP_STATS_TTL):
+        self._ttl = ttl
+        self._script = None
+
+    async def get_counts(self, user_id: str) -> Optional[Dict[str, int]]:
+        """
+        Read a user's swap counts.
+
+        Args:
+            user_id: The ID of the user
+
+        Returns:
+            Dict mapping every status to its count, or None if the user's
+            index is not seeded (or Redis is unavailable)
+        """
+        client = cache.client
+        if client is None:
+            return None
+        try:
+            counts = await client.hgetall(counts_key(user_id))
+        except Exception as e:
+            logger.warning("Failed to read swap counts for %s: %s", user_id, e)
+            return None
+        if not counts:
+            return None
+        return {status: max(int(counts.get(status, 0)), 0) for status in SWAP_STATUSES}
+
+    async def get_swap_ids(
+        self, user_id: str, statuses: Iterable[str], limit: Optional[int] = None
+    ) -> Optional[Dict[str, List[str]]]:
+        """
+        Read a user's most recent swap IDs for each status.
+
+        Args:
+            user_id: The ID of the user
+            statuses: Statuses to read
+            limit: Maximum number of IDs per status; all when omitted
+
+        Returns:
+            Dict mapping each status to swap IDs, newest first, or None on error
+        """
+        client = cache.client
+        if client is None:
+            return None
+        statuses = list(statuses)
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for status in statuses:
+                    pipe.zrevrange(status_key(user_id, status), 0, limit - 1 if limit else -1)
+                results = await pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to read swap IDs for %s: %s", user_id, e)
+            return None
+        return dict(zip(statuses, results))
+
+    async def seed(self, user_id: str, swaps: List[Dict]) -> None:
+        """
+        Replace a user's index with their full swap list from DynamoDB.
+
+        Args:
+            user_id: The ID of the user
+            swaps: Every swap the user is part of
+        """
+        client = cache.client
+        if client is None:
+            return
+        by_status: Dict[str, Dict[str, float]] = {status: {} for status in SWAP_STATUSES}
+        for swap in swaps:
+            status = swap.get("status", "pending")
+            if status in by_status:
+                by_status[status][swap["swapId"]] = _score(swap)
+
+        keys = [counts_key(user_id)] + [status_key(user_id, status) for status in SWAP_STATUSES]
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.delete(*keys)
+                # Every status is written, so a user with no swaps still has a seeded hash
+                pipe.hset(counts_key(user_id), mapping={status: len(ids) for status, ids in by_status.items()})
+                for status, scored_ids in by_status.items():
+                    if scored_ids:
+                        pipe.zadd(status_key(user_id, status), scored_ids)
+                for key in keys:
+                    pipe.expire(key, self._ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to seed swap stats for %s: %s", user_id, e)
+
+    async def _move(self, user_id: str, swap: Dict, new_status: str) -> None:
+        client = cache.client
+        if client is None or not user_id:
+            return
+        try:
+            if self._script is None:
+                self._script = client.register_script(MOVE_SCRIPT)
+            await self._script(
+                keys=[counts_key(user_id)] + [status_key(user_id, status) for status in SWAP_STATUSES],
+                args=[swap["swapId"], _score(swap), new_status, *SWAP_STATUSES]
+            )
+        except Exception as e:
+            logger.warning("Failed to update swap stats for %s: %s", user_id, e)
+
+    async def record(self, swap: Dict) -> None:
+        """Index a created or updated swap under its current status for both participants."""
+        status = swap.get("status", "pending")
+        for user_id in {swap.get("requesterId"), swap.get("ownerId")}:
+            await self._move(user_id, swap, status)
+
+    async def remove(self, swap_id: str, user_ids: Iterable[str]) -> None:
+        """Drop a deleted swap from its participants' indexes."""
+        for user_id in set(user_ids):
+            await self._move(user_id, {"swapId": swap_id}, "")
+
+
+# Global instance
+swap_stats = SwapStats()
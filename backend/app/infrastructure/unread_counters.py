@@ -0,0 +1,166 @@
+# backend/app/infrastructure/unread_counters.py
+"""
+Per-user unread message counters kept in Redis.
+
+Each user has a hash ``unread:{user_id}`` mapping swap IDs to their unread
+count, plus a ``_total`` field. Counting from DynamoDB means scanning the
+Messages table, so the hash is seeded from that count once and then kept
+up to date as messages are sent, read and deleted.
+
+Updates only apply to a seeded hash: while the key is absent the next read
+recounts from DynamoDB, so a missed update never makes a count wrong for
+longer than the hash TTL. Like the response cache, the counters fail open:
+without Redis every read is a miss and updates are dropped.
+"""
+
+import logging
+from typing import Dict, Iterable, Optional
+
+from app.infrastructure.cache import cache
+
+logger = logging.getLogger(__name__)
+
+TOTAL_FIELD = "_total"
+
+# Hashes are rebuilt from DynamoDB at least this often, bounding any drift
+# from updates that raced with seeding
+UNREAD_COUNTERS_TTL = 3600  # 1 hour
+
+# KEYS[1]: per-user hash
+# ARGV: swap id, total field
+INCREMENT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HINCRBY', KEYS[1], ARGV[1], 1)
+redis.call('HINCRBY', KEYS[1], ARGV[2], 1)
+return 1
+"""
+
+# KEYS[1]: per-user hash
+# ARGV: swap id, total field
+# Counts never go below zero, so a duplicate decrement is harmless
+DECREMENT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+local count = tonumber(redis.call('HGET', KEYS[1], ARGV[1]) or '0')
+if count <= 0 then
+    return 1
+end
+if count == 1 then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+else
+    redis.call('HINCRBY', KEYS[1], ARGV[1], -1)
+end
+if tonumber(redis.call('HGET', KEYS[1], ARGV[2]) or '0') > 0 then
+    redis.call('HINCRBY', KEYS[1], ARGV[2], -1)
+end
+return 1
+"""
+
+
+def unread_key(user_id: str) -> str:
+    """Redis hash holding a user's unread counts."""
+    return f"unread:{user_id}"
+
+
+class UnreadCounters:
+    """Incrementally maintained unread message counts, in the shape of UnreadMessageCount."""
+
+    def __init__(self, ttl: int = UNREAD_COUNTERS_TTL):
+        self._ttl = ttl
+        self._scripts = {}
+
+    async def _run(self, source: str, user_id: str, swap_id: str) -> None:
+        client = cache.client
+        if client is None:
+            return
+        try:
+            script = self._scripts.get(source)
+            if script is None:
+                script = self._scripts[source] = client.register_script(source)
+            await script(keys=[unread_key(user_id)], args=[swap_id, TOTAL_FIELD])
+        except Exception as e:
+            logger.warning("Failed to update unread counters for %s: %s", user_id, e)
+
+    async def get(self, user_id: str) -> Optional[Dict]:
+        """
+        Read a user's unread counts.
+
+        Args:
+            user_id: The ID of the user
+
+        Returns:
+            Dict with the total count and per-swap counts, or None if the
+            counters are not seeded (or Redis is unavailable)
+        """
+        client = cache.client
+        if client is None:
+            return None
+        try:
+            counts = await client.hgetall(unread_key(user_id))
+        except Exception as e:
+            logger.warning("Failed to read unread counters for %s: %s", user_id, e)
+            return None
+        if not counts:
+            return None
+
+        total = int(counts.pop(TOTAL_FIELD, 0))
+        swaps = [
+            {"swap_id": swap_id, "count": int(count)}
+            for swap_id, count in counts.items() if int(count) > 0
+        ]
+        return {"count": max(total, 0), "swaps": swaps}
+
+    async def seed(self, user_id: str, unread: Dict) -> None:
+        """
+        Replace a user's counters with a full count from DynamoDB.
+
+        Args:
+            user_id: The ID of the user
+            unread: Result of MessageRepository.count_unread_messages
+        """
+        client = cache.client
+        if client is None:
+            return
+        mapping = {swap["swap_id"]: swap["count"] for swap in unread.get("swaps", [])}
+        # The total field is always present, so a user with nothing unread still has a seeded hash
+        mapping[TOTAL_FIELD] = unread.get("count", 0)
+        key = unread_key(user_id)
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.hset(key, mapping=mapping)
+                pipe.expire(key, self._ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to seed unread counters for %s: %s", user_id, e)
+
+    async def increment(self, user_id: str, swap_id: str) -> None:
+        """Count a new unread message for the recipient."""
+        await self._run(INCREMENT_SCRIPT, user_id, swap_id)
+
+    async def decrement(self, user_id: str, swap_id: str) -> None:
+        """Uncount a message that was read or deleted while unread, never going below zero."""
+        await self._run(DECREMENT_SCRIPT, user_id, swap_id)
+
+    async def invalidate(self, user_ids: Iterable[str]) -> None:
+        """
+        Drop counters so the next read recounts from DynamoDB.
+
+        Used where messages are written outside the messages API, e.g. the
+        system messages created on swap status changes.
+        """
+        client = cache.client
+        keys = [unread_key(user_id) for user_id in user_ids if user_id]
+        if client is None or not keys:
+            return
+        try:
+            await client.delete(*keys)
+        except Exception as e:
+            logger.warning("Failed to invalidate unread counters: %s", e)
+
+
+# Global instance
+unread_counters = UnreadCounters()
@@ -1,5 +1,20 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+# Configure logging before importing modules that log at import time (e.g. the DynamoDB client)
+from core.logging_config import configure_logging
+configure_logging()
+
+from app.infrastructure.cache import cache
+from app.middleware.concurrency_limit import ConcurrencyLimitMiddleware
+from core.config import settings
+from services.auth.jwt_verifier import cognito_jwt_verifier
+from services.s3.s3_client import s3_client
 
 # Routers
 from app.api.routers.auth_router import router as auth_router
@@ -9,13 +24,37 @@ from app.api.routers.swaps_router import router as swaps_router
 from app.api.routers.uploads_router import router as uploads_router
 from app.api.routers.messages_router import router as messages_router
 
-# Core settings (if needed)
-# from core.config import settings
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared connections on startup and release them on shutdown."""
+    # boto3 calls run through asyncio.to_thread; the default pool (cpu count + 4 threads)
+    # would serialize the gathered DynamoDB lookups long before the connection pool fills
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.blocking_io_threads, thread_name_prefix="blocking-io")
+    )
+    await cache.connect()
+    # Building the S3 client loads its service model, which is too slow for the first request
+    await asyncio.gather(
+        asyncio.to_thread(cognito_jwt_verifier.init_keys),
+        asyncio.to_thread(s3_client.warm_up)
+    )
+    yield
+    await cache.close()
 
 app = FastAPI(
     title="Clothing Swap Platform API",
     version="0.1.0",
-    description="API for community clothing swap platform"
+    description="API for community clothing swap platform",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# Per-user concurrency limit; added first so CORS wraps it and 429s still carry CORS headers
+app.add_middleware(
+    ConcurrencyLimitMiddleware,
+    limit=settings.concurrency_limit_per_user,
+    window=settings.concurrency_limit_window,
+    exempt_prefixes=("/auth",)
 )
 
 # CORS middleware
@@ -34,3 +73,22 @@ app.include_router(listings_router, prefix="/listings", tags=["listings"])
 app.include_router(swaps_router, prefix="/swaps", tags=["swaps"])
 app.include_router(uploads_router, prefix="/uploads", tags=["uploads"])
 app.include_router(messages_router, prefix="/messages", tags=["messages"])
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    # uvloop and httptools ship with uvicorn[standard]
+    uvicorn.run(
+        "app.main:app",
+        host=settings.server_host,
+        port=settings.server_port,
+        workers=settings.server_workers,
+        loop=settings.server_loop,
+        http=settings.server_http,
+        backlog=settings.server_backlog,
+        timeout_keep_alive=settings.server_keep_alive_timeout,
+        # Behind the load balancer, so per-IP limits see the client rather than the proxy
+        proxy_headers=settings.server_proxy_headers,
+        forwarded_allow_ips=settings.server_forwarded_allow_ips,
+        log_config=None  # keep the logging set up by configure_logging
+    )
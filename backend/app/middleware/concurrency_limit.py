@@ -0,0 +1,192 @@
+# backend/app/middleware/concurrency_limit.py
+"""
+Per-user concurrent request limiter.
+
+Each in-flight request is tracked as a member of a Redis sorted set keyed
+by the caller, scored by its start time. A single Lua script prunes stale
+entries, registers the new request and checks the set size atomically, so
+concurrent workers never race past the limit. The entry is removed once
+the response has been sent in full.
+
+Like the response cache, the limiter fails open: without Redis every
+request is let through.
+"""
+
+import asyncio
+import hashlib
+import logging
+import secrets
+import time
+from typing import Iterable, Optional
+
+import jwt
+from cachetools import TTLCache
+from fastapi import Request
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.cache import cache
+from services.auth import token_cache
+from services.auth.jwt_verifier import cognito_jwt_verifier
+
+logger = logging.getLogger(__name__)
+
+# Longest a verified token's sub is reused without checking the token again
+VERIFIED_SUB_TTL_SECONDS = 300
+
+# sha256(token) -> (expires_at, sub); only touched from the event loop
+_verified_subs: TTLCache = TTLCache(maxsize=10_000, ttl=VERIFIED_SUB_TTL_SECONDS)
+
+# KEYS[1]: per-user sorted set
+# ARGV: now, window (seconds), limit, request id
+ACQUIRE_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('EXPIRE', key, math.ceil(window))
+if redis.call('ZCARD', key) > tonumber(ARGV[3]) then
+    redis.call('ZREM', key, ARGV[4])
+    return 0
+end
+return 1
+"""
+
+
+async def _verified_sub(token: str) -> Optional[str]:
+    """
+    Get the sub of a bearer token that verifies against the Cognito JWKS.
+
+    The result is kept per token until shortly before it expires, so a
+    token's signature is only checked once. Verification runs off the event
+    loop: a token with an unknown key ID makes the verifier refetch the key
+    set.
+
+    Returns:
+        The token's sub, or None if it doesn't verify
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    entry = _verified_subs.get(key)
+    if entry is not None and entry[0] > time.time():
+        return entry[1]
+
+    try:
+        claims = await asyncio.to_thread(cognito_jwt_verifier.verify_access_token, token)
+    except jwt.PyJWTError:
+        return None
+    sub = claims.get("sub")
+    if sub:
+        _verified_subs[key] = (min(claims["exp"], time.time() + VERIFIED_SUB_TTL_SECONDS), sub)
+    return sub
+
+
+async def _caller_id(request: Request) -> str:
+    """
+    Identify the caller for limiting purposes.
+
+    A request counts against its user only when its bearer token has been
+    validated, either by Cognito (it is in the token cache) or locally
+    against the JWKS; the claims of an unverified token can't pick the
+    bucket, or a client could spread its requests over made-up users or fill
+    someone else's slots. Every other request counts against the client
+    address, which is the real client's behind a trusted proxy (see
+    server_forwarded_allow_ips).
+    """
+    auth_header = request.headers.get("authorization", "")
+    if auth_header.lower().startswith("bearer "):
+        token = auth_header[7:]
+        user_info = token_cache.get_cached(token)
+        user_id = user_info and (user_info.get("sub") or user_info.get("username"))
+        if not user_id:
+            user_id = await _verified_sub(token)
+        if user_id:
+            return f"user:{user_id}"
+    client_host = request.client.host if request.client else "unknown"
+    return f"ip:{client_host}"
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    Reject a caller's requests with 429 while they already have `limit` in flight.
+
+    A plain ASGI middleware rather than BaseHTTPMiddleware: the slot is held
+    until the whole response has been sent, so streamed responses count for
+    as long as their body is still being produced.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limit: int = 20,
+        window: int = 60,
+        exempt_prefixes: Iterable[str] = ("/auth",)
+    ):
+        """
+        Args:
+            app: The ASGI application
+            limit: Maximum concurrent requests per caller
+            window: Seconds after which an entry is considered stale (e.g. a
+                worker died before releasing it)
+            exempt_prefixes: Path prefixes that are never limited
+        """
+        self.app = app
+        self.limit = limit
+        self.window = window
+        self.exempt_prefixes = tuple(exempt_prefixes)
+        self._script = None
+
+    async def _acquire(self, key: str, request_id: str) -> Optional[bool]:
+        """Register the request; returns None when the limiter is unavailable."""
+        client = cache.client
+        if client is None:
+            return None
+        try:
+            if self._script is None:
+                self._script = client.register_script(ACQUIRE_SCRIPT)
+            allowed = await self._script(
+                keys=[key],
+                args=[time.time(), self.window, self.limit, request_id]
+            )
+            return bool(allowed)
+        except Exception as e:
+            logger.warning("Concurrency limiter unavailable, allowing request: %s", e)
+            return None
+
+    async def _release(self, key: str, request_id: str) -> None:
+        client = cache.client
+        if client is None:
+            return
+        try:
+            await client.zrem(key, request_id)
+        except Exception as e:
+            logger.warning("Failed to release concurrency slot for %s: %s", key, e)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        if request.method == "OPTIONS" or request.url.path.startswith(self.exempt_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        key = f"concurrency:{await _caller_id(request)}"
+        request_id = secrets.token_hex(4)
+
+        acquired = await self._acquire(key, request_id)
+        if acquired is False:
+            response = ORJSONResponse(
+                status_code=429,
+                content={"detail": "Too many concurrent requests"}
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            # Returns once the last body chunk is sent, streamed or not
+            await self.app(scope, receive, send)
+        finally:
+            if acquired:
+                await self._release(key, request_id)
@@ -0,0 +1,102 @@
+# backend/app/schemas/listings.py
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from typing import Optional, List, Any
+import orjson
+
+class LocationInput(BaseModel):
+    """A listing location as sent by the client: an address, coordinates, or other place details"""
+    address: Optional[str] = None
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    
+    class Config:
+        extra = "allow"
+
+class CreateListingForm(BaseModel):
+    """Text fields of a create-listing multipart request; location and tags arrive JSON-encoded"""
+    userId: str
+    title: str
+    description: str
+    category: str
+    size: str
+    condition: str
+    zipCode: str
+    location: Optional[LocationInput] = None
+    tags: List[str] = Field(default_factory=list)
+    
+    @field_validator("location", "tags", mode="before")
+    @classmethod
+    def _parse_json(cls, value: Any, info: ValidationInfo) -> Any:
+        """Decode the JSON strings multipart clients send for structured fields"""
+        if not isinstance(value, (str, bytes)):
+            return value
+        if not value.strip():
+            return None if info.field_name == "location" else []
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            raise ValueError(f"Invalid {info.field_name} JSON format")
+
+class UpdateListingRequest(BaseModel):
+    """Schema for updating a listing; only the fields that are sent are changed"""
+    userId: str = Field(..., description="ID of the listing owner, required for authorization")
+    title: Optional[str] = Field(default=None, description="Listing title")
+    description: Optional[str] = Field(default=None, description="Listing description")
+    category: Optional[str] = Field(default=None, description="Clothing category")
+    size: Optional[str] = Field(default=None, description="Clothing size")
+    condition: Optional[str] = Field(default=None, description="Item condition")
+    images: Optional[List[Any]] = Field(default=None, description="Listing images")
+    status: Optional[str] = Field(default=None, description="Listing status")
+    tags: Optional[List[str]] = Field(default=None, description="Search tags")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "userId": "user123",
+                "title": "Updated Blue Jeans",
+                "description": "Updated description",
+                "category": "pants",
+                "size": "L",
+                "condition": "excellent",
+                "status": "active",
+                "tags": ["updated", "tags"]
+            }
+        }
+
+class PresignImageFile(BaseModel):
+    """An image the client is about to upload directly to S3"""
+    filename: str = Field(..., description="Original filename with extension")
+    content_type: str = Field(..., description="MIME type of the image")
+    file_size: Optional[int] = Field(default=None, description="File size in bytes")
+
+class PresignListingImagesRequest(BaseModel):
+    """Schema for requesting presigned upload URLs for a new listing's images"""
+    userId: str = Field(..., description="ID of the user creating the listing")
+    files: List[PresignImageFile] = Field(..., min_length=1, description="Images to upload")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "userId": "user123",
+                "files": [
+                    {"filename": "jeans-front.jpg", "content_type": "image/jpeg", "file_size": 524288}
+                ]
+            }
+        }
+
+class CommitListingRequest(BaseModel):
+    """Schema for creating a listing from images already uploaded through an upload session"""
+    session_id: str = Field(..., description="Upload session returned by /listings/presign")
+    userId: str = Field(..., description="ID of the user creating the listing")
+    title: str
+    description: str
+    category: str
+    size: str
+    condition: str
+    zipCode: str
+    location: Optional[LocationInput] = Field(default=None, description="Either {address} or {lat, lng}")
+    tags: List[str] = Field(default_factory=list)
+    image_keys: Optional[List[str]] = Field(
+        default=None,
+        description="Keys to attach, in display order; defaults to every key in the session"
+    )
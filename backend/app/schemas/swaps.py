@@ -0,0 +1,136 @@
+# backend/app/schemas/swaps.py
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, List, Dict, Any, Literal
+
+class LatestMessage(BaseModel):
+    """Summary of the most recent message in a swap conversation"""
+    content: str = Field(..., description="Content of the message")
+    timestamp: str = Field(..., description="When the message was sent")
+    message_type: str = Field(default="user", description="Type of message (user or system)")
+    event_type: Optional[str] = Field(default=None, description="Type of system event (for system messages)")
+
+class MessagesReference(BaseModel):
+    """Message counts and latest message for a swap"""
+    total_count: int = Field(..., description="Number of messages in the swap")
+    unread_count: int = Field(..., description="Number of unread messages in the swap")
+    latest_message: Optional[LatestMessage] = Field(default=None, description="Most recent message")
+
+class Swap(BaseModel):
+    """A swap as stored in DynamoDB"""
+    swapId: str = Field(..., description="Unique identifier for the swap")
+    requesterId: str = Field(..., description="User who initiated the swap")
+    ownerId: str = Field(..., description="User who owns the requested item")
+    requesterListingId: str = Field(..., description="Listing the requester offers")
+    ownerListingId: str = Field(..., description="Listing the requester wants")
+    status: str = Field(..., description="pending, accepted, rejected, completed or cancelled")
+    message: Optional[str] = Field(default=None, description="Message sent with the request or last update")
+    createdAt: str = Field(..., description="Creation timestamp")
+    updatedAt: Optional[str] = Field(default=None, description="Last update timestamp")
+    completedAt: Optional[str] = Field(default=None, description="Completion timestamp")
+    meetupDetails: Dict[str, Any] = Field(default_factory=dict, description="Meetup preferences or confirmed details")
+
+    class Config:
+        extra = "allow"
+
+class EnrichedSwap(Swap):
+    """A swap with both listings, participant profiles and message counts attached"""
+    requester_listing: Optional[Dict[str, Any]] = Field(default=None, description="Listing the requester offers")
+    owner_listing: Optional[Dict[str, Any]] = Field(default=None, description="Listing the requester wants")
+    requester_info: Optional[Dict[str, Any]] = Field(default=None, description="Requester's public profile")
+    owner_info: Optional[Dict[str, Any]] = Field(default=None, description="Owner's public profile, when included")
+    messages: Optional[MessagesReference] = Field(default=None, description="Message counts and latest message")
+
+class SwapListResponse(BaseModel):
+    """Schema for a filtered list of swaps"""
+    swaps: List[EnrichedSwap]
+    count: int
+    filters_applied: Dict[str, Optional[str]]
+
+class SwapDetailResponse(BaseModel):
+    """Schema for a single swap"""
+    swap: EnrichedSwap
+
+class PendingSwapsResponse(BaseModel):
+    """Schema for the swaps waiting on a user's response"""
+    user_id: str
+    pending_swaps: List[EnrichedSwap]
+    count: int
+
+class SwapStatistics(BaseModel):
+    """Aggregates over all of a user's swaps"""
+    total_swaps: int
+    completed_swaps: int
+    pending_swaps: int
+    success_rate: float = Field(..., description="Percentage of swaps completed")
+
+class SwapHistoryResponse(BaseModel):
+    """Schema for a user's swap history grouped by status"""
+    user_id: str
+    swap_history: Dict[str, List[Swap]]
+    statistics: SwapStatistics
+
+SwapStatus = Literal["pending", "accepted", "rejected", "completed", "cancelled"]
+
+class CreateSwapRequest(BaseModel):
+    """Schema for creating a swap request"""
+    requesterId: str = Field(..., min_length=1, description="User who initiates the swap")
+    ownerId: str = Field(..., min_length=1, description="User who owns the requested item")
+    requesterListingId: str = Field(..., min_length=1, description="Listing the requester offers")
+    ownerListingId: str = Field(..., min_length=1, description="Listing the requester wants")
+    message: str = Field(default="", description="Message to the owner")
+    meetupDetails: Dict[str, Any] = Field(default_factory=dict, description="Meetup preferences")
+    
+    @model_validator(mode="after")
+    def _distinct_users(self) -> "CreateSwapRequest":
+        """A user can't swap with themselves"""
+        if self.requesterId == self.ownerId:
+            raise ValueError("Cannot create swap with yourself")
+        return self
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "requesterId": "user123",
+                "ownerId": "user456",
+                "requesterListingId": "listing123",
+                "ownerListingId": "listing456",
+                "message": "Hi! I'd love to swap my jeans for your sweater.",
+                "meetupDetails": {
+                    "preferredLocation": "Downtown Seattle",
+                    "preferredTime": "Weekend afternoons",
+                    "contactMethod": "email"
+                }
+            }
+        }
+
+class SwapUserRequest(BaseModel):
+    """Schema for a swap action that only identifies the acting user"""
+    userId: str = Field(..., min_length=1, description="ID of the acting user, required for authorization")
+
+class SwapActionRequest(SwapUserRequest):
+    """Schema for rejecting or completing a swap"""
+    message: str = Field(default="", description="Optional message to the other participant")
+
+class AcceptSwapRequest(SwapActionRequest):
+    """Schema for accepting a swap"""
+    meetupDetails: Dict[str, Any] = Field(default_factory=dict, description="Meetup details")
+
+class UpdateSwapRequest(SwapUserRequest):
+    """Schema for updating a swap; only the fields that are sent are changed"""
+    status: Optional[SwapStatus] = Field(default=None, description="New swap status")
+    message: Optional[str] = Field(default=None, description="Message to the other participant")
+    meetupDetails: Optional[Dict[str, Any]] = Field(default=None, description="Meetup details")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "userId": "user123",
+                "status": "accepted",
+                "message": "Great! Let's meet at the coffee shop.",
+                "meetupDetails": {
+                    "confirmedLocation": "Starbucks on Pine St",
+                    "confirmedTime": "Saturday 2pm",
+                    "contactInfo": "555-1234"
+                }
+            }
+        }
@@ -0,0 +1,28 @@
+# backend/app/schemas/uploads.py
+from pydantic import BaseModel, Field
+from typing import Optional, List
+
+# Bounds the work one request can ask for; a listing carries far fewer images
+MAX_BULK_UPLOAD_FILES = 20
+
+class UploadFileInfo(BaseModel):
+    """A file the client is about to upload directly to S3"""
+    filename: str = Field(..., description="Original filename with extension")
+    content_type: Optional[str] = Field(default=None, description="MIME type of the file")
+    file_size: Optional[int] = Field(default=None, description="File size in bytes")
+
+class BulkUploadUrlRequest(BaseModel):
+    """Schema for requesting presigned upload URLs for several files at once"""
+    files: List[UploadFileInfo] = Field(
+        ..., min_length=1, max_length=MAX_BULK_UPLOAD_FILES, description="Files to upload"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "files": [
+                    {"filename": "jeans-front.jpg", "content_type": "image/jpeg", "file_size": 524288},
+                    {"filename": "jeans-back.jpg", "content_type": "image/jpeg", "file_size": 498112}
+                ]
+            }
+        }
@@ -1,7 +1,7 @@
 import os
 from typing import Optional
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import Field, field_validator
 
 
 class Settings(BaseSettings):
@@ -12,20 +12,36 @@ class Settings(BaseSettings):
     aws_secret_access_key: Optional[str] = Field(default=None, env="AWS_SECRET_ACCESS_KEY")
     aws_default_region: str = Field(default="us-east-1", env="AWS_DEFAULT_REGION")
     
+    # DynamoDB Client Configuration
+    dynamodb_max_pool_connections: int = Field(default=128, env="DYNAMODB_MAX_POOL_CONNECTIONS")
+    dynamodb_connect_timeout: float = Field(default=1.0, env="DYNAMODB_CONNECT_TIMEOUT")  # seconds
+    dynamodb_read_timeout: float = Field(default=3.0, env="DYNAMODB_READ_TIMEOUT")  # seconds
+    dynamodb_validate_on_startup: bool = Field(default=False, env="DYNAMODB_VALIDATE_ON_STARTUP")  # ListTables probe at import
+    
     # S3 Configuration
     s3_images_bucket: str = Field(default="swap-platform-images", env="S3_IMAGES_BUCKET")
     s3_web_bucket: str = Field(default="swap-platform-web", env="S3_WEB_BUCKET")
     
     # CloudFront Configuration
     cloudfront_domain: Optional[str] = Field(default=None, env="CLOUDFRONT_DOMAIN")
+    cloudfront_key_pair_id: Optional[str] = Field(default=None, env="CLOUDFRONT_KEY_PAIR_ID")  # set with the key to sign image URLs
+    cloudfront_private_key_path: Optional[str] = Field(default=None, env="CLOUDFRONT_PRIVATE_KEY_PATH")  # PEM file
+    cloudfront_signed_url_window: int = Field(default=86400, env="CLOUDFRONT_SIGNED_URL_WINDOW")  # seconds a signed URL stays identical
     
     # Image Upload Settings
     max_image_size_mb: int = Field(default=5, env="MAX_IMAGE_SIZE_MB")
-    allowed_image_types: list[str] = Field(
-        default=["image/jpeg", "image/png", "image/webp"],
+    allowed_image_types: frozenset[str] = Field(
+        default=frozenset({"image/jpeg", "image/png", "image/webp"}),
         env="ALLOWED_IMAGE_TYPES"
     )
     presigned_url_expiration: int = Field(default=900, env="PRESIGNED_URL_EXPIRATION")  # 15 minutes
+    s3_upload_concurrency: int = Field(default=8, env="S3_UPLOAD_CONCURRENCY")  # parallel uploads per request
+    s3_multipart_chunk_mb: int = Field(default=8, env="S3_MULTIPART_CHUNK_MB")  # multipart threshold and part size
+    s3_multipart_concurrency: int = Field(default=4, env="S3_MULTIPART_CONCURRENCY")  # parallel parts per file
+    s3_upload_spool_mb: int = Field(default=1, env="S3_UPLOAD_SPOOL_MB")  # in-memory buffer before spilling to disk
+    s3_max_pool_connections: int = Field(default=64, env="S3_MAX_POOL_CONNECTIONS")  # >= upload x multipart concurrency
+    s3_validate_on_startup: bool = Field(default=False, env="S3_VALIDATE_ON_STARTUP")  # ListBuckets probe when the client is created
+    multipart_listing_uploads_enabled: bool = Field(default=True, env="MULTIPART_LISTING_UPLOADS_ENABLED")  # legacy POST /listings/
     
     # AWS Cognito Configuration
     cognito_user_pool_id: str = Field(default="us-east-1_el7NpxkRe", env="COGNITO_USER_POOL_ID")
@@ -33,12 +49,57 @@ class Settings(BaseSettings):
     cognito_client_secret: Optional[str] = Field(default=None, env="COGNITO_CLIENT_SECRET")
     cognito_region: str = Field(default="us-east-1", env="COGNITO_REGION")
     cognito_domain: Optional[str] = Field(default=None, env="COGNITO_DOMAIN")
+    cognito_max_pool_connections: int = Field(default=32, env="COGNITO_MAX_POOL_CONNECTIONS")
+    
+    # Geocoder (Nominatim) client limits; the public Nominatim usage policy allows 1 request/second
+    geocoder_qps: float = Field(default=1.0, env="GEOCODER_QPS")
+    geocoder_burst: int = Field(default=1, env="GEOCODER_BURST")
+    geocoder_max_wait: float = Field(default=5.0, env="GEOCODER_MAX_WAIT")  # seconds queued before giving up
+    geocoder_max_retries: int = Field(default=3, env="GEOCODER_MAX_RETRIES")  # on 429/5xx and connection errors
+    
+    # Redis Cache Configuration
+    redis_url: Optional[str] = Field(default=None, env="REDIS_URL")  # e.g. redis://localhost:6379/0
+    listings_cache_ttl: int = Field(default=60, env="LISTINGS_CACHE_TTL")  # seconds
+    
+    # Per-user concurrency limit (requires Redis)
+    concurrency_limit_per_user: int = Field(default=20, env="CONCURRENCY_LIMIT_PER_USER")
+    concurrency_limit_window: int = Field(default=60, env="CONCURRENCY_LIMIT_WINDOW")  # seconds
+    
+    # Server settings, used when running `python -m app.main`
+    server_host: str = Field(default="0.0.0.0", env="SERVER_HOST")
+    server_port: int = Field(default=8000, env="SERVER_PORT")
+    server_workers: int = Field(default=1, env="SERVER_WORKERS")  # worker processes
+    server_loop: str = Field(default="uvloop", env="SERVER_LOOP")  # "asyncio" where uvloop isn't available (Windows)
+    server_http: str = Field(default="httptools", env="SERVER_HTTP")  # "h11" for the pure-Python parser
+    server_backlog: int = Field(default=2048, env="SERVER_BACKLOG")  # pending connections per socket
+    server_keep_alive_timeout: int = Field(default=30, env="SERVER_KEEP_ALIVE_TIMEOUT")  # seconds; keep > load balancer idle timeout
+    server_proxy_headers: bool = Field(default=True, env="SERVER_PROXY_HEADERS")  # take the client address from X-Forwarded-For
+    server_forwarded_allow_ips: str = Field(default="127.0.0.1", env="FORWARDED_ALLOW_IPS")  # proxies trusted for it; the load balancer's addresses or "*"
+    blocking_io_threads: int = Field(default=64, env="BLOCKING_IO_THREADS")  # asyncio.to_thread pool for boto3 calls
     
     # Application Settings
     app_name: str = "Clothing Swap Platform"
     debug: bool = Field(default=False, env="DEBUG")
+    log_level: str = Field(default="INFO", env="LOG_LEVEL")
+    log_json: bool = Field(default=True, env="LOG_JSON")  # structured JSON logs; set false for plain text
     frontend_url: str = Field(default="http://localhost:3000", env="FRONTEND_URL")
     
+    @field_validator("allowed_image_types")
+    @classmethod
+    def _lowercase_image_types(cls, value: frozenset[str]) -> frozenset[str]:
+        """MIME types are case-insensitive; store them lowercased so lookups are a single set check"""
+        return frozenset(content_type.lower() for content_type in value)
+    
+    @property
+    def max_image_size_bytes(self) -> int:
+        """Maximum image upload size in bytes"""
+        return self.max_image_size_mb * 1024 * 1024
+    
+    @property
+    def allowed_image_types_display(self) -> str:
+        """Allowed image types as a stable, comma-separated list for error messages"""
+        return ", ".join(sorted(self.allowed_image_types))
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -0,0 +1,37 @@
+import logging
+import sys
+from datetime import datetime, timezone
+
+import orjson
+
+from core.config import settings
+
+
+class JSONFormatter(logging.Formatter):
+    """Render log records as single-line JSON objects for log aggregation."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+def configure_logging() -> None:
+    """Install a single stdout handler on the root logger."""
+    handler = logging.StreamHandler(sys.stdout)
+    if settings.log_json:
+        handler.setFormatter(JSONFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    logging.basicConfig(
+        level=settings.log_level.upper(),
+        handlers=[handler],
+        force=True
+    )
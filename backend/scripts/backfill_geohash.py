@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Backfill geohash attributes on existing listings.
+
+Location search queries the GeohashIndex GSI, which only contains listings
+that have a geohashPrefix. Listings created before the index existed need
+this one-off backfill to show up in search results.
+
+Usage:
+    python scripts/backfill_geohash.py
+"""
+
+from app.db.dynamodb_utils import DynamoDBUtils
+from app.db.repos.listing_repo import ListingRepository
+
+
+def main():
+    """Main function."""
+    table = ListingRepository.table()
+    # One-off full-table read, so use a parallel scan
+    items = DynamoDBUtils.parallel_scan_items(
+        ListingRepository.TABLE_NAME,
+        projection_expression="listingId, #loc, geohashPrefix",
+        expression_attribute_names={"#loc": "location"}
+    )
+    updated = 0
+
+    for item in items:
+        attributes = ListingRepository.geohash_attributes(item.get("location"))
+        if not attributes or item.get("geohashPrefix") == attributes["geohashPrefix"]:
+            continue
+        table.update_item(
+            Key={"listingId": item["listingId"]},
+            UpdateExpression="SET geohash = :geohash, geohashPrefix = :prefix",
+            ExpressionAttributeValues={":geohash": attributes["geohash"], ":prefix": attributes["geohashPrefix"]}
+        )
+        updated += 1
+
+    print(f"✅ Backfilled geohash on {updated} listings")
+
+
+if __name__ == "__main__":
+    main()
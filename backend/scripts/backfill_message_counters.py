@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Backfill message counters on existing swaps.
+
+Swap lists take each swap's message counts and latest message from the
+messageCount, unreadCount and latestMessage attributes of the swap item.
+Swaps created before those existed fall back to reading all of their
+messages until this one-off backfill has set them.
+
+Usage:
+    python scripts/backfill_message_counters.py
+"""
+
+from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
+
+from app.db.dynamodb_utils import DynamoDBUtils
+from app.db.repos.message_repo import MessageRepository
+from app.db.repos.swap_repo import SwapRepository
+
+
+def main():
+    """Main function."""
+    swaps_table = SwapRepository.table()
+    messages_table = MessageRepository.table()
+    # One-off full-table read, so use a parallel scan
+    swaps = DynamoDBUtils.parallel_scan_items(
+        SwapRepository.TABLE_NAME,
+        filter_expression="attribute_not_exists(messageCount)",
+        projection_expression="swapId"
+    )
+    updated = 0
+
+    for swap in swaps:
+        query_params = {
+            "KeyConditionExpression": Key("swapId").eq(swap["swapId"]),
+            "ProjectionExpression": "messageId, content, #ts, isRead, messageType, eventType",
+            "ExpressionAttributeNames": {"#ts": "timestamp"}
+        }
+        messages = list(DynamoDBUtils.paginate(messages_table.query, query_params))
+        update_expression = "SET messageCount = :count, unreadCount = :unread"
+        expression_values = {
+            ":count": len(messages),
+            ":unread": sum(1 for message in messages if not message.get("isRead", False))
+        }
+        if messages:
+            latest = max(messages, key=lambda message: message["timestamp"])
+            update_expression += ", latestMessage = :latest"
+            expression_values[":latest"] = {
+                "messageId": latest["messageId"],
+                "content": latest["content"],
+                "timestamp": latest["timestamp"],
+                "messageType": latest.get("messageType", "user"),
+                "eventType": latest.get("eventType")
+            }
+
+        try:
+            swaps_table.update_item(
+                Key={"swapId": swap["swapId"]},
+                UpdateExpression=update_expression,
+                # Skip swaps deleted or counted since the scan
+                ConditionExpression="attribute_exists(swapId) AND attribute_not_exists(messageCount)",
+                ExpressionAttributeValues=expression_values
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                continue
+            raise
+        updated += 1
+
+    print(f"✅ Backfilled message counters on {updated} swaps")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Backfill unreadAt attributes on existing unread messages.
+
+Unread counts query the sparse UnreadByRecipientIndex GSI, which only
+contains messages that have an unreadAt. Messages created before the index
+existed need this one-off backfill to be counted.
+
+Usage:
+    python scripts/backfill_unread_index.py
+"""
+
+from botocore.exceptions import ClientError
+
+from app.db.dynamodb_utils import DynamoDBUtils
+from app.db.repos.message_repo import MessageRepository
+
+
+def main():
+    """Main function."""
+    table = MessageRepository.table()
+    # One-off full-table read, so use a parallel scan
+    items = DynamoDBUtils.parallel_scan_items(
+        MessageRepository.TABLE_NAME,
+        filter_expression="isRead = :unread AND attribute_not_exists(unreadAt)",
+        expression_attribute_values={":unread": False},
+        projection_expression="swapId, messageId, #ts",
+        expression_attribute_names={"#ts": "timestamp"}
+    )
+    updated = 0
+
+    for item in items:
+        try:
+            table.update_item(
+                Key={"swapId": item["swapId"], "messageId": item["messageId"]},
+                UpdateExpression="SET unreadAt = :unread_at",
+                ConditionExpression="isRead = :unread",
+                ExpressionAttributeValues={":unread_at": item["timestamp"], ":unread": False}
+            )
+        except ClientError as e:
+            # Read or deleted since the scan
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                continue
+            raise
+        updated += 1
+
+    print(f"✅ Backfilled unreadAt on {updated} messages")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,38 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Dict, Any, Optional
+import asyncio
 from .cognito_service import cognito_service
+from .jwt_verifier import is_token_locally_valid
+from .token_cache import get_cached, validate_with_cache
 
 # Security scheme for Bearer token
 security = HTTPBearer()
 
 
+async def resolve_user_info(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Get user info for an access token, checking the token cache first.
+    
+    Only tokens missing from the cache are verified locally against the
+    JWKS and then looked up in Cognito.
+    
+    Args:
+        token: Bearer access token
+        
+    Returns:
+        User information, or None if the token is invalid
+    """
+    user_info = get_cached(token)
+    if user_info is not None:
+        return user_info
+    
+    # Reject forged or expired tokens locally before calling Cognito
+    if not await asyncio.to_thread(is_token_locally_valid, token):
+        return None
+    return await validate_with_cache(token, cognito_service.get_user_info) or None
+
+
 async def get_cognito_user_info(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
     """
     Dependency to get user info directly from Cognito using access token.
@@ -20,10 +46,7 @@ async def get_cognito_user_info(credentials: HTTPAuthorizationCredentials = Depe
     Raises:
         HTTPException: If token is invalid
     """
-    token = credentials.credentials
-    
-    # Get user info from Cognito
-    user_info = cognito_service.get_user_info(token)
+    user_info = await resolve_user_info(credentials.credentials)
     
     if not user_info:
         raise HTTPException(
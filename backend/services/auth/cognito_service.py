@@ -1,9 +1,13 @@
+import base64
 import boto3
 import json
 import logging
+import requests
 from typing import Dict, Any, Optional
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from core.config import settings
+from .token_cache import invalidate as invalidate_cached_token
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +31,17 @@ class CognitoService:
                 })
             
             session = boto3.Session(**session_kwargs)
+            # Token validation runs on every authenticated request from worker threads, so the
+            # pool must outgrow botocore's default of 10 and keep its TLS connections alive
+            config = Config(
+                retries={'max_attempts': 3, 'mode': 'adaptive'},
+                max_pool_connections=settings.cognito_max_pool_connections,
+                tcp_keepalive=True
+            )
             self._idp_client = session.client(
                 'cognito-idp', 
-                region_name=settings.cognito_region
+                region_name=settings.cognito_region,
+                config=config
             )
         return self._idp_client
     
@@ -262,6 +274,7 @@ class CognitoService:
         """
         try:
             self.client.global_sign_out(AccessToken=access_token)
+            invalidate_cached_token(access_token)
             
             return {
                 'success': True,
@@ -316,9 +329,6 @@ class CognitoService:
             Dictionary with tokens or error information
         """
         try:
-            import requests
-            import base64
-            
             # Prepare token endpoint URL
             token_url = f"https://{settings.cognito_domain}/oauth2/token"
             
@@ -0,0 +1,96 @@
+import logging
+from typing import Any, Dict
+
+import jwt
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# How long the downloaded key set is trusted before it is fetched again.
+# Unknown key IDs (a key rollover) trigger an immediate refetch regardless.
+JWKS_CACHE_SECONDS = 3600
+
+
+class CognitoJwtVerifier:
+    """
+    Verify Cognito access tokens locally against the user pool's cached JWKS.
+    
+    Keys are fetched once and reused, so verifying a token is a local
+    signature check instead of a round trip to Cognito.
+    """
+    
+    def __init__(self, region: str, user_pool_id: str, client_id: str):
+        self.issuer = f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}"
+        self.client_id = client_id
+        self._jwk_client = jwt.PyJWKClient(
+            f"{self.issuer}/.well-known/jwks.json",
+            cache_keys=True,
+            lifespan=JWKS_CACHE_SECONDS,
+            timeout=5
+        )
+    
+    def init_keys(self) -> None:
+        """Fetch the key set ahead of the first request. Failures are logged, not raised."""
+        try:
+            self._jwk_client.get_signing_keys()
+            logger.info("Loaded Cognito JWKS from %s", self.issuer)
+        except jwt.PyJWKClientError as e:
+            logger.warning("Could not preload Cognito JWKS: %s", e)
+    
+    def verify_access_token(self, token: str) -> Dict[str, Any]:
+        """
+        Verify an access token's signature, expiry, issuer and client.
+        
+        Args:
+            token: Cognito access token
+            
+        Returns:
+            The token's claims
+            
+        Raises:
+            jwt.PyJWKClientConnectionError: If the key set could not be fetched
+            jwt.PyJWTError: If the token is invalid
+        """
+        signing_key = self._jwk_client.get_signing_key_from_jwt(token)
+        claims = jwt.decode(
+            token,
+            signing_key.key,
+            algorithms=["RS256"],
+            issuer=self.issuer,
+            options={"require": ["exp", "iat", "sub"]}
+        )
+        
+        if claims.get("token_use") != "access":
+            raise jwt.InvalidTokenError("Token is not an access token")
+        if claims.get("client_id") != self.client_id:
+            raise jwt.InvalidTokenError("Token was issued for a different app client")
+        
+        return claims
+
+
+def is_token_locally_valid(token: str) -> bool:
+    """
+    Check a token against the cached JWKS before any call to Cognito.
+    
+    Returns:
+        False if the token is definitely invalid; True if it verified, or if
+        the key set is unreachable and the caller should defer to Cognito
+    """
+    try:
+        cognito_jwt_verifier.verify_access_token(token)
+        return True
+    except jwt.PyJWKClientConnectionError as e:
+        logger.warning("Cognito JWKS unavailable, deferring to remote validation: %s", e)
+        return True
+    except jwt.PyJWTError as e:
+        logger.info("Rejected access token: %s", e)
+        return False
+
+
+# Global verifier instance
+cognito_jwt_verifier = CognitoJwtVerifier(
+    region=settings.cognito_region,
+    user_pool_id=settings.cognito_user_pool_id,
+    client_id=settings.cognito_client_id
+)
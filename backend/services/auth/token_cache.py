@@ -0,0 +1,100 @@
+import asyncio
+import hashlib
+import threading
+import time
+import logging
+from typing import Any, Callable, Dict, Optional
+
+import jwt
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long a validated token is trusted without asking Cognito again
+TOKEN_CACHE_TTL_SECONDS = 300
+# Stop serving a cached result this many seconds before the token itself expires
+TOKEN_EXPIRY_MARGIN_SECONDS = 30
+
+_cache: TTLCache = TTLCache(maxsize=1000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_lock = threading.Lock()
+
+
+def _token_key(token: str) -> str:
+    """Hash the token so raw credentials are never kept in memory as keys."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _cache_ttl(token: str) -> int:
+    """
+    Get how long a validation result for this token may be cached.
+    
+    The token's `exp` claim is read without verifying the signature; it is
+    only used to make sure a cached entry never outlives the token.
+    
+    Returns:
+        TTL in seconds, or 0 if the result must not be cached
+    """
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return 0
+    
+    exp = claims.get("exp")
+    if not isinstance(exp, (int, float)):
+        return 0
+    
+    remaining = int(exp - time.time()) - TOKEN_EXPIRY_MARGIN_SECONDS
+    return max(0, min(TOKEN_CACHE_TTL_SECONDS, remaining))
+
+
+def get_cached(token: str) -> Optional[Dict[str, Any]]:
+    """Get a cached validation result for a token, if still fresh."""
+    key = _token_key(token)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        expires_at, user_info = entry
+        if expires_at <= time.time():
+            _cache.pop(key, None)
+            return None
+        return user_info
+
+
+def store(token: str, user_info: Dict[str, Any]) -> None:
+    """Cache a successful validation result until near the token's expiry."""
+    ttl = _cache_ttl(token)
+    if ttl <= 0:
+        return
+    with _lock:
+        _cache[_token_key(token)] = (time.time() + ttl, user_info)
+
+
+def invalidate(token: str) -> None:
+    """Drop a token from the cache (e.g. after logout)."""
+    with _lock:
+        _cache.pop(_token_key(token), None)
+
+
+async def validate_with_cache(
+    token: str,
+    validator: Callable[[str], Optional[Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Validate a token, reusing a recent successful result when available.
+    
+    Args:
+        token: Bearer access token
+        validator: Blocking function that validates the token remotely
+        
+    Returns:
+        User information, or a falsy value if the token is invalid
+    """
+    user_info = get_cached(token)
+    if user_info is not None:
+        return user_info
+    
+    user_info = await asyncio.to_thread(validator, token)
+    if user_info:
+        store(token, user_info)
+    return user_info
@@ -0,0 +1,171 @@
+import functools
+import hashlib
+import logging
+import re
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import orjson
+import redis
+from cachetools import TTLCache
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Geocoding results are stable; upstream providers allow caching them for a day
+GEOCODE_CACHE_TTL_SECONDS = 24 * 3600
+GEOCODE_CACHE_KEY_PREFIX = "geocode"
+
+_local_cache: TTLCache = TTLCache(maxsize=10_000, ttl=GEOCODE_CACHE_TTL_SECONDS)
+_local_lock = threading.Lock()
+
+class _InFlight:
+    """An upstream lookup one thread is running that others can wait on."""
+
+    __slots__ = ("done", "result")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[dict] = None
+
+
+# Cache misses currently being fetched, so concurrent lookups of one key make a single upstream call
+_inflight: Dict[str, _InFlight] = {}
+_inflight_lock = threading.Lock()
+
+_redis_client: Optional[redis.Redis] = None
+_redis_lock = threading.Lock()
+_redis_unavailable = False
+
+
+def normalize_address(address: str) -> str:
+    """Lower-case an address and collapse whitespace so equivalent inputs share a key."""
+    return re.sub(r"\s+", " ", address.strip().lower())
+
+
+def normalize_zip_code(zip_code: str) -> str:
+    """Strip a zip code and restore leading zeros dropped by numeric parsing."""
+    zip_code = zip_code.strip()
+    return zip_code.zfill(5) if zip_code.isdigit() else zip_code.upper()
+
+
+def normalize_coordinates(lat: float, lng: float) -> str:
+    """Round coordinates to 5 decimals (~1 m) so nearby lookups share a key."""
+    return f"{round(float(lat), 5)},{round(float(lng), 5)}"
+
+
+def _redis() -> Optional[redis.Redis]:
+    """
+    Shared-cache client, or None when Redis is not configured or unreachable.
+
+    Geocoding runs in worker threads, so this uses a synchronous client rather
+    than the app's async one. A failed connection disables the shared cache
+    for the life of the process instead of retrying on every lookup.
+    """
+    global _redis_client, _redis_unavailable
+    if not settings.redis_url or _redis_unavailable:
+        return None
+    if _redis_client is None:
+        with _redis_lock:
+            if _redis_client is None and not _redis_unavailable:
+                try:
+                    client = redis.Redis.from_url(settings.redis_url, socket_timeout=0.5, decode_responses=True)
+                    client.ping()
+                    _redis_client = client
+                except redis.RedisError as e:
+                    logger.warning("Geocode cache: Redis unavailable, using in-process cache only: %s", e)
+                    _redis_unavailable = True
+    return _redis_client
+
+
+def _get(key: str) -> Optional[Any]:
+    with _local_lock:
+        value = _local_cache.get(key)
+    if value is not None:
+        return value
+
+    client = _redis()
+    if client is None:
+        return None
+    try:
+        raw = client.get(key)
+    except redis.RedisError as e:
+        logger.warning("Geocode cache get failed for %s: %s", key, e)
+        return None
+    if raw is None:
+        return None
+
+    value = orjson.loads(raw)
+    with _local_lock:
+        _local_cache[key] = value
+    return value
+
+
+def _set(key: str, value: Any) -> None:
+    with _local_lock:
+        _local_cache[key] = value
+
+    client = _redis()
+    if client is None:
+        return
+    try:
+        client.setex(key, GEOCODE_CACHE_TTL_SECONDS, orjson.dumps(value))
+    except redis.RedisError as e:
+        logger.warning("Geocode cache set failed for %s: %s", key, e)
+
+
+def geocode_cached(namespace: str, key_func: Callable[..., str]) -> Callable:
+    """
+    Cache a geocoding lookup in-process (L1) and in Redis (L2, when configured).
+
+    Only successful results are cached; a None result (no match, or the
+    upstream request failed) is retried on the next call. Concurrent misses
+    for the same key are coalesced: the first caller fetches, the rest wait
+    for its result instead of each spending a rate-limited upstream request.
+
+    Args:
+        namespace: Distinguishes lookup types that could share an input
+        key_func: Builds the normalized cache input from the call's arguments
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            digest = hashlib.sha1(key_func(*args, **kwargs).encode()).hexdigest()
+            key = f"{GEOCODE_CACHE_KEY_PREFIX}:{namespace}:{digest}"
+
+            # Hand out copies so callers can't mutate the cached entry
+            hit = _get(key)
+            if hit is not None:
+                return dict(hit)
+
+            with _inflight_lock:
+                call = _inflight.get(key)
+                is_leader = call is None
+                if is_leader:
+                    call = _inflight[key] = _InFlight()
+
+            if not is_leader:
+                call.done.wait()
+                return dict(call.result) if call.result is not None else None
+
+            try:
+                result = func(*args, **kwargs)
+                if result is not None:
+                    call.result = dict(result)
+                    _set(key, dict(result))
+                return result
+            finally:
+                with _inflight_lock:
+                    del _inflight[key]
+                call.done.set()
+
+        return wrapper
+
+    return decorator
+
+
+def clear_local_cache() -> None:
+    """Empty the in-process cache."""
+    with _local_lock:
+        _local_cache.clear()
@@ -1,16 +1,80 @@
 import requests
 import logging
+import random
+import time
 from typing import Dict, Optional, Tuple, List
 from core.config import settings
 import math
 from decimal import Decimal
+from .geocode_cache import geocode_cached, normalize_address, normalize_coordinates, normalize_zip_code
+from .rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+NOMINATIM_HEADERS = {
+    'User-Agent': 'ClothingSwapApp/1.0'  # Required by Nominatim
+}
+# Upstream responses worth retrying: throttling and transient gateway errors
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+RETRY_BASE_DELAY = 0.25  # seconds
+RETRY_MAX_DELAY = 4.0  # seconds
+
+# Shared across worker threads so every geocoding call counts against the same budget.
+# Cached lookups return before reaching _nominatim_get and never consume a token.
+_rate_limiter = TokenBucket(settings.geocoder_qps, settings.geocoder_burst)
+_session = requests.Session()
+
+
+def _retry_delay(attempt: int, response: Optional[requests.Response] = None) -> float:
+    """Seconds to wait before a retry: the server's Retry-After if given, else full-jitter backoff."""
+    if response is not None:
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), RETRY_MAX_DELAY)
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt)))
+
+
+def _nominatim_get(url: str, params: Dict, timeout: float) -> requests.Response:
+    """
+    GET a Nominatim endpoint within the client-side rate limit, retrying transient failures.
+
+    Args:
+        url: Nominatim endpoint
+        params: Query parameters
+        timeout: Per-attempt request timeout in seconds
+
+    Returns:
+        The successful response
+
+    Raises:
+        requests.RequestException: If the rate-limit queue is full, the request
+            keeps failing after the configured retries, or returns a non-retryable error
+    """
+    max_retries = settings.geocoder_max_retries
+    for attempt in range(max_retries + 1):
+        if not _rate_limiter.acquire(max_wait=settings.geocoder_max_wait):
+            raise requests.RequestException("Geocoder rate limit exceeded, request not sent")
+        
+        response = None
+        try:
+            response = _session.get(url, params=params, headers=NOMINATIM_HEADERS, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == max_retries:
+                raise
+            logger.warning(f"Geocoding request failed (attempt {attempt + 1}), retrying: {e}")
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == max_retries:
+                response.raise_for_status()
+                return response
+            logger.warning(f"Geocoding request returned {response.status_code} (attempt {attempt + 1}), retrying")
+        
+        time.sleep(_retry_delay(attempt, response))
+
 class GeocodingService:
     """Service for geocoding addresses and calculating distances"""
     
     @staticmethod
+    @geocode_cached("address", lambda address: normalize_address(address))
     def geocode_address(address: str) -> Optional[Dict]:
         """
         Convert an address to latitude/longitude coordinates using a free geocoding service.
@@ -25,12 +89,7 @@ class GeocodingService:
                 'limit': 1,
                 'addressdetails': 1
             }
-            headers = {
-                'User-Agent': 'ClothingSwapApp/1.0'  # Required by Nominatim
-            }
-            
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
+            response = _nominatim_get(url, params, timeout=10)
             
             data = response.json()
             if not data:
@@ -69,12 +128,7 @@ class GeocodingService:
                 'limit': limit,
                 'addressdetails': 1
             }
-            headers = {
-                'User-Agent': 'ClothingSwapApp/1.0'  # Required by Nominatim
-            }
-            
-            response = requests.get(url, params=params, headers=headers, timeout=5)
-            response.raise_for_status()
+            response = _nominatim_get(url, params, timeout=5)
             
             data = response.json()
             suggestions = []
@@ -109,6 +163,7 @@ class GeocodingService:
             return []
     
     @staticmethod
+    @geocode_cached("reverse", normalize_coordinates)
     def reverse_geocode(lat: float, lng: float) -> Optional[Dict]:
         """
         Convert latitude/longitude to address information.
@@ -122,12 +177,7 @@ class GeocodingService:
                 'format': 'json',
                 'addressdetails': 1
             }
-            headers = {
-                'User-Agent': 'ClothingSwapApp/1.0'
-            }
-            
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
+            response = _nominatim_get(url, params, timeout=10)
             
             data = response.json()
             if not data:
@@ -170,12 +220,13 @@ class GeocodingService:
         return c * r
     
     @staticmethod
+    @geocode_cached("zip", lambda zip_code: normalize_zip_code(zip_code))
     def get_zip_code_coordinates(zip_code: str) -> Optional[Dict]:
         """
         Get coordinates for a zip code.
         Returns dict with lat, lng or None if failed.
         """
-        return GeocodingService.geocode_address(f"{zip_code}, USA")
+        return GeocodingService.geocode_address(f"{normalize_zip_code(zip_code)}, USA")
     
     @staticmethod
     def filter_listings_by_distance(
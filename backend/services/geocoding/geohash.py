@@ -0,0 +1,89 @@
+# backend/services/geocoding/geohash.py
+import math
+from typing import Iterator, Set, Tuple
+
+# Standard geohash alphabet (no a, i, l, o)
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+MILES_PER_DEGREE_LAT = 69.0
+
+
+def encode(lat: float, lng: float, precision: int = 6) -> str:
+    """
+    Encode coordinates as a geohash.
+
+    Args:
+        lat: Latitude in degrees
+        lng: Longitude in degrees
+        precision: Number of characters; 4 is ~39x20 km, 6 is ~1.2x0.6 km
+
+    Returns:
+        Geohash string
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    geohash = []
+    bits = 0
+    bit_count = 0
+    even = True  # Bits alternate between longitude and latitude, starting with longitude
+
+    while len(geohash) < precision:
+        value, value_range = (lng, lng_range) if even else (lat, lat_range)
+        mid = (value_range[0] + value_range[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            value_range[0] = mid
+        else:
+            bits <<= 1
+            value_range[1] = mid
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            geohash.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(geohash)
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """Get the (latitude, longitude) span in degrees of a cell at this precision."""
+    total_bits = precision * 5
+    lat_bits = total_bits // 2
+    lng_bits = total_bits - lat_bits
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lng_bits)
+
+
+def _steps(start: float, stop: float, step: float) -> Iterator[float]:
+    """Yield points from start to stop, step apart, always ending on stop."""
+    value = start
+    while value < stop:
+        yield value
+        value += step
+    yield stop
+
+
+def cells_covering(lat: float, lng: float, radius_miles: float, precision: int) -> Set[str]:
+    """
+    Get every geohash cell that intersects the bounding box of a search circle.
+
+    Args:
+        lat: Center latitude
+        lng: Center longitude
+        radius_miles: Search radius
+        precision: Geohash precision of the returned cells
+
+    Returns:
+        Set of geohashes that together cover the whole circle
+    """
+    lat_delta = radius_miles / MILES_PER_DEGREE_LAT
+    lng_delta = min(radius_miles / (MILES_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 0.01)), 180.0)
+    lat_step, lng_step = cell_size(precision)
+
+    cells = set()
+    for cell_lat in _steps(max(lat - lat_delta, -90.0), min(lat + lat_delta, 90.0), lat_step):
+        for cell_lng in _steps(lng - lng_delta, lng + lng_delta, lng_step):
+            # Wrap longitudes that cross the antimeridian
+            wrapped_lng = ((cell_lng + 180.0) % 360.0) - 180.0
+            cells.add(encode(cell_lat, wrapped_lng, precision))
+    return cells
@@ -0,0 +1,51 @@
+# backend/services/geocoding/rate_limiter.py
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for client-side rate limiting.
+
+    Geocoding runs in worker threads, so callers block in acquire() until a
+    token is free. Tokens may go negative: each caller reserves the next free
+    slot under the lock and then sleeps outside it, so waiting callers are
+    spaced out instead of retrying in a burst.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, max_wait: Optional[float] = None) -> bool:
+        """
+        Take a token, sleeping until one is available.
+
+        Args:
+            max_wait: Give up without waiting if the token would take longer than this
+
+        Returns:
+            True once a token was taken, False if it would have exceeded max_wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+
+            wait = (1 - self._tokens) / self._rate if self._tokens < 1 else 0.0
+            if max_wait is not None and wait > max_wait:
+                return False
+            self._tokens -= 1
+
+        if wait > 0:
+            time.sleep(wait)
+        return True
@@ -1,5 +1,11 @@
 import logging
-from typing import List, Optional, Dict, Any
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
+from botocore.signers import CloudFrontSigner
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
 from core.config import settings
 from .s3_client import s3_client
 from .presign_service import PresignService
@@ -7,6 +13,51 @@ from .presign_service import PresignService
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _cloudfront_signer() -> Optional[CloudFrontSigner]:
+    """
+    Build the CloudFront URL signer from the configured key pair.
+    
+    Returns:
+        The signer, or None when no key pair is configured
+    """
+    if not (settings.cloudfront_key_pair_id and settings.cloudfront_private_key_path):
+        return None
+    
+    with open(settings.cloudfront_private_key_path, "rb") as key_file:
+        private_key = serialization.load_pem_private_key(key_file.read(), password=None)
+    
+    def rsa_signer(message: bytes) -> bytes:
+        # CloudFront verifies canned-policy signatures with RSA-SHA1
+        return private_key.sign(message, padding.PKCS1v15(), hashes.SHA1())
+    
+    return CloudFrontSigner(settings.cloudfront_key_pair_id, rsa_signer)
+
+
+def _signed_url_expiry(now: float) -> datetime:
+    """
+    Expiry for a CloudFront signed URL issued at `now`.
+    
+    The expiry is rounded up to the end of the next signing window, so every
+    URL issued within a window is identical and browsers keep hitting the
+    same cached copy; a URL is valid for between one and two windows.
+    """
+    window = settings.cloudfront_signed_url_window
+    return datetime.fromtimestamp((int(now) // window + 2) * window, tz=timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _signed_url(url: str, expires_at: datetime) -> str:
+    """
+    Sign a CloudFront URL with a canned policy.
+    
+    The expiry only changes once per signing window, so listing responses
+    reuse each image's signature instead of doing an RSA signature per image
+    per request.
+    """
+    return _cloudfront_signer().generate_presigned_url(url, date_less_than=expires_at)
+
+
 class ImageService:
     """Service for handling image operations in S3."""
     
@@ -32,7 +83,7 @@ class ImageService:
         """
         # Validate content type if provided
         if content_type and not PresignService.validate_file_type(content_type):
-            allowed_types = ", ".join(settings.allowed_image_types)
+            allowed_types = settings.allowed_image_types_display
             raise ValueError(f"Invalid file type. Allowed types: {allowed_types}")
         
         # Validate file size if provided
@@ -77,38 +128,90 @@ class ImageService:
             return False
     
     @staticmethod
-    def delete_images(keys: List[str]) -> Dict[str, bool]:
+    def delete_images(keys: List[str]) -> Tuple[List[str], List[str]]:
         """
-        Delete multiple images from S3.
+        Delete multiple images from S3 using batched DeleteObjects requests.
         
         Args:
             keys: List of S3 object keys
             
         Returns:
-            Dictionary mapping keys to success status
+            Tuple of (deleted keys, failed keys)
         """
-        results = {}
+        image_keys, failed = [], []
         for key in keys:
-            results[key] = ImageService.delete_image(key)
-        return results
+            if key.startswith("images/"):
+                image_keys.append(key)
+            else:
+                logger.warning(f"Attempted to delete non-image key: {key}")
+                failed.append(key)
+        
+        if not image_keys:
+            return [], failed
+        
+        try:
+            deleted, delete_failed = s3_client.delete_objects(settings.s3_images_bucket, image_keys)
+        except Exception as e:
+            logger.error(f"Error deleting images {image_keys}: {e}")
+            return [], failed + image_keys
+        
+        return deleted, failed + delete_failed
     
     @staticmethod
-    def get_image_url(key: str, use_cloudfront: bool = True) -> str:
+    def get_image_url(key: str, use_cloudfront: bool = True, signed: bool = True) -> str:
         """
         Get the public URL for an image.
         
+        CloudFront URLs are served from the edge cache. When a CloudFront key
+        pair is configured they are signed with a canned policy; the
+        signature only changes once per signing window, and CloudFront
+        leaves the signing parameters out of its cache key, so signed URLs
+        are cached just like unsigned ones.
+        
+        Signed URLs expire, so URLs stored on items must be built with
+        signed=False and signed when a response is built (sign_listing_images).
+        
         Args:
             key: S3 object key
             use_cloudfront: Whether to use CloudFront URL if available
+            signed: Whether to sign CloudFront URLs when a key pair is configured
             
         Returns:
             Public URL for the image
         """
         if use_cloudfront and settings.cloudfront_domain:
-            return f"https://{settings.cloudfront_domain}/{key}"
+            url = f"https://{settings.cloudfront_domain}/{key}"
+            if signed and _cloudfront_signer():
+                return _signed_url(url, _signed_url_expiry(time.time()))
+            return url
         else:
             return f"https://{settings.s3_images_bucket}.s3.{settings.aws_default_region}.amazonaws.com/{key}"
     
+    @staticmethod
+    def sign_listing_images(listing: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Get a listing with its stored image URLs replaced by signed ones.
+        
+        The listing is not modified, since it may be shared through a cache.
+        
+        Args:
+            listing: Listing item whose images hold S3 keys, or None
+            
+        Returns:
+            A copy with signed image URLs, or the listing itself when URL
+            signing is off or it has no images
+        """
+        if not listing or not listing.get("images") or not settings.cloudfront_domain or not _cloudfront_signer():
+            return listing
+        return {
+            **listing,
+            "images": [
+                {**image, "url": ImageService.get_image_url(image["key"])}
+                if isinstance(image, dict) and image.get("key") else image
+                for image in listing["images"]
+            ]
+        }
+    
     @staticmethod
     def image_exists(key: str) -> bool:
         """
@@ -1,13 +1,23 @@
-import uuid
 import logging
+import threading
+import time
 from datetime import datetime
 from typing import Optional, Dict, Any
 from botocore.exceptions import ClientError
+from cachetools import TTLCache
 from core.config import settings
-from .s3_client import s3_client
+from .s3_client import s3_client, build_image_key
 
 logger = logging.getLogger(__name__)
 
+# A presigned GET URL is reused for this share of its lifetime, so a cached URL
+# always has at least the remaining share left when it is handed out
+PRESIGNED_GET_REUSE_FRACTION = 0.8
+
+# (key, expires_in) -> (url, reuse_until); entries are dropped once no longer reusable
+_presigned_get_urls: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_presigned_get_urls_lock = threading.Lock()
+
 
 class PresignService:
     """Service for generating presigned URLs for S3 uploads."""
@@ -31,12 +41,11 @@ class PresignService:
         """
         try:
             # Generate unique key for the file
-            file_extension = filename.split('.')[-1] if '.' in filename else ''
-            unique_key = f"images/{uuid.uuid4()}.{file_extension}" if file_extension else f"images/{uuid.uuid4()}"
+            unique_key = build_image_key(filename)
             
             # Set default max size if not provided
             if max_size_bytes is None:
-                max_size_bytes = settings.max_image_size_mb * 1024 * 1024
+                max_size_bytes = settings.max_image_size_bytes
             
             # Prepare conditions for presigned POST
             conditions = [
@@ -85,6 +94,10 @@ class PresignService:
         """
         Generate a presigned URL for downloading/viewing a file from S3.
         
+        URLs are cached in-process and reused for most of their lifetime, which
+        skips the SigV4 signing and gives every client the same URL for a key,
+        so browsers and CDNs can cache the image under it.
+        
         Args:
             key: S3 object key
             expires_in: URL expiration time in seconds (default: 1 hour)
@@ -92,6 +105,13 @@ class PresignService:
         Returns:
             Presigned GET URL
         """
+        cache_key = (key, expires_in)
+        now = time.time()
+        with _presigned_get_urls_lock:
+            entry = _presigned_get_urls.get(cache_key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        
         try:
             url = s3_client.client.generate_presigned_url(
                 'get_object',
@@ -100,6 +120,8 @@ class PresignService:
             )
             
             logger.info(f"Generated presigned GET URL for {key}")
+            with _presigned_get_urls_lock:
+                _presigned_get_urls[cache_key] = (url, now + expires_in * PRESIGNED_GET_REUSE_FRACTION)
             return url
             
         except ClientError as e:
@@ -117,7 +139,7 @@ class PresignService:
         Returns:
             True if allowed, False otherwise
         """
-        return content_type.lower() in [ct.lower() for ct in settings.allowed_image_types]
+        return content_type.lower() in settings.allowed_image_types
     
     @staticmethod
     def validate_file_size(size_bytes: int) -> bool:
@@ -130,5 +152,4 @@ class PresignService:
         Returns:
             True if within limits, False otherwise
         """
-        max_size = settings.max_image_size_mb * 1024 * 1024
-        return 0 < size_bytes <= max_size
+        return 0 < size_bytes <= settings.max_image_size_bytes
@@ -1,6 +1,10 @@
 import boto3
 import logging
-from typing import Optional
+import threading
+import uuid
+from typing import List, Optional, Tuple
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from core.config import settings
 
@@ -10,17 +14,35 @@ logger = logging.getLogger(__name__)
 class S3Client:
     """AWS S3 client wrapper with credential management."""
     
+    # DeleteObjects accepts at most 1000 keys per request
+    DELETE_OBJECTS_LIMIT = 1000
+    
     def __init__(self):
         self._client = None
         self._session = None
+        self._client_lock = threading.Lock()
+        # Files above the threshold are sent as multipart uploads with parts in parallel
+        self._transfer_config = TransferConfig(
+            multipart_threshold=settings.s3_multipart_chunk_mb * 1024 * 1024,
+            multipart_chunksize=settings.s3_multipart_chunk_mb * 1024 * 1024,
+            max_concurrency=settings.s3_multipart_concurrency,
+            use_threads=True
+        )
     
     @property
     def client(self):
         """Lazy initialization of S3 client with credential detection."""
         if self._client is None:
-            self._client = self._create_client()
+            # Requests run in worker threads; only the first one pays for loading the service model
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
         return self._client
     
+    def warm_up(self) -> None:
+        """Create the client ahead of the first request."""
+        self.client
+    
     def _create_client(self):
         """Create S3 client with automatic credential detection."""
         try:
@@ -39,14 +61,24 @@ class S3Client:
             
             # Create session and client
             session = boto3.Session(**session_kwargs)
-            client = session.client('s3', region_name=settings.aws_default_region)
+            # Concurrent uploads each run several multipart threads, so the pool must be larger than
+            # botocore's default of 10 or connections get discarded and re-handshaked
+            config = Config(
+                retries={'max_attempts': 3, 'mode': 'adaptive'},
+                max_pool_connections=settings.s3_max_pool_connections,
+                tcp_keepalive=True,
+                signature_version='s3v4',
+                s3={'addressing_style': 'virtual'}
+            )
+            client = session.client('s3', region_name=settings.aws_default_region, config=config)
             
-            # Test credentials by listing buckets
-            try:
-                client.list_buckets()
-                logger.info("AWS S3 client initialized successfully")
-            except ClientError as e:
-                logger.warning(f"S3 client created but credentials may be invalid: {e}")
+            # Test credentials by listing buckets; off by default since it is a network round trip
+            if settings.s3_validate_on_startup:
+                try:
+                    client.list_buckets()
+                    logger.info("AWS S3 client initialized successfully")
+                except ClientError as e:
+                    logger.warning(f"S3 client created but credentials may be invalid: {e}")
             
             return client
             
@@ -64,7 +96,11 @@ class S3Client:
             if content_type:
                 extra_args['ContentType'] = content_type
             
-            self.client.upload_fileobj(file_obj, bucket, key, ExtraArgs=extra_args)
+            self.client.upload_fileobj(
+                file_obj, bucket, key,
+                ExtraArgs=extra_args,
+                Config=self._transfer_config
+            )
             logger.info(f"Successfully uploaded {key} to {bucket}")
             return True
             
@@ -83,6 +119,29 @@ class S3Client:
             logger.error(f"Failed to delete {key} from {bucket}: {e}")
             return False
     
+    def delete_objects(self, bucket: str, keys: List[str]) -> Tuple[List[str], List[str]]:
+        """Delete objects from S3 bucket with batched DeleteObjects calls; returns (deleted, failed) keys."""
+        deleted, failed = [], []
+        for start in range(0, len(keys), self.DELETE_OBJECTS_LIMIT):
+            chunk = keys[start:start + self.DELETE_OBJECTS_LIMIT]
+            try:
+                response = self.client.delete_objects(
+                    Bucket=bucket,
+                    Delete={'Objects': [{'Key': key} for key in chunk], 'Quiet': False}
+                )
+            except ClientError as e:
+                logger.error(f"Failed to delete {len(chunk)} objects from {bucket}: {e}")
+                failed.extend(chunk)
+                continue
+            
+            deleted.extend(obj['Key'] for obj in response.get('Deleted', []))
+            for error in response.get('Errors', []):
+                logger.error(f"Failed to delete {error.get('Key')} from {bucket}: {error.get('Message')}")
+                failed.append(error.get('Key'))
+        
+        logger.info(f"Deleted {len(deleted)} of {len(keys)} objects from {bucket}")
+        return deleted, failed
+    
     def object_exists(self, bucket: str, key: str) -> bool:
         """Check if object exists in S3 bucket."""
         try:
@@ -102,5 +161,24 @@ class S3Client:
             return f"https://{bucket}.s3.{settings.aws_default_region}.amazonaws.com/{key}"
 
 
+def build_image_key(filename: str) -> str:
+    """
+    Generate a unique S3 key for an uploaded image.
+    
+    Keys are sharded under a two-character prefix taken from the UUID, so
+    writes spread across S3 prefixes instead of all landing on images/.
+    
+    Args:
+        filename: Original filename, used for its extension
+        
+    Returns:
+        Key of the form images/{uuid[:2]}/{uuid}.{ext}
+    """
+    image_id = str(uuid.uuid4())
+    file_extension = filename.split('.')[-1].lower() if '.' in filename else ''
+    name = f"{image_id}.{file_extension}" if file_extension else image_id
+    return f"images/{image_id[:2]}/{name}"
+
+
 # Global S3 client instance
 s3_client = S3Client()
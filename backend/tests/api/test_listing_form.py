@@ -0,0 +1,135 @@
+# backend/tests/api/test_listing_form.py
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import listing_form
+from app.api.dependencies.listing_form import ListingForm, parse_listing_form
+from core.config import settings
+
+app = FastAPI()
+
+
+@app.post("/listings/")
+async def echo_listing_form(form: ListingForm = Depends(parse_listing_form)):
+    """Echo what the streaming parser extracted"""
+    return {
+        "userId": form.userId,
+        "title": form.title,
+        "tags": form.tags,
+        "location": form.location.model_dump(exclude_none=True) if form.location else None,
+        "images": [
+            {"filename": f.filename, "content_type": f.content_type, "size": f.size, "body": (await f.read()).decode()}
+            for f in form.images
+        ]
+    }
+
+
+client = TestClient(app)
+
+LISTING_FIELDS = {
+    "userId": "user123",
+    "title": "Blue Jeans",
+    "description": "Gently used jeans",
+    "category": "pants",
+    "size": "M",
+    "condition": "good",
+    "zipCode": "12345",
+}
+
+
+class TestParseListingForm:
+    """Tests for the streaming create-listing form parser"""
+
+    def test_fields_and_images_are_parsed(self):
+        """Form values and every image under the same field name are extracted"""
+        response = client.post(
+            "/listings/",
+            data={**LISTING_FIELDS, "tags": '["casual"]', "location": '{"lat": 47.6, "lng": -122.3}'},
+            files=[
+                ("images", ("a.png", b"first", "image/png")),
+                ("images", ("b.jpg", b"second", "image/jpeg")),
+            ],
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["userId"] == "user123"
+        assert body["tags"] == ["casual"]
+        assert body["location"] == {"lat": 47.6, "lng": -122.3}
+        assert body["images"] == [
+            {"filename": "a.png", "content_type": "image/png", "size": 5, "body": "first"},
+            {"filename": "b.jpg", "content_type": "image/jpeg", "size": 6, "body": "second"},
+        ]
+
+    def test_missing_required_fields_are_reported_together(self):
+        """All missing fields are listed in one error"""
+        fields = {k: v for k, v in LISTING_FIELDS.items() if k not in ("title", "zipCode")}
+        response = client.post("/listings/", data=fields, files=[("images", ("a.png", b"x", "image/png"))])
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Missing required fields: title, zipCode"
+
+    def test_invalid_location_json_is_rejected(self):
+        """Malformed JSON in the location field fails validation before the handler runs"""
+        response = client.post(
+            "/listings/",
+            data={**LISTING_FIELDS, "location": "{not json"},
+            files=[("images", ("a.png", b"x", "image/png"))],
+        )
+
+        assert response.status_code == 422
+        assert "Invalid location JSON format" in response.json()["detail"][0]["msg"]
+
+    def test_oversized_image_is_rejected(self, monkeypatch):
+        """An image over the size limit is rejected while parsing"""
+        monkeypatch.setattr(settings, "max_image_size_mb", 0)
+        response = client.post(
+            "/listings/",
+            data=LISTING_FIELDS,
+            files=[("images", ("big.png", b"too big", "image/png"))],
+        )
+
+        assert response.status_code == 400
+        assert "exceeds maximum allowed size" in response.json()["detail"]
+
+    def test_rolled_over_images_are_parsed_off_the_event_loop(self, monkeypatch):
+        """Chunks that write an image past its in-memory spool are parsed in a worker thread"""
+        threaded = []
+        to_thread = asyncio.to_thread
+
+        async def record_to_thread(func, *args):
+            threaded.append(func)
+            return await to_thread(func, *args)
+
+        monkeypatch.setattr(settings, "s3_upload_spool_mb", 0)
+        monkeypatch.setattr(listing_form.asyncio, "to_thread", record_to_thread)
+        response = client.post(
+            "/listings/",
+            data=LISTING_FIELDS,
+            files=[("images", ("a.png", b"on disk", "image/png"))],
+        )
+
+        assert response.status_code == 200
+        assert response.json()["images"][0]["body"] == "on disk"
+        assert threaded
+
+    def test_small_images_are_parsed_inline(self):
+        """Bodies that stay within the spool don't pay for a thread hop"""
+        with patch.object(listing_form.asyncio, "to_thread") as to_thread:
+            response = client.post(
+                "/listings/",
+                data=LISTING_FIELDS,
+                files=[("images", ("a.png", b"in memory", "image/png"))],
+            )
+
+        assert response.status_code == 200
+        to_thread.assert_not_called()
+
+    def test_non_multipart_body_is_rejected(self):
+        response = client.post("/listings/", json=LISTING_FIELDS)
+
+        assert response.status_code == 400
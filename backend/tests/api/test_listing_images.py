@@ -0,0 +1,75 @@
+# backend/tests/api/test_listing_images.py
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.api.routers import listings_router
+from app.schemas.listings import CommitListingRequest
+from core.config import settings
+from services.s3 import image_service
+from services.s3.image_service import ImageService
+
+IMAGE_KEY = "images/ab/ab12.jpg"
+
+
+def enable_signing(monkeypatch, tmp_path):
+    """Configure CloudFront with a throwaway key pair so image URLs are signed"""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    key_path = tmp_path / "cloudfront.pem"
+    key_path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ))
+    monkeypatch.setattr(settings, "cloudfront_domain", "cdn.example.com")
+    monkeypatch.setattr(settings, "cloudfront_key_pair_id", "K2JCJMDEHXQW5F")
+    monkeypatch.setattr(settings, "cloudfront_private_key_path", str(key_path))
+    image_service._cloudfront_signer.cache_clear()
+    image_service._signed_url.cache_clear()
+
+
+class TestListingImageUrls:
+    """Tests for keeping expiring signed URLs out of stored listings"""
+
+    def test_committed_listing_stores_unsigned_urls(self, monkeypatch, tmp_path):
+        """The stored item holds plain URLs while the response gets signed ones"""
+        enable_signing(monkeypatch, tmp_path)
+        request = CommitListingRequest(
+            session_id="session-1", userId="user-1", title="Blue Jeans", description="Gently used",
+            category="pants", size="M", condition="good", zipCode="12345"
+        )
+
+        with patch.object(listings_router, "UploadSessionRepository") as sessions, \
+                patch.object(listings_router, "ListingRepository") as listings, \
+                patch.object(listings_router, "_resolve_location", return_value={}), \
+                patch.object(ImageService, "image_exists", return_value=True), \
+                patch.object(listings_router, "cache") as cache:
+            sessions.get_session.return_value = {"userId": "user-1", "status": "pending", "imageKeys": [IMAGE_KEY]}
+            sessions.transition.return_value = True
+            listings.create_listing.side_effect = lambda data, user_id: {**data, "listingId": "listing-1"}
+            cache.delete_pattern = AsyncMock()
+            response = asyncio.run(listings_router.commit_listing(request))
+
+        stored = listings.create_listing.call_args.args[0]
+        image_service._cloudfront_signer.cache_clear()
+        image_service._signed_url.cache_clear()
+
+        assert stored["images"] == [{"key": IMAGE_KEY, "url": f"https://cdn.example.com/{IMAGE_KEY}"}]
+        assert "Expires=" not in stored["images"][0]["url"] and "Signature=" not in stored["images"][0]["url"]
+        signed_url = response["listing"]["images"][0]["url"]
+        assert signed_url.startswith(f"https://cdn.example.com/{IMAGE_KEY}?Expires=")
+        assert "Signature=" in signed_url
+
+    def test_signing_leaves_the_listing_untouched(self, monkeypatch, tmp_path):
+        """Cached listings are shared, so signing returns a copy"""
+        enable_signing(monkeypatch, tmp_path)
+        listing = {"listingId": "listing-1", "images": [{"key": IMAGE_KEY, "url": f"https://cdn.example.com/{IMAGE_KEY}"}]}
+
+        signed = ImageService.sign_listing_images(listing)
+        image_service._cloudfront_signer.cache_clear()
+        image_service._signed_url.cache_clear()
+
+        assert "Signature=" in signed["images"][0]["url"]
+        assert listing["images"][0]["url"] == f"https://cdn.example.com/{IMAGE_KEY}"
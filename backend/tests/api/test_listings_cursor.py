@@ -0,0 +1,48 @@
+# backend/tests/api/test_listings_cursor.py
+import base64
+
+import orjson
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from app.db.dynamodb_utils import DynamoDBUtils
+from app.main import app
+
+client = TestClient(app)
+
+VALID_KEY = {"listingId": "listing-1", "status": "active", "createdAt": "2025-07-26T12:34:56.789Z"}
+
+
+def make_cursor(value) -> str:
+    """Encode any JSON value the way encode_cursor does"""
+    return base64.urlsafe_b64encode(orjson.dumps(value)).decode()
+
+
+class TestListingsCursor:
+    """Tests for validating the active listings pagination cursor"""
+
+    def test_cursor_round_trips(self):
+        """A cursor built from a real LastEvaluatedKey decodes back to it"""
+        cursor = DynamoDBUtils.encode_cursor(VALID_KEY)
+        with patch("app.api.routers.listings_router.ListingRepository.get_active_listings",
+                   return_value=([], None)) as get_active_listings:
+            response = client.get("/listings/", params={"cursor": cursor})
+
+        assert response.status_code == 200
+        assert get_active_listings.call_args.args[1] == VALID_KEY
+
+    def test_malformed_cursors_are_rejected(self):
+        """Cursors DynamoDB would reject as a start key are a 400, not a 500"""
+        cursors = [
+            "not-base64!",
+            make_cursor(["listingId"]),
+            make_cursor({"listingId": "listing-1"}),
+            make_cursor({**VALID_KEY, "extra": "x"}),
+            make_cursor({**VALID_KEY, "createdAt": 123}),
+        ]
+        with patch("app.api.routers.listings_router.ListingRepository.get_active_listings") as get_active_listings:
+            for cursor in cursors:
+                response = client.get("/listings/", params={"cursor": cursor})
+                assert response.status_code == 400, cursor
+
+        get_active_listings.assert_not_called()
@@ -0,0 +1,91 @@
+# backend/tests/infrastructure/test_cache.py
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import orjson
+
+from app.infrastructure.cache import RedisCache, build_cache_key, cached, dumps, json_response
+
+
+class TestBuildCacheKey:
+    """Tests for deterministic cache key generation"""
+
+    def test_key_is_independent_of_param_order(self):
+        """Same params in a different order produce the same key"""
+        a = build_cache_key("listings:list", {"zip_code": "12345", "category": "shirts"})
+        b = build_cache_key("listings:list", {"category": "shirts", "zip_code": "12345"})
+        assert a == b
+
+    def test_key_differs_by_params(self):
+        """Different params produce different keys"""
+        a = build_cache_key("listings:list", {"zip_code": "12345"})
+        b = build_cache_key("listings:list", {"zip_code": "54321"})
+        assert a != b
+
+    def test_key_uses_prefix(self):
+        """Keys are namespaced by prefix so they can be invalidated by pattern"""
+        assert build_cache_key("listings:list", {}).startswith("listings:list:")
+
+
+class TestDisabledCache:
+    """Without REDIS_URL the cache must be a transparent no-op"""
+
+    def test_disabled_cache_is_a_miss(self):
+        """get returns None and writes are silently dropped"""
+        disabled = RedisCache(url=None)
+
+        async def run():
+            await disabled.connect()
+            await disabled.set("k", {"v": 1}, expire=10)
+            return await disabled.get("k")
+
+        assert disabled.enabled is False
+        assert asyncio.run(run()) is None
+
+    def test_cached_decorator_calls_through(self):
+        """The decorated handler still runs and its result is returned as raw JSON"""
+        calls = []
+
+        @cached(prefix="test", expire=10)
+        async def handler(listing_id: str):
+            calls.append(listing_id)
+            return {"listing_id": listing_id, "price": Decimal("1.5")}
+
+        result = asyncio.run(handler(listing_id="abc"))
+
+        assert calls == ["abc"]
+        assert result.media_type == "application/json"
+        assert orjson.loads(result.body) == {"listing_id": "abc", "price": 1.5}
+
+    def test_returned_response_is_not_cached(self):
+        """A handler returning a Response opts out of caching"""
+        stored = []
+
+        @cached(prefix="test", expire=10)
+        async def handler(user_id: str):
+            return json_response({"stats": {"error": "Could not load user statistics"}})
+
+        with patch("app.infrastructure.cache.cache") as cache:
+            cache.get_raw = AsyncMock(return_value=None)
+            cache.set_raw = AsyncMock(side_effect=lambda *args: stored.append(args))
+            result = asyncio.run(handler(user_id="user-1"))
+
+        assert stored == []
+        assert orjson.loads(result.body) == {"stats": {"error": "Could not load user statistics"}}
+
+
+class TestDumps:
+    """Tests for the single-pass response serializer"""
+
+    def test_decimals_match_fastapi_encoding(self):
+        """Whole DynamoDB numbers become ints and fractional ones floats"""
+        body = dumps({"count": Decimal("3"), "lat": Decimal("47.6062"), "tags": {"denim"}})
+        assert orjson.loads(body) == {"count": 3, "lat": 47.6062, "tags": ["denim"]}
+
+    def test_json_response_skips_the_encoder(self):
+        """json_response serializes nested DynamoDB items directly"""
+        response = json_response({"swaps": [{"price": Decimal("2.50")}]}, status_code=201)
+        assert response.status_code == 201
+        assert response.media_type == "application/json"
+        assert orjson.loads(response.body) == {"swaps": [{"price": 2.5}]}
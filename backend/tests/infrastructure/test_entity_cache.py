@@ -0,0 +1,49 @@
+# backend/tests/infrastructure/test_entity_cache.py
+import asyncio
+
+from app.infrastructure.entity_cache import EntityCache
+
+
+class TestEntityCache:
+    """Without Redis the entity cache falls back to its in-process tier"""
+
+    def test_only_misses_are_fetched(self):
+        entity_cache = EntityCache("test")
+        fetched = []
+
+        def fetch_many(ids):
+            fetched.append(set(ids))
+            return {item_id: {"id": item_id} for item_id in ids if item_id != "missing"}
+
+        async def run():
+            first = await entity_cache.get_many(["a", "b", "missing"], fetch_many)
+            second = await entity_cache.get_many(["a", "c", "missing", None], fetch_many)
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first == {"a": {"id": "a"}, "b": {"id": "b"}}
+        assert second == {"a": {"id": "a"}, "c": {"id": "c"}}
+        # Missing items are not cached, so they are fetched again next time
+        assert fetched == [{"a", "b", "missing"}, {"c", "missing"}]
+
+    def test_invalidate_forces_a_refetch(self):
+        entity_cache = EntityCache("test")
+        versions = iter([{"v": 1}, {"v": 2}])
+
+        async def run():
+            first = await entity_cache.get("a", lambda item_id: next(versions))
+            await entity_cache.invalidate("a")
+            second = await entity_cache.get("a", lambda item_id: next(versions))
+            return first, second
+
+        assert asyncio.run(run()) == ({"v": 1}, {"v": 2})
+
+    def test_callers_get_copies(self):
+        entity_cache = EntityCache("test")
+
+        async def run():
+            (await entity_cache.get("a", lambda item_id: {"v": 1}))["v"] = 99
+            return await entity_cache.get("a", lambda item_id: {"v": 2})
+
+        assert asyncio.run(run()) == {"v": 1}
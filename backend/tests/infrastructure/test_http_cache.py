@@ -0,0 +1,69 @@
+# backend/tests/infrastructure/test_http_cache.py
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.infrastructure.cache import cached
+from app.infrastructure.http_cache import compute_etag, etag_matches, etag_response
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}")
+@cached(prefix="test:items", expire=10, cache_control="public, max-age=60")
+async def get_item(item_id: str, request: Request):
+    return {"item_id": item_id}
+
+
+@app.get("/versioned")
+async def get_versioned(request: Request):
+    return etag_response(b'{"v":1}', request, "private, no-cache", etag='W/"v1"')
+
+
+client = TestClient(app)
+
+
+class TestEtagMatches:
+    """Tests for If-None-Match comparison"""
+
+    def test_weak_and_listed_tags_match(self):
+        etag = compute_etag(b"{}")
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+
+    def test_missing_or_different_tag_does_not_match(self):
+        etag = compute_etag(b"{}")
+        assert not etag_matches(None, etag)
+        assert not etag_matches(compute_etag(b"[]"), etag)
+
+
+class TestCachedEtagResponses:
+    """Cached handlers taking a Request get conditional GET support"""
+
+    def test_response_carries_etag_and_cache_control(self):
+        response = client.get("/items/abc")
+
+        assert response.status_code == 200
+        assert response.json() == {"item_id": "abc"}
+        assert response.headers["cache-control"] == "public, max-age=60"
+        assert response.headers["etag"] == compute_etag(response.content)
+
+    def test_matching_if_none_match_returns_304(self):
+        etag = client.get("/items/abc").headers["etag"]
+
+        response = client.get("/items/abc", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+
+class TestExplicitEtag:
+    """Handlers can supply their own ETag, e.g. a version token"""
+
+    def test_supplied_etag_is_used_and_matched(self):
+        response = client.get("/versioned")
+        assert response.headers["etag"] == 'W/"v1"'
+
+        response = client.get("/versioned", headers={"If-None-Match": 'W/"v1"'})
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "private, no-cache"
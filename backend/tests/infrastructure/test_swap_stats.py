@@ -0,0 +1,299 @@
+# backend/tests/infrastructure/test_swap_stats.py
+import asyncio
+from unittest.mock import patch
+
+import orjson
+
+from app.api.routers import swaps_router
+from app.infrastructure.swap_stats import (
+    MOVE_SCRIPT, SWAP_STATUSES, SwapStats, _score, counts_key, status_key
+)
+
+
+class _Pipeline:
+    """Queues commands and applies them to the fake client on execute."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class _Script:
+    """Records every call and runs it against the fake client."""
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    async def __call__(self, keys, args):
+        self.calls.append((keys, args))
+        return self.client.move(keys, args)
+
+
+class _FakeRedis:
+    """In-memory hashes, sorted sets and TTLs; enough for the swap index."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.zsets = {}
+        self.ttls = {}
+        self.script = None
+
+    async def hgetall(self, key):
+        return {field: str(value) for field, value in self.hashes.get(key, {}).items()}
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+    def register_script(self, source):
+        assert source == MOVE_SCRIPT
+        self.script = _Script(self)
+        return self.script
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.zsets.pop(key, None)
+            self.ttls.pop(key, None)
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def expire(self, key, ttl):
+        self.ttls[key] = ttl
+
+    def zrevrange(self, key, start, end):
+        ids = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1], reverse=True)
+        return [swap_id for swap_id, _ in (ids[start:] if end == -1 else ids[start:end + 1])]
+
+    def move(self, keys, args):
+        """MOVE_SCRIPT, step for step."""
+        counts = self.hashes.get(keys[0])
+        if counts is None:
+            return 0
+        swap_id, score, new_status, statuses = args[0], args[1], args[2], args[3:]
+        target = None
+        for key, status in zip(keys[1:], statuses):
+            if status == new_status:
+                target = key
+            if swap_id in self.zsets.get(key, {}):
+                if status == new_status:
+                    return 1
+                del self.zsets[key][swap_id]
+                if int(counts.get(status, 0)) > 0:
+                    counts[status] = int(counts[status]) - 1
+        if target:
+            self.zsets.setdefault(target, {})[swap_id] = score
+            counts[new_status] = int(counts.get(new_status, 0)) + 1
+            if self.ttls.get(keys[0], 0) > 0:
+                self.ttls[target] = self.ttls[keys[0]]
+        return 1
+
+
+SWAP = {"swapId": "swap-1", "requesterId": "user-1", "ownerId": "user-2", "createdAt": "2025-07-26T12:34:56.789Z"}
+
+
+def run_with(client, coroutine_fn):
+    """Run a coroutine with the fake client behind the global cache"""
+    with patch("app.infrastructure.swap_stats.cache") as cache:
+        cache.client = client
+        return asyncio.run(coroutine_fn())
+
+
+async def _seed_then_count(stats, user_id, swaps):
+    """Seed a user's index and read back their counts"""
+    await stats.seed(user_id, swaps)
+    return await stats.get_counts(user_id)
+
+
+async def _seed_with(client, user_id, swaps):
+    """Seed a user's index in the fake client"""
+    with patch("app.infrastructure.swap_stats.cache") as cache:
+        cache.client = client
+        await SwapStats().seed(user_id, swaps)
+
+
+class TestSwapStats:
+    """Tests for the per-user swap history index"""
+
+    def test_disabled_index_is_a_miss(self):
+        """Without Redis the history endpoint falls back to loading every swap"""
+        stats = SwapStats()
+
+        async def run():
+            return await stats.get_counts("user-1"), await stats.get_swap_ids("user-1", ["pending"])
+
+        assert asyncio.run(run()) == (None, None)
+
+    def test_swaps_are_scored_by_creation_time(self):
+        """Newer swaps score higher so ZREVRANGE returns them first"""
+        older = _score({"createdAt": "2025-07-26T12:34:56.789Z"})
+        newer = _score({"createdAt": "2025-07-27T08:00:00.000Z"})
+        assert newer > older
+        assert _score({}) == 0.0
+
+    def test_seed_writes_every_status_and_expires_every_key(self):
+        """Seeding counts each status, indexes swap IDs and sets the TTL on all keys"""
+        client = _FakeRedis()
+        stats = SwapStats(ttl=120)
+        swaps = [SWAP, {**SWAP, "swapId": "swap-2", "status": "completed"}]
+
+        counts = run_with(client, lambda: _seed_then_count(stats, "user-1", swaps))
+
+        assert counts == {"pending": 1, "accepted": 0, "rejected": 0, "completed": 1, "cancelled": 0}
+        assert client.zsets[status_key("user-1", "completed")] == {"swap-2": _score(SWAP)}
+        keys = [counts_key("user-1")] + [status_key("user-1", status) for status in SWAP_STATUSES]
+        assert all(client.ttls[key] == 120 for key in keys)
+
+    def test_seeded_user_with_no_swaps_is_a_hit(self):
+        """An empty swap list still seeds a hash of zero counts"""
+        client = _FakeRedis()
+        counts = run_with(client, lambda: _seed_then_count(SwapStats(), "user-1", []))
+        assert counts == {status: 0 for status in SWAP_STATUSES}
+
+    def test_move_passes_keys_and_args_in_status_order(self):
+        """The script gets the counts hash, then one sorted set and one status arg per SWAP_STATUSES entry"""
+        client = _FakeRedis()
+        stats = SwapStats()
+
+        async def run():
+            await stats.seed("user-1", [])
+            await stats._move("user-1", SWAP, "accepted")
+
+        run_with(client, run)
+
+        keys, args = client.script.calls[0]
+        assert keys == [counts_key("user-1")] + [status_key("user-1", status) for status in SWAP_STATUSES]
+        assert args == ["swap-1", _score(SWAP), "accepted", *SWAP_STATUSES]
+
+    def test_unseeded_user_is_not_updated(self):
+        """Moves only apply once the user's index is seeded"""
+        client = _FakeRedis()
+        run_with(client, lambda: SwapStats().record(SWAP))
+        assert client.hashes == {} and client.zsets == {}
+
+    def test_replayed_move_is_a_no_op(self):
+        """Recording the same status twice counts the swap once"""
+        client = _FakeRedis()
+        stats = SwapStats()
+
+        async def run():
+            await stats.seed("user-1", [])
+            await stats.record(SWAP)
+            await stats.record(SWAP)
+            return await stats.get_counts("user-1")
+
+        counts = run_with(client, run)
+        assert counts["pending"] == 1
+        assert client.zsets[status_key("user-1", "pending")] == {"swap-1": _score(SWAP)}
+
+    def test_status_change_moves_swap_and_copies_ttl(self):
+        """A swap leaves its old status set and takes the hash's TTL into the new one"""
+        client = _FakeRedis()
+        stats = SwapStats(ttl=90)
+
+        async def run():
+            await stats.seed("user-1", [SWAP])
+            client.ttls.pop(status_key("user-1", "accepted"))
+            await stats.record({**SWAP, "status": "accepted"})
+            return await stats.get_counts("user-1")
+
+        counts = run_with(client, run)
+        assert counts["pending"] == 0 and counts["accepted"] == 1
+        assert "swap-1" not in client.zsets[status_key("user-1", "pending")]
+        assert client.ttls[status_key("user-1", "accepted")] == 90
+
+    def test_counts_never_go_below_zero(self):
+        """A drifted zero count stays at zero when its swap moves out"""
+        client = _FakeRedis()
+        stats = SwapStats()
+
+        async def run():
+            await stats.seed("user-1", [SWAP])
+            client.hashes[counts_key("user-1")]["pending"] = 0
+            await stats.record({**SWAP, "status": "completed"})
+            return await stats.get_counts("user-1")
+
+        counts = run_with(client, run)
+        assert counts["pending"] == 0 and counts["completed"] == 1
+
+    def test_remove_drops_swap_from_every_status(self):
+        """Removing with an empty status decrements and indexes nowhere"""
+        client = _FakeRedis()
+        stats = SwapStats()
+
+        async def run():
+            await stats.seed("user-1", [SWAP])
+            await stats.seed("user-2", [SWAP])
+            await stats.remove("swap-1", ["user-1", "user-2"])
+            return await stats.get_counts("user-1"), await stats.get_counts("user-2")
+
+        for counts in run_with(client, run):
+            assert counts == {status: 0 for status in SWAP_STATUSES}
+        assert all("swap-1" not in ids for ids in client.zsets.values())
+        assert {call[1][2] for call in client.script.calls} == {""}
+
+
+class TestSwapHistory:
+    """Tests for the history endpoint's use of the swap index"""
+
+    def run_history(self, client, **params):
+        with patch("app.infrastructure.swap_stats.cache") as cache, \
+                patch.object(swaps_router, "UserRepository") as users, \
+                patch.object(swaps_router, "SwapRepository") as swaps:
+            cache.client = client
+            users.user_exists.return_value = True
+            swaps.get_swaps_by_user.return_value = [SWAP, {**SWAP, "swapId": "swap-2", "status": "completed"}]
+            swaps.get_swaps_batch.side_effect = lambda ids: {
+                swap_id: {**SWAP, "swapId": swap_id} for swap_id in ids
+            }
+            response = asyncio.run(swaps_router.get_user_swap_history(
+                "user-1", include=params.get("include"), limit=params.get("limit")
+            ))
+            return orjson.loads(response.body), swaps
+
+    def test_unseeded_history_loads_every_swap_and_seeds(self):
+        """A miss reads every swap from DynamoDB and seeds the index for the next request"""
+        client = _FakeRedis()
+        body, swaps = self.run_history(client, include="pending,completed")
+
+        swaps.get_swaps_by_user.assert_called_once_with("user-1")
+        swaps.get_swaps_batch.assert_not_called()
+        assert [swap["swapId"] for swap in body["swap_history"]["completed"]] == ["swap-2"]
+        assert body["statistics"] == {
+            "total_swaps": 2, "completed_swaps": 1, "pending_swaps": 1, "success_rate": 50.0
+        }
+        assert client.hashes[counts_key("user-1")]["completed"] == 1
+
+    def test_seeded_history_loads_only_requested_swaps(self):
+        """A hit pages swap IDs from the index and batch-gets only those"""
+        client = _FakeRedis()
+        asyncio.run(_seed_with(client, "user-1", [
+            SWAP,
+            {**SWAP, "swapId": "swap-2", "status": "completed", "createdAt": "2025-07-27T08:00:00.000Z"},
+            {**SWAP, "swapId": "swap-3", "status": "completed"}
+        ]))
+
+        body, swaps = self.run_history(client, include="completed", limit=1)
+
+        swaps.get_swaps_by_user.assert_not_called()
+        swaps.get_swaps_batch.assert_called_once_with(["swap-2"])
+        assert list(body["swap_history"]) == ["completed"]
+        assert [swap["swapId"] for swap in body["swap_history"]["completed"]] == ["swap-2"]
+        assert body["statistics"]["total_swaps"] == 3
+        assert body["statistics"]["completed_swaps"] == 2
@@ -0,0 +1,49 @@
+# backend/tests/infrastructure/test_unread_counters.py
+import asyncio
+from unittest.mock import patch
+
+from app.infrastructure.unread_counters import TOTAL_FIELD, UnreadCounters
+
+
+class _HashClient:
+    """Just enough of a Redis client to serve HGETALL."""
+
+    def __init__(self, hashes):
+        self.hashes = hashes
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+class TestUnreadCounters:
+    """Tests for reading the per-user unread hash"""
+
+    def test_disabled_counters_are_a_miss(self):
+        """Without Redis every read falls back to the full count"""
+        counters = UnreadCounters()
+        assert asyncio.run(counters.get("user-1")) is None
+
+    def test_absent_hash_is_a_miss(self):
+        """An unseeded user is a miss rather than zero unread"""
+        with patch("app.infrastructure.unread_counters.cache") as cache:
+            cache.client = _HashClient({})
+            assert asyncio.run(UnreadCounters().get("user-1")) is None
+
+    def test_hash_is_returned_as_unread_count(self):
+        """The total field becomes count and swaps with nothing unread are dropped"""
+        hashes = {"unread:user-1": {TOTAL_FIELD: "3", "swap-a": "2", "swap-b": "1", "swap-c": "0"}}
+        with patch("app.infrastructure.unread_counters.cache") as cache:
+            cache.client = _HashClient(hashes)
+            result = asyncio.run(UnreadCounters().get("user-1"))
+
+        assert result["count"] == 3
+        assert sorted(result["swaps"], key=lambda swap: swap["swap_id"]) == [
+            {"swap_id": "swap-a", "count": 2},
+            {"swap_id": "swap-b", "count": 1}
+        ]
+
+    def test_seeded_user_with_nothing_unread(self):
+        """A hash holding only the total is a hit with zero unread"""
+        with patch("app.infrastructure.unread_counters.cache") as cache:
+            cache.client = _HashClient({"unread:user-1": {TOTAL_FIELD: "0"}})
+            assert asyncio.run(UnreadCounters().get("user-1")) == {"count": 0, "swaps": []}
@@ -0,0 +1,86 @@
+# backend/tests/middleware/test_concurrency_limit.py
+import asyncio
+import time
+
+import jwt
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from app.middleware import concurrency_limit
+from app.middleware.concurrency_limit import ConcurrencyLimitMiddleware, _caller_id
+from services.auth import token_cache
+
+
+def _request(token=None):
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return Request({"type": "http", "headers": headers, "client": ("10.0.0.1", 1234)})
+
+
+class TestCallerId:
+    """Tests for choosing the bucket a request counts against"""
+
+    def test_unverified_token_counts_against_the_address(self):
+        """The sub of a token that fails verification can't pick the bucket"""
+        forged = jwt.encode({"sub": "victim"}, "not-the-key", algorithm="HS256")
+        with patch.object(concurrency_limit.cognito_jwt_verifier, "verify_access_token",
+                          side_effect=jwt.InvalidSignatureError("bad signature")):
+            assert asyncio.run(_caller_id(_request(forged))) == "ip:10.0.0.1"
+
+    def test_cached_token_counts_against_the_user(self):
+        with patch.object(token_cache, "get_cached", return_value={"sub": "user-1"}), \
+                patch.object(concurrency_limit.cognito_jwt_verifier, "verify_access_token") as verify:
+            assert asyncio.run(_caller_id(_request("validated-token"))) == "user:user-1"
+        verify.assert_not_called()
+
+    def test_locally_verified_token_counts_against_the_user(self):
+        """A valid token never seen by /auth is verified once, then its sub is reused"""
+        token = jwt.encode({"sub": "user-2", "exp": int(time.time()) + 3600}, "secret", algorithm="HS256")
+        claims = {"sub": "user-2", "exp": int(time.time()) + 3600}
+        with patch.object(concurrency_limit.cognito_jwt_verifier, "verify_access_token",
+                          return_value=claims) as verify:
+            first = asyncio.run(_caller_id(_request(token)))
+            second = asyncio.run(_caller_id(_request(token)))
+
+        assert first == second == "user:user-2"
+        verify.assert_called_once_with(token)
+
+
+class _SlotClient:
+    """Just enough of a Redis client to grant slots and record releases."""
+
+    def __init__(self, events):
+        self.events = events
+
+    def register_script(self, source):
+        async def script(keys, args):
+            self.events.append("acquire")
+            return 1
+        return script
+
+    async def zrem(self, key, member):
+        self.events.append("release")
+
+
+class TestSlotRelease:
+    """The slot is held until a streamed body has been sent"""
+
+    def test_streamed_body_is_produced_before_release(self):
+        events = []
+        app = FastAPI()
+        app.add_middleware(ConcurrencyLimitMiddleware, limit=1)
+
+        @app.get("/stream")
+        async def stream():
+            async def body():
+                events.append("body")
+                yield b"data"
+            return StreamingResponse(body())
+
+        with patch("app.middleware.concurrency_limit.cache") as cache:
+            cache.client = _SlotClient(events)
+            response = TestClient(app).get("/stream")
+
+        assert response.content == b"data"
+        assert events == ["acquire", "body", "release"]
@@ -0,0 +1,55 @@
+# backend/tests/services/test_auth_dependencies.py
+import asyncio
+import time
+import uuid
+from unittest.mock import patch
+
+import jwt
+
+from services.auth import auth_dependencies, token_cache
+
+
+def make_token(expires_in: int) -> str:
+    """Build a unique JWT with the given lifetime"""
+    return jwt.encode({"sub": str(uuid.uuid4()), "exp": int(time.time()) + expires_in}, "secret", algorithm="HS256")
+
+
+class TestResolveUserInfo:
+    """Tests for token-cache-first user lookup"""
+
+    def test_cached_token_skips_local_verification(self):
+        """A token cache hit neither verifies the JWT nor calls Cognito"""
+        token = make_token(3600)
+        token_cache.store(token, {"username": "user123"})
+
+        with patch.object(auth_dependencies, "is_token_locally_valid") as local_check, \
+                patch.object(auth_dependencies.cognito_service, "get_user_info") as get_user_info:
+            user_info = asyncio.run(auth_dependencies.resolve_user_info(token))
+
+        assert user_info == {"username": "user123"}
+        local_check.assert_not_called()
+        get_user_info.assert_not_called()
+
+    def test_locally_invalid_token_never_reaches_cognito(self):
+        """An uncached token that fails local verification is rejected"""
+        token = make_token(3600)
+
+        with patch.object(auth_dependencies, "is_token_locally_valid", return_value=False), \
+                patch.object(auth_dependencies.cognito_service, "get_user_info") as get_user_info:
+            user_info = asyncio.run(auth_dependencies.resolve_user_info(token))
+
+        assert user_info is None
+        get_user_info.assert_not_called()
+
+    def test_uncached_valid_token_is_looked_up_and_cached(self):
+        """An uncached token that verifies locally is looked up once in Cognito"""
+        token = make_token(3600)
+
+        with patch.object(auth_dependencies, "is_token_locally_valid", return_value=True), \
+                patch.object(auth_dependencies.cognito_service, "get_user_info",
+                             return_value={"username": "user123"}) as get_user_info:
+            asyncio.run(auth_dependencies.resolve_user_info(token))
+            user_info = asyncio.run(auth_dependencies.resolve_user_info(token))
+
+        assert user_info == {"username": "user123"}
+        get_user_info.assert_called_once_with(token)
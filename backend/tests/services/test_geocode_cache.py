@@ -0,0 +1,90 @@
+# backend/tests/services/test_geocode_cache.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services.geocoding import geocode_cache
+from services.geocoding.geocode_cache import (
+    geocode_cached,
+    normalize_address,
+    normalize_coordinates,
+    normalize_zip_code,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    geocode_cache.clear_local_cache()
+    yield
+    geocode_cache.clear_local_cache()
+
+
+class TestNormalization:
+    """Equivalent inputs must map to the same cache key"""
+
+    def test_address_case_and_whitespace(self):
+        assert normalize_address("  123 Main  St,\tSeattle ") == normalize_address("123 main st, seattle")
+
+    def test_zip_code_leading_zeros(self):
+        assert normalize_zip_code(" 2134 ") == "02134"
+
+    def test_coordinates_rounding(self):
+        assert normalize_coordinates(47.6062095, -122.3320708) == normalize_coordinates(47.606211, -122.332069)
+
+
+class TestGeocodeCached:
+    """Tests for the geocoding cache decorator"""
+
+    def test_repeated_lookup_is_served_from_cache(self):
+        calls = []
+
+        @geocode_cached("test", normalize_address)
+        def lookup(address):
+            calls.append(address)
+            return {"lat": 1.0, "lng": 2.0}
+
+        assert lookup("123 Main St") == {"lat": 1.0, "lng": 2.0}
+        assert lookup("123  MAIN st ") == {"lat": 1.0, "lng": 2.0}
+        assert calls == ["123 Main St"]
+
+    def test_failed_lookup_is_not_cached(self):
+        calls = []
+
+        @geocode_cached("test", normalize_address)
+        def lookup(address):
+            calls.append(address)
+            return None
+
+        assert lookup("nowhere") is None
+        assert lookup("nowhere") is None
+        assert len(calls) == 2
+
+    def test_callers_cannot_mutate_cached_result(self):
+        @geocode_cached("test", normalize_address)
+        def lookup(address):
+            return {"lat": 1.0}
+
+        lookup("somewhere")["lat"] = 99.0
+        assert lookup("somewhere") == {"lat": 1.0}
+
+    def test_concurrent_misses_share_one_upstream_call(self):
+        calls = []
+        release = threading.Event()
+
+        @geocode_cached("test", normalize_address)
+        def lookup(address):
+            calls.append(address)
+            release.wait(timeout=5)
+            return {"lat": 1.0}
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(lookup, "123 Main St") for _ in range(4)]
+            # Late threads either wait on the in-flight lookup or hit the cache it fills
+            while len(geocode_cache._inflight) == 0:
+                pass
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert results == [{"lat": 1.0}] * 4
+        assert len(calls) == 1
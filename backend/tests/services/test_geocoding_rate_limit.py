@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from services.geocoding import geocoding_service
+from services.geocoding.rate_limiter import TokenBucket
+
+
+def _response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Replace the shared HTTP session and skip real sleeps"""
+    session = MagicMock()
+    monkeypatch.setattr(geocoding_service, "_session", session)
+    monkeypatch.setattr(geocoding_service, "_rate_limiter", TokenBucket(rate=1000, capacity=1000))
+    monkeypatch.setattr(geocoding_service.time, "sleep", lambda seconds: None)
+    return session
+
+
+class TestTokenBucket:
+    """Tests for the client-side rate limiter"""
+
+    def test_burst_is_allowed_up_to_capacity(self):
+        bucket = TokenBucket(rate=1, capacity=2)
+        assert bucket.acquire(max_wait=0)
+        assert bucket.acquire(max_wait=0)
+
+    def test_acquire_gives_up_past_max_wait(self):
+        bucket = TokenBucket(rate=0.1, capacity=1)
+        assert bucket.acquire(max_wait=0)
+        # The next token is 10 seconds away
+        assert not bucket.acquire(max_wait=1)
+
+
+class TestNominatimGet:
+    """Tests for retrying throttled geocoder requests"""
+
+    def test_throttled_request_is_retried(self, session):
+        session.get.side_effect = [_response(429, {"Retry-After": "1"}), _response(200)]
+
+        response = geocoding_service._nominatim_get("https://example.test", {}, timeout=1)
+
+        assert response.status_code == 200
+        assert session.get.call_count == 2
+
+    def test_client_errors_are_not_retried(self, session):
+        session.get.return_value = _response(400)
+
+        with pytest.raises(requests.HTTPError):
+            geocoding_service._nominatim_get("https://example.test", {}, timeout=1)
+        assert session.get.call_count == 1
+
+    def test_gives_up_after_max_retries(self, session, monkeypatch):
+        monkeypatch.setattr(geocoding_service.settings, "geocoder_max_retries", 2)
+        session.get.side_effect = requests.ConnectionError("down")
+
+        with pytest.raises(requests.ConnectionError):
+            geocoding_service._nominatim_get("https://example.test", {}, timeout=1)
+        assert session.get.call_count == 3
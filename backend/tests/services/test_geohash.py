@@ -0,0 +1,26 @@
+import pytest
+
+from services.geocoding import geohash
+
+
+def test_encode_matches_reference_geohash():
+    assert geohash.encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    assert geohash.encode(57.64911, 10.40744, 4) == "u4pr"
+
+
+def test_cells_covering_includes_center_cell():
+    cells = geohash.cells_covering(47.6062, -122.3321, 25, 4)
+    assert geohash.encode(47.6062, -122.3321, 4) in cells
+    assert all(len(cell) == 4 for cell in cells)
+
+
+@pytest.mark.parametrize("lat, lng", [(47.95, -122.3321), (47.26, -122.3321), (47.6062, -121.84), (47.6062, -122.83)])
+def test_cells_covering_reaches_edge_of_radius(lat, lng):
+    # Points just inside a 25 mile radius in each direction
+    cells = geohash.cells_covering(47.6062, -122.3321, 25, 4)
+    assert geohash.encode(lat, lng, 4) in cells
+
+
+def test_cells_covering_wraps_antimeridian():
+    cells = geohash.cells_covering(0.0, 179.9, 25, 4)
+    assert geohash.encode(0.0, -179.9, 4) in cells
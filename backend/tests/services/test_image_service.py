@@ -0,0 +1,121 @@
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from core.config import settings
+from services.s3 import image_service, presign_service
+from services.s3.image_service import ImageService
+from services.s3.presign_service import PresignService
+from services.s3.s3_client import s3_client
+
+
+def _mock_client(monkeypatch, **kwargs):
+    client = MagicMock(**kwargs)
+    monkeypatch.setattr(s3_client, "_client", client)
+    return client
+
+
+class TestDeleteImages:
+    """Tests for batched image deletion"""
+
+    def test_keys_are_deleted_in_one_request(self, monkeypatch):
+        client = _mock_client(monkeypatch)
+        client.delete_objects.return_value = {
+            "Deleted": [{"Key": "images/ab/1.jpg"}],
+            "Errors": [{"Key": "images/cd/2.jpg", "Message": "Access Denied"}],
+        }
+
+        deleted, failed = ImageService.delete_images(["images/ab/1.jpg", "images/cd/2.jpg", "avatars/3.jpg"])
+
+        assert deleted == ["images/ab/1.jpg"]
+        assert failed == ["avatars/3.jpg", "images/cd/2.jpg"]
+        client.delete_objects.assert_called_once()
+        objects = client.delete_objects.call_args.kwargs["Delete"]["Objects"]
+        assert objects == [{"Key": "images/ab/1.jpg"}, {"Key": "images/cd/2.jpg"}]
+
+    def test_keys_are_chunked_at_the_request_limit(self, monkeypatch):
+        client = _mock_client(monkeypatch)
+        client.delete_objects.side_effect = lambda Bucket, Delete: {"Deleted": Delete["Objects"]}
+        keys = [f"images/00/{i}.jpg" for i in range(1001)]
+
+        deleted, failed = ImageService.delete_images(keys)
+
+        assert deleted == keys
+        assert failed == []
+        assert client.delete_objects.call_count == 2
+
+    def test_failed_request_marks_chunk_as_failed(self, monkeypatch):
+        client = _mock_client(monkeypatch)
+        client.delete_objects.side_effect = ClientError({"Error": {"Code": "SlowDown"}}, "DeleteObjects")
+
+        deleted, failed = ImageService.delete_images(["images/ab/1.jpg"])
+
+        assert deleted == []
+        assert failed == ["images/ab/1.jpg"]
+
+
+class TestPresignedGetUrlCache:
+    """Tests for reuse of presigned GET URLs"""
+
+    def test_url_is_signed_once_while_reusable(self, monkeypatch):
+        monkeypatch.setattr(presign_service, "_presigned_get_urls", presign_service.TTLCache(maxsize=10, ttl=3600))
+        client = _mock_client(monkeypatch)
+        client.generate_presigned_url.side_effect = ["https://signed/1", "https://signed/2"]
+
+        first = PresignService.generate_presigned_get_url("images/ab/1.jpg", expires_in=600)
+        second = PresignService.generate_presigned_get_url("images/ab/1.jpg", expires_in=600)
+
+        assert first == second == "https://signed/1"
+        client.generate_presigned_url.assert_called_once()
+
+    def test_url_is_resigned_once_mostly_expired(self, monkeypatch):
+        monkeypatch.setattr(presign_service, "_presigned_get_urls", presign_service.TTLCache(maxsize=10, ttl=3600))
+        client = _mock_client(monkeypatch)
+        client.generate_presigned_url.side_effect = ["https://signed/1", "https://signed/2"]
+        now = 1_000_000.0
+        monkeypatch.setattr(presign_service.time, "time", lambda: now)
+
+        PresignService.generate_presigned_get_url("images/ab/1.jpg", expires_in=600)
+        now += 600 * presign_service.PRESIGNED_GET_REUSE_FRACTION
+
+        assert PresignService.generate_presigned_get_url("images/ab/1.jpg", expires_in=600) == "https://signed/2"
+
+
+class TestCloudFrontImageUrls:
+    """Tests for CloudFront image URLs"""
+
+    def _configure(self, monkeypatch, tmp_path, key_pair_id=None):
+        monkeypatch.setattr(settings, "cloudfront_domain", "cdn.example.com")
+        monkeypatch.setattr(settings, "cloudfront_key_pair_id", key_pair_id)
+        if key_pair_id:
+            key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+            key_path = tmp_path / "cloudfront.pem"
+            key_path.write_bytes(key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption()
+            ))
+            monkeypatch.setattr(settings, "cloudfront_private_key_path", str(key_path))
+        image_service._cloudfront_signer.cache_clear()
+        image_service._signed_url.cache_clear()
+
+    def test_url_is_unsigned_without_key_pair(self, monkeypatch, tmp_path):
+        self._configure(monkeypatch, tmp_path)
+
+        assert ImageService.get_image_url("images/ab/1.jpg") == "https://cdn.example.com/images/ab/1.jpg"
+
+    def test_signed_url_is_stable_within_window(self, monkeypatch, tmp_path):
+        self._configure(monkeypatch, tmp_path, key_pair_id="K2JCJMDEHXQW5F")
+        now = 1_000_000.0
+        monkeypatch.setattr(image_service.time, "time", lambda: now)
+
+        first = ImageService.get_image_url("images/ab/1.jpg")
+        now += 60
+        second = ImageService.get_image_url("images/ab/1.jpg")
+        image_service._cloudfront_signer.cache_clear()
+
+        assert first == second
+        assert first.startswith("https://cdn.example.com/images/ab/1.jpg?Expires=")
+        assert "Key-Pair-Id=K2JCJMDEHXQW5F" in first
@@ -0,0 +1,57 @@
+# backend/tests/services/test_jwt_verifier.py
+import time
+from types import SimpleNamespace
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from services.auth.jwt_verifier import CognitoJwtVerifier
+
+PRIVATE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+CLIENT_ID = "test-client"
+
+
+@pytest.fixture
+def verifier():
+    """Verifier whose key lookup returns the test key instead of fetching the JWKS"""
+    v = CognitoJwtVerifier(region="us-east-1", user_pool_id="us-east-1_test", client_id=CLIENT_ID)
+    v._jwk_client = SimpleNamespace(
+        get_signing_key_from_jwt=lambda token: SimpleNamespace(key=PRIVATE_KEY.public_key())
+    )
+    return v
+
+
+def make_token(verifier, **overrides) -> str:
+    """Build an RS256 access token for the test pool"""
+    now = int(time.time())
+    claims = {
+        "sub": "user123",
+        "iss": verifier.issuer,
+        "client_id": CLIENT_ID,
+        "token_use": "access",
+        "iat": now,
+        "exp": now + 3600,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, PRIVATE_KEY, algorithm="RS256")
+
+
+class TestVerifyAccessToken:
+    """Tests for local access token verification"""
+
+    def test_valid_token_returns_claims(self, verifier):
+        claims = verifier.verify_access_token(make_token(verifier))
+        assert claims["sub"] == "user123"
+
+    def test_expired_token_is_rejected(self, verifier):
+        with pytest.raises(jwt.ExpiredSignatureError):
+            verifier.verify_access_token(make_token(verifier, exp=int(time.time()) - 10))
+
+    def test_id_token_is_rejected(self, verifier):
+        with pytest.raises(jwt.InvalidTokenError):
+            verifier.verify_access_token(make_token(verifier, token_use="id"))
+
+    def test_other_client_is_rejected(self, verifier):
+        with pytest.raises(jwt.InvalidTokenError):
+            verifier.verify_access_token(make_token(verifier, client_id="someone-else"))
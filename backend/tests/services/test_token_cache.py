@@ -0,0 +1,63 @@
+# backend/tests/services/test_token_cache.py
+import asyncio
+import time
+import uuid
+
+import jwt
+
+from services.auth import token_cache
+
+
+def make_token(expires_in: int) -> str:
+    """Build a unique JWT with the given lifetime"""
+    return jwt.encode({"sub": str(uuid.uuid4()), "exp": int(time.time()) + expires_in}, "secret", algorithm="HS256")
+
+
+class TestValidateWithCache:
+    """Tests for the per-token validation cache"""
+
+    def test_second_validation_is_served_from_cache(self):
+        """The remote validator only runs once for a repeated token"""
+        token = make_token(3600)
+        calls = []
+
+        def validator(t):
+            calls.append(t)
+            return {"username": "user123"}
+
+        first = asyncio.run(token_cache.validate_with_cache(token, validator))
+        second = asyncio.run(token_cache.validate_with_cache(token, validator))
+
+        assert first == second == {"username": "user123"}
+        assert len(calls) == 1
+
+    def test_failed_validation_is_not_cached(self):
+        """Invalid tokens are re-checked every time"""
+        token = make_token(3600)
+        calls = []
+
+        def validator(t):
+            calls.append(t)
+            return {}
+
+        asyncio.run(token_cache.validate_with_cache(token, validator))
+        asyncio.run(token_cache.validate_with_cache(token, validator))
+
+        assert len(calls) == 2
+
+    def test_nearly_expired_token_is_not_cached(self):
+        """Tokens inside the expiry margin are never cached"""
+        token = make_token(token_cache.TOKEN_EXPIRY_MARGIN_SECONDS - 1)
+        token_cache.store(token, {"username": "user123"})
+
+        assert token_cache.get_cached(token) is None
+
+    def test_ttl_is_capped_by_token_lifetime(self):
+        """A short-lived token gets a TTL shorter than the default"""
+        token = make_token(120)
+
+        assert token_cache._cache_ttl(token) <= 120 - token_cache.TOKEN_EXPIRY_MARGIN_SECONDS
+
+    def test_non_jwt_token_is_not_cached(self):
+        """Opaque tokens can't be checked for expiry so are never cached"""
+        assert token_cache._cache_ttl("not-a-jwt") == 0